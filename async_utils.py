@@ -0,0 +1,22 @@
+"""
+News Bot - Async Utilities
+
+Helpers shared by the modules that drive asyncio code (aiohttp fetches and
+posts) from the bot's synchronous pipeline.
+"""
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+
+
+def run_sync(coro):
+    """Run a coroutine to completion from synchronous code."""
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(coro)
+    
+    # This thread already runs an event loop (e.g. a FastAPI handler), so
+    # drive the coroutine from a helper thread instead
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        return executor.submit(asyncio.run, coro).result()
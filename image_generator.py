@@ -11,14 +11,40 @@ import logging
 import re
 import random
 import hashlib
+import tempfile
+import functools
+import asyncio
 from typing import List, Dict, Any, Optional
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from PIL import Image, ImageDraw, ImageFont, ImageFilter
 import numpy as np
 from io import BytesIO
+from urllib.parse import urlparse
+from urllib.request import url2pathname
+
+# OpenCV is optional; its SIMD resize is used when installed
+try:
+    import cv2
+except ImportError:
+    cv2 = None
+
+# simplejpeg is optional; it wraps libjpeg-turbo for faster JPEG encoding
+try:
+    import simplejpeg
+except ImportError:
+    simplejpeg = None
+
+# aiohttp is optional; it is used to prefetch many images concurrently
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None
 
 # Configure logging
 logging.basicConfig(
@@ -27,15 +53,332 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+
+@functools.lru_cache(maxsize=64)
+def _load_font(path: str, size: int):
+    """Load a TrueType font once per (path, size) and reuse the parsed object."""
+    return ImageFont.truetype(path, size)
+
+
+@functools.lru_cache(maxsize=None)
+def _discover_system_font() -> Optional[str]:
+    """Return the first common system font that exists, probing the disk once per process."""
+    common_font_paths = [
+        # Linux
+        "/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf",
+        "/usr/share/fonts/truetype/liberation/LiberationSans-Bold.ttf",
+        "/usr/share/fonts/truetype/ubuntu/Ubuntu-Bold.ttf",
+        # macOS
+        "/Library/Fonts/Arial.ttf",
+        "/Library/Fonts/Helvetica.ttf",
+        # Windows
+        "C:\\Windows\\Fonts\\arial.ttf",
+        "C:\\Windows\\Fonts\\calibri.ttf",
+    ]
+    
+    for path in common_font_paths:
+        if os.path.exists(path):
+            logger.info(f"Using system font: {path}")
+            return path
+    
+    logger.warning("No system font found. Text rendering may be limited.")
+    return None
+
+
+@functools.lru_cache(maxsize=1024)
+def _text_length(font, text: str) -> float:
+    """Measure rendered text width, cached since summaries repeat many words."""
+    return font.getlength(text)
+
+
+@functools.lru_cache(maxsize=32)
+def _gradient(width: int, height: int, color1: tuple, color2: tuple) -> Image.Image:
+    """
+    Build a vertical gradient from color2 (top) to color1 (bottom).
+    
+    The result is cached and shared, so callers must copy it before drawing.
+    """
+    # Blend factor per row (0 at the top, approaching 1 at the bottom)
+    t = (np.arange(height, dtype=np.float32) / height)[:, None]
+    rows = ((1 - t) * np.array(color2, dtype=np.float32) +
+            t * np.array(color1, dtype=np.float32)).astype(np.uint8)
+    
+    # Broadcast the single column of row colors across the full width
+    arr = np.ascontiguousarray(np.broadcast_to(rows[:, None, :], (height, width, 3)))
+    return Image.fromarray(arr, 'RGB')
+
+
+def _resize_image(img: Image.Image, size) -> Image.Image:
+    """
+    Resize an image to the given (width, height).
+    
+    Uses OpenCV when available (area interpolation for downscaling,
+    Lanczos for upscaling), otherwise falls back to PIL's Lanczos filter.
+    """
+    if cv2 is None:
+        return img.resize(size, Image.LANCZOS)
+    
+    arr = np.asarray(img.convert('RGB'))
+    downscale = size[0] < img.width or size[1] < img.height
+    interpolation = cv2.INTER_AREA if downscale else cv2.INTER_LANCZOS4
+    return Image.fromarray(cv2.resize(arr, size, interpolation=interpolation))
+
+
+def _save_image(img: Image.Image, path: str):
+    """
+    Encode an RGB image to PNG or JPEG based on the file extension.
+    
+    JPEG goes through simplejpeg and PNG through OpenCV when installed,
+    falling back to PIL. PNG uses compression level 3, which encodes
+    roughly twice as fast as the default for slightly larger files.
+    """
+    if img.mode != 'RGB':
+        img = img.convert('RGB')
+    is_jpeg = os.path.splitext(path)[1].lower() in (".jpg", ".jpeg")
+    
+    if is_jpeg and simplejpeg is not None:
+        with open(path, "wb") as f:
+            f.write(simplejpeg.encode_jpeg(np.ascontiguousarray(np.asarray(img)), quality=85))
+    elif cv2 is not None:
+        arr = cv2.cvtColor(np.asarray(img), cv2.COLOR_RGB2BGR)
+        params = [cv2.IMWRITE_JPEG_QUALITY, 85] if is_jpeg else [cv2.IMWRITE_PNG_COMPRESSION, 3]
+        if not cv2.imwrite(path, arr, params):
+            raise OSError(f"Could not write image to {path}")
+    elif is_jpeg:
+        img.save(path, "JPEG", quality=85)
+    else:
+        img.save(path, "PNG", compress_level=3)
+
+
 class ImageGenerator(ABC):
     """Abstract base class for image generators."""
     
+    # HTTP session shared by all generators so keep-alive connections are reused
+    _session = None
+    
     def __init__(self, config: Dict[str, Any]):
         self.config = config
         self.output_dir = config.get("output_dir", "images")
         
         # Create output directory if it doesn't exist
         os.makedirs(self.output_dir, exist_ok=True)
+        
+        # Downloaded images are cached on disk, keyed by a hash of their URL
+        self.cache_dir = config.get("cache_dir", os.path.join(self.output_dir, ".cache"))
+        self.cache_max_bytes = int(config.get("cache_max_mb", 200) * 1024 * 1024)
+        
+        # Refuse to download images larger than this
+        self.max_download_bytes = int(config.get("max_download_mb", 20) * 1024 * 1024)
+        os.makedirs(self.cache_dir, exist_ok=True)
+        
+        # Image URLs come from scraped pages, so local files are only read
+        # from the bot's own directories and any listed in the config
+        self.local_image_dirs = [
+            os.path.realpath(path)
+            for path in [self.output_dir, self.cache_dir] + list(config.get("local_image_dirs", []))
+        ]
+        
+        if ImageGenerator._session is None:
+            ImageGenerator._session = self._create_session()
+    
+    @staticmethod
+    def _create_session() -> requests.Session:
+        """Create a pooled HTTP session with retries for transient errors."""
+        session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=16,
+            pool_maxsize=32,
+            max_retries=Retry(total=2, backoff_factor=0.2, status_forcelist=[502, 503, 504])
+        )
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        return session
+    
+    def _fetch_cached(self, url: str) -> bytes:
+        """
+        Fetch the bytes at a URL, consulting the on-disk cache first.
+        
+        Local paths and file:// URLs are read directly without any HTTP call,
+        but only inside local_image_dirs; anything else that is not HTTP(S)
+        is refused.
+        
+        Args:
+            url: URL to download
+            
+        Returns:
+            Response body as bytes
+        """
+        local_path = self._local_path(url)
+        if local_path:
+            with open(local_path, "rb") as f:
+                return f.read()
+        if urlparse(url).scheme not in ("http", "https"):
+            raise ValueError(f"Refusing to load image from {url}")
+        
+        cache_path = self._cache_path(url)
+        
+        try:
+            with open(cache_path, "rb") as f:
+                content = f.read()
+            # Refresh mtime so eviction treats this entry as recently used
+            os.utime(cache_path)
+            return content
+        except OSError:
+            pass
+        
+        with self._session.get(url, timeout=(3, 10), stream=True) as response:
+            response.raise_for_status()
+            
+            content_length = int(response.headers.get("content-length") or 0)
+            if content_length > self.max_download_bytes:
+                raise ValueError(f"Image too large ({content_length} bytes): {url}")
+            
+            # Read in chunks so an oversized body is rejected without buffering it all
+            chunks = []
+            received = 0
+            for chunk in response.iter_content(chunk_size=64 * 1024):
+                received += len(chunk)
+                if received > self.max_download_bytes:
+                    raise ValueError(f"Image exceeds {self.max_download_bytes} bytes: {url}")
+                chunks.append(chunk)
+            content = b"".join(chunks)
+        
+        self._store_in_cache(url, content)
+        return content
+    
+    def _cache_path(self, url: str) -> str:
+        """Return the cache file path for a URL."""
+        return os.path.join(self.cache_dir, hashlib.sha1(url.encode()).hexdigest())
+    
+    def _store_in_cache(self, url: str, content: bytes):
+        """Write downloaded bytes to the cache atomically."""
+        # Write to a temp file first so concurrent readers never see a partial file
+        try:
+            fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+            with os.fdopen(fd, "wb") as f:
+                f.write(content)
+            os.replace(tmp_path, self._cache_path(url))
+            self._evict_cache()
+        except OSError as e:
+            logger.warning(f"Could not cache image from {url}: {e}")
+    
+    def prefetch(self, urls: List[str]):
+        """
+        Download many images into the cache concurrently.
+        
+        Uses aiohttp when installed, otherwise a thread pool over the shared
+        session. Failures are logged and left for the regular fetch path.
+        
+        Args:
+            urls: Image URLs to warm the cache with
+        """
+        pending = list(dict.fromkeys(
+            url for url in urls
+            if urlparse(url).scheme in ("http", "https") and not os.path.exists(self._cache_path(url))
+        ))
+        if not pending:
+            return
+        
+        if aiohttp is not None:
+            try:
+                asyncio.get_running_loop()
+            except RuntimeError:
+                # No event loop in this thread, so we can run our own
+                asyncio.run(self._prefetch_async(pending))
+                return
+        
+        with ThreadPoolExecutor(max_workers=min(16, len(pending))) as executor:
+            for url, future in zip(pending, [executor.submit(self._fetch_cached, u) for u in pending]):
+                try:
+                    future.result()
+                except Exception as e:
+                    logger.warning(f"Error prefetching image {url}: {e}")
+    
+    async def _prefetch_async(self, urls: List[str]):
+        """Fetch all URLs on one event loop and store the results in the cache."""
+        timeout = aiohttp.ClientTimeout(sock_connect=3, sock_read=10)
+        connector = aiohttp.TCPConnector(limit=64)
+        
+        async with aiohttp.ClientSession(connector=connector, timeout=timeout) as session:
+            async def fetch(url):
+                async with session.get(url) as response:
+                    response.raise_for_status()
+                    if (response.content_length or 0) > self.max_download_bytes:
+                        raise ValueError(f"Image too large ({response.content_length} bytes): {url}")
+                    chunks, total = [], 0
+                    async for chunk in response.content.iter_chunked(64 * 1024):
+                        total += len(chunk)
+                        if total > self.max_download_bytes:
+                            raise ValueError(f"Image exceeds {self.max_download_bytes} bytes: {url}")
+                        chunks.append(chunk)
+                    return b"".join(chunks)
+            
+            results = await asyncio.gather(*[fetch(url) for url in urls], return_exceptions=True)
+        
+        for url, result in zip(urls, results):
+            if isinstance(result, Exception):
+                logger.warning(f"Error prefetching image {url}: {result}")
+            else:
+                self._store_in_cache(url, result)
+    
+    def _local_path(self, url: str) -> str:
+        """Return the filesystem path if the URL refers to a file in local_image_dirs, else ""."""
+        parsed = urlparse(url)
+        if parsed.scheme == "file":
+            path = url2pathname(parsed.path)
+        elif parsed.scheme not in ("http", "https"):
+            path = url
+        else:
+            return ""
+        
+        # Resolve symlinks and ".." before checking the path is inside an allowed directory
+        real_path = os.path.realpath(path)
+        if os.path.isfile(real_path) and any(
+                os.path.commonpath([real_path, directory]) == directory for directory in self.local_image_dirs):
+            return real_path
+        return ""
+    
+    def _open_image(self, url: str, size) -> Image.Image:
+        """
+        Download (or load from cache) and decode an image.
+        
+        For JPEGs the decoder is asked to scale down during decoding to the
+        smallest resolution that still covers the target size.
+        
+        Args:
+            url: URL of the image
+            size: (width, height) the image will be resized to
+            
+        Returns:
+            Loaded PIL image
+        """
+        img = Image.open(BytesIO(self._fetch_cached(url)))
+        img.draft('RGB', size)
+        img.load()
+        return img
+    
+    def _evict_cache(self):
+        """Remove least recently used cache entries until under the size limit."""
+        entries = []
+        total_size = 0
+        
+        for entry in os.scandir(self.cache_dir):
+            if entry.is_file() and not entry.name.endswith(".tmp"):
+                stat = entry.stat()
+                entries.append((stat.st_mtime, stat.st_size, entry.path))
+                total_size += stat.st_size
+        
+        if total_size <= self.cache_max_bytes:
+            return
+        
+        for _, size, path in sorted(entries):
+            try:
+                os.remove(path)
+                total_size -= size
+            except OSError:
+                continue
+            if total_size <= self.cache_max_bytes:
+                break
     
     @abstractmethod
     def generate(self, topic: str, text: str = "", image_url: str = "") -> str:
@@ -75,67 +418,96 @@ class SimpleImageGenerator(ImageGenerator):
             (146, 43, 33),   # Dark red
         ])
         
+        # Pair each color with its darker shade for the gradient, once;
+        # tuples so config colors loaded from JSON work as gradient cache keys
+        self.background_color_pairs = [
+            (tuple(c), (max(0, c[0] - 40), max(0, c[1] - 40), max(0, c[2] - 40)))
+            for c in self.background_colors
+        ]
+        
         # Try to find a system font if none specified
         if not self.font_path or not os.path.exists(self.font_path):
             self._find_system_font()
+        
+        # Font sizes only depend on the image height
+        self.title_font_size = self.height // 10
+        self.body_font_size = self.height // 20
+        
+        # Preload fonts so the first generated image doesn't pay the parse cost
+        if self.font_path:
+            try:
+                _load_font(self.font_path, self.title_font_size)
+                _load_font(self.font_path, self.body_font_size)
+            except Exception as e:
+                logger.error(f"Error loading font: {e}")
     
     def _find_system_font(self):
         """Find a suitable system font."""
-        common_font_paths = [
-            # Linux
-            "/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf",
-            "/usr/share/fonts/truetype/liberation/LiberationSans-Bold.ttf",
-            "/usr/share/fonts/truetype/ubuntu/Ubuntu-Bold.ttf",
-            # macOS
-            "/Library/Fonts/Arial.ttf",
-            "/Library/Fonts/Helvetica.ttf",
-            # Windows
-            "C:\\Windows\\Fonts\\arial.ttf",
-            "C:\\Windows\\Fonts\\calibri.ttf",
-        ]
-        
-        for path in common_font_paths:
-            if os.path.exists(path):
-                self.font_path = path
-                logger.info(f"Using system font: {path}")
-                return
-        
-        logger.warning("No system font found. Text rendering may be limited.")
-        self.font_path = None
+        self.font_path = _discover_system_font()
     
     def _create_gradient_background(self, width, height, color1, color2):
         """Create a gradient background."""
-        base = Image.new('RGB', (width, height), color1)
-        top = Image.new('RGB', (width, height), color2)
-        mask = Image.new('L', (width, height))
-        mask_data = []
-        
-        for y in range(height):
-            mask_data.extend([int(255 * (y / height))] * width)
+        # Colors may come from JSON config as lists; the cache needs tuples
+        return _gradient(width, height, tuple(color1), tuple(color2)).copy()
+    
+    def _darken(self, image, opacity=0.3):
+        """Darken the image (like a black overlay) to make text more readable."""
+        if image.mode != 'RGB':
+            image = image.convert('RGB')
+        arr = np.asarray(image)
+        if cv2 is not None:
+            return Image.fromarray(cv2.convertScaleAbs(arr, alpha=1 - opacity), 'RGB')
         
-        mask.putdata(mask_data)
-        return Image.composite(base, top, mask)
+        # Fixed-point scale by k/256; 255 * 256 still fits in uint16
+        k = round((1 - opacity) * 256)
+        scaled = arr.astype(np.uint16)
+        scaled *= k
+        scaled >>= 8
+        return Image.fromarray(scaled.astype(np.uint8), 'RGB')
     
-    def _add_overlay(self, image, opacity=0.3):
-        """Add a semi-transparent overlay to make text more readable."""
-        overlay = Image.new('RGBA', image.size, (0, 0, 0, int(255 * opacity)))
-        return Image.alpha_composite(image.convert('RGBA'), overlay)
+    def _load_reference_background(self, image_url):
+        """Load a reference image resized to the canvas and blurred."""
+        size = (self.width, self.height)
+        
+        if cv2 is not None:
+            # Decode, resize and blur on a single NumPy buffer
+            arr = cv2.imdecode(np.frombuffer(self._fetch_cached(image_url), np.uint8), cv2.IMREAD_COLOR)
+            if arr is not None:
+                downscale = size[0] < arr.shape[1] or size[1] < arr.shape[0]
+                arr = cv2.resize(arr, size, interpolation=cv2.INTER_AREA if downscale else cv2.INTER_LANCZOS4)
+                arr = cv2.GaussianBlur(arr, (0, 0), sigmaX=3)
+                return Image.fromarray(cv2.cvtColor(arr, cv2.COLOR_BGR2RGB))
+        
+        # No OpenCV, or a format it can't decode (e.g. GIF)
+        img = self._open_image(image_url, size)
+        # Resize to target dimensions
+        img = _resize_image(img, size)
+        # Convert to RGB if needed
+        if img.mode != 'RGB':
+            img = img.convert('RGB')
+        # Apply blur for aesthetic effect
+        return img.filter(ImageFilter.GaussianBlur(radius=3))
     
     def _wrap_text(self, text, font, max_width):
         """Wrap text to fit within max_width."""
-        words = text.split()
+        space_width = _text_length(font, ' ')
         lines = []
         current_line = []
+        current_width = 0
         
-        for word in words:
-            test_line = ' '.join(current_line + [word])
-            width = font.getlength(test_line)
+        for word in text.split():
+            word_width = _text_length(font, word)
             
-            if width <= max_width:
+            if not current_line:
+                current_line.append(word)
+                current_width = word_width
+            elif current_width + space_width + word_width <= max_width:
                 current_line.append(word)
+                current_width += space_width + word_width
             else:
                 lines.append(' '.join(current_line))
                 current_line = [word]
+                current_width = word_width
         
         if current_line:
             lines.append(' '.join(current_line))
@@ -160,25 +532,14 @@ class SimpleImageGenerator(ImageGenerator):
                 text = topic
             
             # Create a unique filename based on content
-            content_hash = hashlib.md5(f"{topic}_{text}_{datetime.now()}".encode()).hexdigest()[:10]
+            content_hash = hashlib.blake2b(f"{topic}_{text}_{datetime.now()}".encode(), digest_size=5).hexdigest()
             filename = f"{content_hash}.png"
             output_path = os.path.join(self.output_dir, filename)
             
             # Try to use a reference image if provided
             if image_url:
                 try:
-                    response = requests.get(image_url, timeout=10)
-                    if response.status_code == 200:
-                        img = Image.open(BytesIO(response.content))
-                        # Resize to target dimensions
-                        img = img.resize((self.width, self.height), Image.LANCZOS)
-                        # Convert to RGB if needed
-                        if img.mode != 'RGB':
-                            img = img.convert('RGB')
-                        # Apply blur for aesthetic effect
-                        img = img.filter(ImageFilter.GaussianBlur(radius=3))
-                    else:
-                        raise Exception(f"Failed to download image: {response.status_code}")
+                    img = self._load_reference_background(image_url)
                 except Exception as e:
                     logger.error(f"Error using reference image: {e}")
                     img = None
@@ -187,13 +548,11 @@ class SimpleImageGenerator(ImageGenerator):
             
             # If no image could be loaded, create a gradient background
             if not img:
-                color1 = random.choice(self.background_colors)
-                color2 = (max(0, color1[0] - 40), max(0, color1[1] - 40), max(0, color1[2] - 40))
+                color1, color2 = random.choice(self.background_color_pairs)
                 img = self._create_gradient_background(self.width, self.height, color1, color2)
             
-            # Add overlay to make text more readable
-            img = self._add_overlay(img)
-            img = img.convert('RGB')  # Convert back to RGB for saving
+            # Darken the background to make text more readable
+            img = self._darken(img)
             
             # Add text
             draw = ImageDraw.Draw(img)
@@ -202,12 +561,10 @@ class SimpleImageGenerator(ImageGenerator):
             if self.font_path:
                 try:
                     # Title font (larger)
-                    title_font_size = self.height // 10
-                    title_font = ImageFont.truetype(self.font_path, title_font_size)
+                    title_font = _load_font(self.font_path, self.title_font_size)
                     
                     # Body font (smaller)
-                    body_font_size = self.height // 20
-                    body_font = ImageFont.truetype(self.font_path, body_font_size)
+                    body_font = _load_font(self.font_path, self.body_font_size)
                 except Exception as e:
                     logger.error(f"Error loading font: {e}")
                     title_font = ImageFont.load_default()
@@ -216,37 +573,26 @@ class SimpleImageGenerator(ImageGenerator):
                 title_font = ImageFont.load_default()
                 body_font = ImageFont.load_default()
             
-            # Draw title (topic)
-            title_lines = self._wrap_text(topic, title_font, self.width - 100)
-            title_height = len(title_lines) * (title_font.getbbox("Ay")[3] + 10)
-            
-            y_position = (self.height - title_height) // 3
-            for line in title_lines:
-                text_width = title_font.getlength(line)
-                position = ((self.width - text_width) // 2, y_position)
-                # Draw text shadow
-                draw.text((position[0] + 2, position[1] + 2), line, font=title_font, fill=(0, 0, 0))
-                # Draw text
-                draw.text(position, line, font=title_font, fill=(255, 255, 255))
-                y_position += title_font.getbbox("Ay")[3] + 10
+            # Draw title (topic) as one centered block with a black outline
+            title_block = "\n".join(self._wrap_text(topic, title_font, self.width - 100))
+            left, top, right, bottom = draw.multiline_textbbox(
+                (0, 0), title_block, font=title_font, spacing=10, align='center', stroke_width=2)
+            position = ((self.width - (right - left)) // 2 - left, (self.height - (bottom - top)) // 3 - top)
+            draw.multiline_text(position, title_block, font=title_font, fill=(255, 255, 255),
+                                spacing=10, align='center', stroke_width=2, stroke_fill=(0, 0, 0))
             
             # Draw body text if different from topic
             if text != topic:
-                body_lines = self._wrap_text(text[:200] + "..." if len(text) > 200 else text, 
-                                           body_font, self.width - 150)
-                
-                y_position = self.height - (len(body_lines) * (body_font.getbbox("Ay")[3] + 5)) - 50
-                for line in body_lines:
-                    text_width = body_font.getlength(line)
-                    position = ((self.width - text_width) // 2, y_position)
-                    # Draw text shadow
-                    draw.text((position[0] + 1, position[1] + 1), line, font=body_font, fill=(0, 0, 0))
-                    # Draw text
-                    draw.text(position, line, font=body_font, fill=(220, 220, 220))
-                    y_position += body_font.getbbox("Ay")[3] + 5
+                body_block = "\n".join(self._wrap_text(text[:200] + "..." if len(text) > 200 else text,
+                                                       body_font, self.width - 150))
+                left, top, right, bottom = draw.multiline_textbbox(
+                    (0, 0), body_block, font=body_font, spacing=5, align='center', stroke_width=1)
+                position = ((self.width - (right - left)) // 2 - left, self.height - (bottom - top) - 50 - top)
+                draw.multiline_text(position, body_block, font=body_font, fill=(220, 220, 220),
+                                    spacing=5, align='center', stroke_width=1, stroke_fill=(0, 0, 0))
             
             # Save the image
-            img.save(output_path, "PNG")
+            _save_image(img, output_path)
             logger.info(f"Generated image saved to {output_path}")
             
             return output_path
@@ -266,6 +612,33 @@ class StockImageGenerator(ImageGenerator):
         self.api_key = config.get("api_key", "")
         self.search_url = config.get("search_url", "https://pixabay.com/api/")
         self.fallback_generator = SimpleImageGenerator(config)
+        
+        # Stock API search results by search term, reused for the generator's lifetime
+        self._search_cache: Dict[str, Dict[str, Any]] = {}
+    
+    def _save_resized_with_cv2(self, image_url: str, output_path: str, max_size) -> bool:
+        """
+        Fit an image within max_size and save it as JPEG entirely in OpenCV.
+        
+        Returns:
+            False if OpenCV is unavailable or can't decode the image
+        """
+        if cv2 is None:
+            return False
+        
+        arr = cv2.imdecode(np.frombuffer(self._fetch_cached(image_url), np.uint8), cv2.IMREAD_COLOR)
+        if arr is None:
+            return False
+        
+        height, width = arr.shape[:2]
+        if width > max_size[0] or height > max_size[1]:
+            scale = min(max_size[0] / width, max_size[1] / height)
+            arr = cv2.resize(arr, (max(1, round(width * scale)), max(1, round(height * scale))),
+                             interpolation=cv2.INTER_AREA)
+        
+        if not cv2.imwrite(output_path, arr, [cv2.IMWRITE_JPEG_QUALITY, 85]):
+            raise OSError(f"Could not write image to {output_path}")
+        return True
     
     def generate(self, topic: str, text: str = "", image_url: str = "") -> str:
         """
@@ -283,23 +656,22 @@ class StockImageGenerator(ImageGenerator):
         if image_url:
             try:
                 # Create a unique filename
-                content_hash = hashlib.md5(f"{topic}_{image_url}".encode()).hexdigest()[:10]
+                content_hash = hashlib.blake2b(f"{topic}_{image_url}".encode(), digest_size=5).hexdigest()
                 filename = f"{content_hash}.jpg"
                 output_path = os.path.join(self.output_dir, filename)
                 
                 # Download the image
-                response = requests.get(image_url, timeout=10)
-                if response.status_code == 200:
-                    img = Image.open(BytesIO(response.content))
+                if not self._save_resized_with_cv2(image_url, output_path, (1200, 630)):
+                    img = self._open_image(image_url, (1200, 630))
                     # Resize if needed
                     if img.width > 1200 or img.height > 630:
-                        img.thumbnail((1200, 630), Image.LANCZOS)
+                        scale = min(1200 / img.width, 630 / img.height)
+                        img = _resize_image(img, (max(1, round(img.width * scale)),
+                                                  max(1, round(img.height * scale))))
                     # Save the image
-                    img.save(output_path)
-                    logger.info(f"Downloaded image saved to {output_path}")
-                    return output_path
-                else:
-                    logger.warning(f"Failed to download image: {response.status_code}")
+                    _save_image(img, output_path)
+                logger.info(f"Downloaded image saved to {output_path}")
+                return output_path
             except Exception as e:
                 logger.error(f"Error downloading image: {e}")
         
@@ -319,27 +691,29 @@ class StockImageGenerator(ImageGenerator):
                 "per_page": 5
             }
             
-            response = requests.get(self.search_url, params=params)
-            data = response.json()
+            data = self._search_cache.get(search_term)
+            if data is None:
+                response = self._session.get(self.search_url, params=params, timeout=(3, 10))
+                data = response.json() if response.status_code == 200 else {}
+                if data.get("hits"):
+                    self._search_cache[search_term] = data
             
-            if response.status_code == 200 and data.get("hits"):
+            if data.get("hits"):
                 # Get the first image
                 image_data = data["hits"][0]
                 image_url = image_data.get("webformatURL")
                 
                 if image_url:
                     # Create a unique filename
-                    content_hash = hashlib.md5(f"{topic}_{image_url}".encode()).hexdigest()[:10]
+                    content_hash = hashlib.blake2b(f"{topic}_{image_url}".encode(), digest_size=5).hexdigest()
                     filename = f"{content_hash}.jpg"
                     output_path = os.path.join(self.output_dir, filename)
                     
                     # Download the image
-                    img_response = requests.get(image_url)
-                    if img_response.status_code == 200:
-                        with open(output_path, "wb") as f:
-                            f.write(img_response.content)
-                        logger.info(f"Stock image saved to {output_path}")
-                        return output_path
+                    with open(output_path, "wb") as f:
+                        f.write(self._fetch_cached(image_url))
+                    logger.info(f"Stock image saved to {output_path}")
+                    return output_path
             
             # If no images found or download failed, use fallback
             logger.warning("No stock images found, using fallback generator")
@@ -389,6 +763,9 @@ class ImageManager:
         })
         
         self.generator = ImageGeneratorFactory.create_generator(generator_type, generator_config)
+        
+        # Number of items rendered concurrently (downloads and PIL work overlap)
+        self.max_workers = config.get("workers", 8)
     
     def generate_image_for_news_item(self, news_item):
         """
@@ -421,6 +798,18 @@ class ImageManager:
             logger.error(f"Error generating image for news item: {e}")
             return news_item
     
+    def prefetch_images(self, news_items):
+        """
+        Warm the image cache for all news items before any rendering starts.
+        
+        Args:
+            news_items: List of NewsItem objects
+        """
+        try:
+            self.generator.prefetch([getattr(item, 'image_url', "") for item in news_items])
+        except Exception as e:
+            logger.error(f"Error prefetching images: {e}")
+    
     def generate_images_for_news_items(self, news_items):
         """
         Generate images for multiple news items.
@@ -431,15 +820,28 @@ class ImageManager:
         Returns:
             List of updated NewsItem objects
         """
-        updated_items = []
+        if not news_items:
+            return []
         
-        for item in news_items:
-            try:
-                updated_item = self.generate_image_for_news_item(item)
-                updated_items.append(updated_item)
-            except Exception as e:
-                logger.error(f"Error processing news item for image: {e}")
-                updated_items.append(item)  # Keep the original item
+        # Download all reference images up front so rendering never waits on I/O
+        self.prefetch_images(news_items)
+        
+        # Keep the original items by default so failures are passed through
+        updated_items = list(news_items)
+        
+        with ThreadPoolExecutor(max_workers=max(1, self.max_workers)) as executor:
+            futures = {
+                executor.submit(self.generate_image_for_news_item, item): index
+                for index, item in enumerate(news_items)
+            }
+            
+            # Collect in completion order, but store by original position
+            for future in as_completed(futures):
+                index = futures[future]
+                try:
+                    updated_items[index] = future.result()
+                except Exception as e:
+                    logger.error(f"Error processing news item for image: {e}")
         
         return updated_items
 
@@ -14,15 +14,22 @@ import sys
 import json
 import logging
 import argparse
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 from datetime import datetime
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Iterator, Tuple
 
 # Import modules
 from scraper import NewsScraperManager, NewsItem
-from processor import ContentProcessorManager
+from processor import get_default_manager
 from image_generator import ImageManager
 from poster import SocialMediaManager
 
+# orjson is optional; it speeds up saving and loading the configuration
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -37,19 +44,21 @@ logger = logging.getLogger(__name__)
 class NewsBot:
     """Main class for the News Bot."""
     
-    def __init__(self, config_path: str = None):
+    def __init__(self, config_path: str = None, debug: bool = False):
         """
         Initialize the News Bot.
         
         Args:
             config_path: Path to configuration file
+            debug: Also save intermediate (raw, processed, with images) news items
         """
         self.config = {}
         
         # Load configuration
         if config_path and os.path.exists(config_path):
-            with open(config_path, 'r') as f:
-                self.config = json.load(f)
+            with open(config_path, 'rb') as f:
+                raw = f.read()
+            self.config = orjson.loads(raw) if orjson is not None else json.loads(raw)
         else:
             # Use default configuration
             self.config = {
@@ -79,19 +88,23 @@ class NewsBot:
                 }
             }
         
+        self.debug = debug or self.config.get("debug", False)
+        
         # Create output directory
         os.makedirs(self.config.get("output_dir", "output"), exist_ok=True)
         
         # Initialize components
         self.scraper_manager = NewsScraperManager()
-        self.processor_manager = ContentProcessorManager(self.config.get("processor", {}))
+        self.processor_manager = get_default_manager(self.config.get("processor", {}))
         self.image_manager = ImageManager(self.config.get("image_generator", {}))
         self.poster_manager = SocialMediaManager()
         
         # Initialize platforms from config
-        for platform, platform_config in self.config.get("poster", {}).get("platforms", {}).items():
-            if platform_config.get("enabled", False):
-                self.poster_manager.add_poster(platform, platform_config)
+        self.poster_manager.add_posters({
+            platform: platform_config
+            for platform, platform_config in self.config.get("poster", {}).get("platforms", {}).items()
+            if platform_config.get("enabled", False)
+        })
     
     def run(self, topic: str) -> List[Dict[str, Any]]:
         """
@@ -103,6 +116,28 @@ class NewsBot:
         Returns:
             List of posting results
         """
+        results = dict(self._run_pipeline(topic))
+        return [results[index] for index in sorted(results)]
+    
+    def run_iter(self, topic: str) -> Iterator[Dict[str, Any]]:
+        """
+        Run the complete news bot pipeline for a topic, yielding results as they come.
+        
+        Each news item's posting result is yielded as soon as it has been
+        posted, so results arrive in completion order rather than in the
+        order the items were found.
+        
+        Args:
+            topic: Topic to search for
+            
+        Yields:
+            Posting result for one news item
+        """
+        for _, result in self._run_pipeline(topic):
+            yield result
+    
+    def _run_pipeline(self, topic: str) -> Iterator[Tuple[int, Dict[str, Any]]]:
+        """Run the pipeline, yielding (item index, posting result) pairs as items are posted."""
         logger.info(f"Starting news bot pipeline for topic: {topic}")
         
         # Step 1: Scrape news
@@ -111,46 +146,101 @@ class NewsBot:
         
         if not news_items:
             logger.warning(f"No news found for topic: {topic}")
-            return []
+            return
         
         logger.info(f"Found {len(news_items)} news items for topic: {topic}")
         
         # Save raw news items
         output_dir = self.config.get("output_dir", "output")
-        raw_output_file = os.path.join(output_dir, f"{topic.replace(' ', '_')}_raw.json")
-        self.scraper_manager.save_news_items(news_items, raw_output_file)
+        if self.debug:
+            raw_output_file = os.path.join(output_dir, f"{topic.replace(' ', '_')}_raw.json")
+            self.scraper_manager.save_news_items(news_items, raw_output_file)
         
         # Step 2: Process content (summarize and generate questions)
         processed_items = self.processor_manager.process_news_items(news_items)
         
         # Save processed items
-        processed_output_file = os.path.join(output_dir, f"{topic.replace(' ', '_')}_processed.json")
-        self.scraper_manager.save_news_items(processed_items, processed_output_file)
+        if self.debug:
+            processed_output_file = os.path.join(output_dir, f"{topic.replace(' ', '_')}_processed.json")
+            self.scraper_manager.save_news_items(processed_items, processed_output_file)
         
-        # Step 3: Generate images
-        items_with_images = self.image_manager.generate_images_for_news_items(processed_items)
+        # Steps 3 and 4: Generate images and post to social media.
+        # Each item is handed to the posting pool as soon as its image is
+        # ready, so posting item i overlaps image generation for later items,
+        # and each result is yielded as soon as its posting finishes.
+        self.image_manager.prefetch_images(processed_items)
         
-        # Save items with images
-        images_output_file = os.path.join(output_dir, f"{topic.replace(' ', '_')}_with_images.json")
-        self.scraper_manager.save_news_items(items_with_images, images_output_file)
-        
-        # Step 4: Post to social media
-        all_posting_results = []
-        
-        for item in items_with_images:
-            # Post to all platforms
-            posting_results = self.poster_manager.post_to_all_platforms(item)
-            all_posting_results.append({
-                "news_item": item.to_dict(),
-                "posting_results": posting_results
-            })
+        items_with_images = list(processed_items)
+        posted = set()
+        post_workers = self.config.get("poster", {}).get("workers", 1)
+        
+        # Each item's posting results are appended as soon as they are in, so
+        # the file stays complete even if the caller stops iterating early
+        posting_output_file = os.path.join(output_dir, f"{topic.replace(' ', '_')}_posting_results.jsonl")
+        
+        def record(index, future):
+            try:
+                posting_results = future.result()
+            except Exception as e:
+                logger.error(f"Error posting news item: {e}")
+                posting_results = []
+            self.poster_manager.save_posting_results(items_with_images[index], posting_results, posting_output_file)
+            posted.add(index)
+            return posting_results
+        
+        with ThreadPoolExecutor(max_workers=max(1, self.image_manager.max_workers)) as image_pool, \
+                ThreadPoolExecutor(max_workers=max(1, post_workers)) as post_pool:
+            image_futures = {
+                image_pool.submit(self.image_manager.generate_image_for_news_item, item): index
+                for index, item in enumerate(processed_items)
+            }
+            post_futures = {}
+            pending = set(image_futures)
             
-            # Save posting results
-            posting_output_file = os.path.join(output_dir, f"{topic.replace(' ', '_')}_posting_results.json")
-            self.poster_manager.save_posting_results(item, posting_results, posting_output_file)
+            try:
+                while pending:
+                    done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        if future in image_futures:
+                            index = image_futures[future]
+                            try:
+                                items_with_images[index] = future.result()
+                            except Exception as e:
+                                logger.error(f"Error generating image for news item: {e}")
+                            
+                            post_future = post_pool.submit(
+                                self.poster_manager.post_to_all_platforms, items_with_images[index]
+                            )
+                            post_futures[post_future] = index
+                            pending.add(post_future)
+                            continue
+                        
+                        index = post_futures[future]
+                        posting_results = record(index, future)
+                        yield index, {
+                            "news_item": items_with_images[index].to_dict(),
+                            "posting_results": posting_results
+                        }
+            finally:
+                if len(posted) < len(processed_items):
+                    # Stopped early: skip images not yet started, but record
+                    # the posts already handed to the posting pool
+                    for future in image_futures:
+                        future.cancel()
+                    for future, index in post_futures.items():
+                        if index not in posted:
+                            record(index, future)
+                    logger.warning(
+                        f"Pipeline for topic {topic} stopped early; "
+                        f"{len(processed_items) - len(posted)} news items were not posted"
+                    )
+        
+        # Save items with images
+        if self.debug:
+            images_output_file = os.path.join(output_dir, f"{topic.replace(' ', '_')}_with_images.json")
+            self.scraper_manager.save_news_items(items_with_images, images_output_file)
         
         logger.info(f"Completed news bot pipeline for topic: {topic}")
-        return all_posting_results
     
     def add_platform(self, platform: str, config: Dict[str, Any]):
         """
@@ -177,8 +267,12 @@ class NewsBot:
         Args:
             config_path: Path to save configuration
         """
-        with open(config_path, 'w') as f:
-            json.dump(self.config, f, indent=2)
+        if orjson is not None:
+            with open(config_path, 'wb') as f:
+                f.write(orjson.dumps(self.config, option=orjson.OPT_INDENT_2))
+        else:
+            with open(config_path, 'w') as f:
+                json.dump(self.config, f, indent=2)
         
         logger.info(f"Configuration saved to {config_path}")
 
@@ -188,6 +282,8 @@ def main():
     parser = argparse.ArgumentParser(description="News Bot - Scrape, summarize, and post news")
     parser.add_argument("--config", help="Path to configuration file")
     parser.add_argument("--topic", help="Topic to search for")
+    parser.add_argument("--debug", action="store_true",
+                        help="Save intermediate news items alongside posting results")
     
     args = parser.parse_args()
     
@@ -197,7 +293,7 @@ def main():
         return
     
     # Initialize the bot
-    bot = NewsBot(args.config)
+    bot = NewsBot(args.config, debug=args.debug)
     
     # Run the bot
     results = bot.run(args.topic)
@@ -10,17 +10,47 @@ This module contains classes for posting to various social media platforms:
 """
 
 import os
+import re
 import logging
 import json
 import time
+import random
+import asyncio
+import hashlib
+import tempfile
+import threading
+import functools
+import mimetypes
+import uuid
 from abc import ABC, abstractmethod
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple, Type
+from io import BytesIO
 from datetime import datetime
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
 import requests
+import urllib3
+from requests.adapters import HTTPAdapter
 import tweepy
 import praw
+import prawcore
 from instagrapi import Client as InstagrapiClient
+from instagrapi.exceptions import LoginRequired, PleaseWaitFewMinutes, RateLimitError
+
+from async_utils import run_sync
+
+# aiohttp is optional; webhook posts use it natively when installed
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None
+
+# orjson is optional; it speeds up payload and results serialization
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 # Configure logging
 logging.basicConfig(
@@ -29,12 +59,445 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+def _json_dumps(obj) -> bytes:
+    """Serialize to compact UTF-8 JSON, using orjson when installed."""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, separators=(',', ':'), ensure_ascii=False).encode()
+
+
+def _json_loads(data):
+    """Parse JSON from str or bytes, using orjson when installed."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+@functools.lru_cache(maxsize=512)
+def _exists_cached(path: str, time_bucket: int) -> bool:
+    return os.path.exists(path)
+
+
+def _image_exists(path: str) -> bool:
+    """os.path.exists, memoized for 5 seconds since each item is posted to every platform."""
+    return _exists_cached(path, int(time.monotonic() // 5))
+
+
+# (connect, read) timeout for every HTTP request so a stalled server can't hang a post
+_REQUEST_TIMEOUT = (5, 30)
+
+# Serializes read-modify-write of the shared auth token cache file
+_auth_cache_lock = threading.Lock()
+
+# Candidate hashtag words: whole words of 4+ letters or digits (any script)
+# starting with a letter; text is lowercased first
+_HASHTAG_RE = re.compile(r"\b[^\W\d_][^\W_]{3,}\b")
+
+# Links in the text, dropped before matching so they don't become #https tags
+_HASHTAG_URL_RE = re.compile(r"(?:[a-z][a-z0-9+.-]*://|www\.)\S*")
+
+# Common words that make useless hashtags (shorter words never match _HASHTAG_RE)
+_HASHTAG_STOPWORDS = frozenset({
+    "with", "from", "that", "this", "have", "were", "been", "your", "will", "they",
+    "their", "there", "what", "when", "which", "about", "into", "than", "said", "says",
+    "more", "also", "after", "over", "would", "could",
+})
+
+
+def _create_session() -> requests.Session:
+    """Create an HTTP session whose keep-alive connections are reused across posts."""
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=8)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+class RateLimited(Exception):
+    """Raised when a platform throttles a request or turns it away until later."""
+    
+    def __init__(self, message: str, retry_after: Optional[float] = None, status_code: int = 429):
+        super().__init__(message)
+        self.retry_after = retry_after
+        self.status_code = status_code
+
+
+# Errors worth retrying; anything else fails the post immediately. Posts
+# are not idempotent, so only errors that mean the server did not create
+# the post qualify: the platform throttled the request (429)...
+_TRANSIENT_ERRORS = (
+    RateLimited,
+    tweepy.errors.TooManyRequests,
+    prawcore.exceptions.TooManyRequests,
+    PleaseWaitFewMinutes,
+    RateLimitError,
+)
+
+# ...or refused it outright with a 503 that says when to come back. Other
+# 5xx responses (often a gateway timing out) may arrive after the post was
+# made, so they are not retried.
+_SERVER_ERRORS = (
+    tweepy.errors.TwitterServerError,
+    prawcore.exceptions.ServerError,
+)
+
+
+def _is_unavailable(status_code: int, headers) -> bool:
+    """Return True for a 503 carrying Retry-After, i.e. the server turned the request away."""
+    return status_code == 503 and bool(headers) and bool(headers.get("Retry-After"))
+
+
+# ...or the connection failed before any of the request was sent. A read
+# timeout or dropped connection may come after the post was made, so those
+# are not retried.
+_CONNECT_ERRORS = (
+    requests.ConnectTimeout,
+    urllib3.exceptions.NewConnectionError,
+) + ((aiohttp.ClientConnectorError,) if aiohttp is not None else ())
+
+
+def _is_transient(error: BaseException) -> bool:
+    """Return True if the post can be retried without risking a duplicate."""
+    if isinstance(error, _TRANSIENT_ERRORS):
+        return True
+    if isinstance(error, _SERVER_ERRORS):
+        response = getattr(error, "response", None)
+        return _is_unavailable(getattr(response, "status_code", None), getattr(response, "headers", None))
+    # Client libraries wrap connection errors (requests passes urllib3's
+    # MaxRetryError as its first argument, tweepy and prawcore raise their
+    # own exceptions from them), so walk the wrapped errors
+    seen = set()
+    while error is not None and id(error) not in seen:
+        seen.add(id(error))
+        if isinstance(error, _CONNECT_ERRORS) or isinstance(getattr(error, "reason", None), _CONNECT_ERRORS):
+            return True
+        wrapped = error.args[0] if error.args and isinstance(error.args[0], BaseException) else None
+        error = getattr(error, "original_exception", None) or wrapped or error.__cause__ or error.__context__
+    return False
+
+
+# Errors that mean "slow down", as opposed to a server or network hiccup
+_THROTTLE_ERRORS = (
+    tweepy.errors.TooManyRequests,
+    prawcore.exceptions.TooManyRequests,
+    PleaseWaitFewMinutes,
+    RateLimitError,
+)
+
+
+def _is_throttle(error: Exception) -> bool:
+    """Return True if the error is the platform rate-limiting us."""
+    if isinstance(error, RateLimited):
+        return error.status_code == 429
+    return isinstance(error, _THROTTLE_ERRORS)
+
+
+class TokenBucket:
+    """
+    Client-side rate limiter that paces requests under a platform's quota.
+    
+    Allows bursts of up to ``capacity`` requests, refilled at
+    ``refill_per_sec``. Each 429 halves the effective refill rate and each
+    accepted request restores it gradually, so pacing adapts to the limit
+    the server actually enforces. Uses monotonic time and no threads.
+    """
+    
+    def __init__(self, capacity: float = 10, refill_per_sec: float = 0.3):
+        self.capacity = float(capacity)
+        self.refill_per_sec = float(refill_per_sec)
+        self.rate = self.refill_per_sec
+        self.tokens = self.capacity
+        self.accepted = 0
+        self.throttled = 0
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+    
+    def try_acquire(self) -> float:
+        """
+        Take a token if one is available.
+        
+        Returns:
+            0 if a token was taken, otherwise the seconds until one will be
+        """
+        with self._lock:
+            now = time.monotonic()
+            self.tokens = min(self.capacity, self.tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            
+            if self.tokens >= 1:
+                self.tokens -= 1
+                return 0.0
+            return (1 - self.tokens) / self.rate
+    
+    def acquire(self):
+        """Block until a token is available and take it."""
+        wait = self.try_acquire()
+        while wait:
+            time.sleep(wait)
+            wait = self.try_acquire()
+    
+    def record_success(self):
+        """Count an accepted request and recover the rate additively."""
+        with self._lock:
+            self.accepted += 1
+            self.rate = min(self.refill_per_sec, self.rate + self.refill_per_sec / 10)
+    
+    def record_throttle(self):
+        """Count a 429 and halve the rate (never below 1/16 of the configured rate)."""
+        with self._lock:
+            self.throttled += 1
+            self.rate = max(self.refill_per_sec / 16, self.rate / 2)
+    
+    def drain(self, seconds: float):
+        """Empty the bucket so no request goes out for ``seconds`` (e.g. a server's Retry-After)."""
+        with self._lock:
+            now = time.monotonic()
+            self.tokens = min(self.tokens + (now - self._updated) * self.rate, 1 - seconds * self.rate)
+            self._updated = now
+
+
+def _raise_for_throttle(status_code: int, headers):
+    """Raise RateLimited for 429 and for 503 with Retry-After; other errors are the caller's to report."""
+    if status_code == 429 or _is_unavailable(status_code, headers):
+        raise RateLimited(f"HTTP {status_code}", _retry_after_seconds(headers), status_code)
+
+
+def _retry_after_seconds(headers) -> Optional[float]:
+    """Read the server's requested wait from Retry-After or x-rate-limit-reset, if any."""
+    if not headers:
+        return None
+    try:
+        if headers.get("Retry-After"):
+            return max(0.0, float(headers["Retry-After"]))
+        if headers.get("x-rate-limit-reset"):
+            # Twitter sends the epoch second at which the window resets
+            return max(0.0, float(headers["x-rate-limit-reset"]) - time.time())
+    except (TypeError, ValueError):
+        pass
+    return None
+
+
+def _server_retry_after(error: Exception) -> Optional[float]:
+    """Return how long the server asked us to wait, if the error carries that hint."""
+    delay = getattr(error, "retry_after", None)
+    if delay is None:
+        return _retry_after_seconds(getattr(getattr(error, "response", None), "headers", None))
+    try:
+        return float(delay)
+    except (TypeError, ValueError):
+        return None
+
+
+def _retry_delay(error: Exception, attempt: int, base: float, cap: float) -> float:
+    """Delay before the next attempt: the server's hint if given, else full-jitter backoff."""
+    delay = _server_retry_after(error)
+    if delay is None:
+        delay = random.uniform(0, base * 2 ** attempt)
+    return min(cap, delay)
+
+
+def retry_with_backoff(max_attempts: int = 6, base: float = 0.5, cap: float = 60.0):
+    """
+    Retry a post method on rate limits and transient errors.
+    
+    Only errors for which _is_transient() holds are retried, since a retry
+    after the server may have made the post would publish it twice.
+    
+    Waits for the server's Retry-After when given, otherwise uses capped
+    exponential backoff with full jitter. Once attempts run out, a failed
+    result dictionary is returned like any other posting failure.
+    
+    Every attempt first takes a token from the poster's rate_limiter, and
+    the outcome is reported back to it.
+    
+    Args:
+        max_attempts: Total number of attempts
+        base: Backoff for the first retry in seconds
+        cap: Maximum wait between attempts in seconds
+    """
+    def decorator(func):
+        def give_up(self, error):
+            logger.error(f"Giving up posting to {self.platform_name} after {max_attempts} attempts: {error}")
+            return {"success": False, "message": str(error)}
+        
+        def next_delay(self, error, attempt):
+            """Report the failure and return the wait before retrying, or None to give up."""
+            limiter = getattr(self, "rate_limiter", None)
+            if limiter is not None:
+                if _is_throttle(error):
+                    limiter.record_throttle()
+                # Hold back every request to this platform, not just this retry
+                retry_after = _server_retry_after(error)
+                if retry_after:
+                    limiter.drain(min(cap, retry_after))
+            if attempt == max_attempts - 1:
+                return None
+            delay = _retry_delay(error, attempt, base, cap)
+            logger.warning(f"Posting to {self.platform_name} failed ({error}); retrying in {delay:.1f}s")
+            return delay
+        
+        def succeeded(self):
+            self._last_used = time.monotonic()
+            limiter = getattr(self, "rate_limiter", None)
+            if limiter is not None:
+                limiter.record_success()
+        
+        if asyncio.iscoroutinefunction(func):
+            @functools.wraps(func)
+            async def async_wrapper(self, *args, **kwargs):
+                self._last_used = time.monotonic()
+                limiter = getattr(self, "rate_limiter", None)
+                for attempt in range(max_attempts):
+                    while limiter is not None:
+                        wait = limiter.try_acquire()
+                        if not wait:
+                            break
+                        await asyncio.sleep(wait)
+                    try:
+                        result = await func(self, *args, **kwargs)
+                    except Exception as e:
+                        if not _is_transient(e):
+                            raise
+                        delay = next_delay(self, e, attempt)
+                        if delay is None:
+                            return give_up(self, e)
+                        await asyncio.sleep(delay)
+                    else:
+                        succeeded(self)
+                        return result
+            return async_wrapper
+        
+        @functools.wraps(func)
+        def wrapper(self, *args, **kwargs):
+            self._last_used = time.monotonic()
+            limiter = getattr(self, "rate_limiter", None)
+            for attempt in range(max_attempts):
+                if limiter is not None:
+                    limiter.acquire()
+                try:
+                    result = func(self, *args, **kwargs)
+                except Exception as e:
+                    if not _is_transient(e):
+                        raise
+                    delay = next_delay(self, e, attempt)
+                    if delay is None:
+                        return give_up(self, e)
+                    time.sleep(delay)
+                else:
+                    succeeded(self)
+                    return result
+        return wrapper
+    
+    return decorator
+
+
+class _MultipartBody:
+    """
+    Streaming multipart/form-data request body.
+    
+    requests assembles multipart bodies fully in memory; this reads files
+    in chunks as they are sent. The total length is known up front, so the
+    server gets a Content-Length and can reject an oversized upload before
+    any bytes flow. Pass it as data= with headers={"Content-Type": body.content_type}.
+    """
+    
+    def __init__(self, fields: Optional[Dict[str, str]] = None, files: Optional[List[Tuple[str, str]]] = None):
+        """
+        Args:
+            fields: Plain form fields
+            files: List of (field name, file path) pairs
+        """
+        boundary = uuid.uuid4().hex
+        self.content_type = f"multipart/form-data; boundary={boundary}"
+        self._parts = []
+        self._length = 0
+        
+        for name, value in (fields or {}).items():
+            self._add(BytesIO(
+                f'--{boundary}\r\nContent-Disposition: form-data; name="{name}"\r\n\r\n'.encode()
+                + str(value).encode() + b"\r\n"
+            ))
+        
+        try:
+            for name, path in files or []:
+                filename = os.path.basename(path).replace('"', "%22")
+                mime_type = mimetypes.guess_type(filename)[0] or "application/octet-stream"
+                self._add(BytesIO(
+                    f'--{boundary}\r\nContent-Disposition: form-data; name="{name}"; filename="{filename}"\r\n'
+                    f'Content-Type: {mime_type}\r\n\r\n'.encode()
+                ))
+                self._add(open(path, "rb"), os.path.getsize(path))
+                self._add(BytesIO(b"\r\n"))
+        except OSError:
+            self.close()
+            raise
+        
+        self._add(BytesIO(f"--{boundary}--\r\n".encode()))
+    
+    def _add(self, part, size: Optional[int] = None):
+        self._parts.append(part)
+        self._length += len(part.getvalue()) if size is None else size
+    
+    def __len__(self) -> int:
+        return self._length
+    
+    def read(self, size: int = -1) -> bytes:
+        chunks = []
+        remaining = size
+        
+        while self._parts and remaining != 0:
+            chunk = self._parts[0].read(remaining)
+            if not chunk:
+                self._parts.pop(0).close()
+                continue
+            chunks.append(chunk)
+            if remaining > 0:
+                remaining -= len(chunk)
+        
+        return b"".join(chunks)
+    
+    def close(self):
+        for part in self._parts:
+            part.close()
+        self._parts = []
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, *exc_info):
+        self.close()
+
+
 class SocialMediaPoster(ABC):
     """Abstract base class for social media posters."""
     
     def __init__(self, config: Dict[str, Any]):
         self.config = config
         self.platform_name = "Unknown"
+        
+        # Sessions are re-established once they are older than the TTL
+        self.auth_ttl = config.get("auth_ttl_seconds", 3600)
+        self.auth_cache_file = config.get("auth_cache_file", os.path.join(".cache", "auth_tokens.json"))
+        self._auth_expires_at = 0.0
+        
+        # Pace outgoing requests under the platform's quota
+        rate_limit = config.get("rate_limit", {})
+        self.rate_limiter = TokenBucket(rate_limit.get("capacity", 10), rate_limit.get("refill_per_sec", 0.3))
+        
+        # Updated by every post; used to release clients nobody is using
+        self._last_used = time.monotonic()
+    
+    def idle_seconds(self) -> float:
+        """Seconds since this poster last posted."""
+        return time.monotonic() - self._last_used
+    
+    def release_clients(self):
+        """
+        Drop API clients and pooled connections to free sockets while idle.
+        
+        They are recreated lazily by the next post.
+        """
+        pass
     
     @abstractmethod
     def authenticate(self) -> bool:
@@ -47,13 +510,17 @@ class SocialMediaPoster(ABC):
         pass
     
     @abstractmethod
-    def post(self, title: str, content: str, image_path: str = "", url: str = "") -> Dict[str, Any]:
+    def post(self, title: str, content: str, question: str = "", image_path: str = "",
+             url: str = "") -> Dict[str, Any]:
         """
         Post content to the platform.
         
+        The poster formats the raw title/content itself via format_content().
+        
         Args:
             title: Title of the post
             content: Main content of the post
+            question: Optional engagement question
             image_path: Optional path to an image to include
             url: Optional URL to include
             
@@ -62,6 +529,114 @@ class SocialMediaPoster(ABC):
         """
         pass
     
+    def _auth_valid(self) -> bool:
+        """Return True while the last successful authentication is within its TTL."""
+        return time.monotonic() < self._auth_expires_at
+    
+    def _mark_authenticated(self):
+        """Start the TTL for a fresh authentication."""
+        self._auth_expires_at = time.monotonic() + self.auth_ttl
+    
+    def _invalidate_auth(self):
+        """Forget the current session, e.g. after the platform rejected it."""
+        self._auth_expires_at = 0.0
+        self._update_auth_cache(None)
+    
+    def _auth_cache_key(self) -> str:
+        """Key for this account in the auth cache; the username is hashed, never stored."""
+        identity = getattr(self, "username", "")
+        return f"{type(self).__name__}:{hashlib.sha256(identity.encode()).hexdigest()}"
+    
+    def _load_cached_auth(self):
+        """
+        Load a persisted session token for this account.
+        
+        Returns:
+            The token if one was saved and has not expired, otherwise None
+        """
+        try:
+            with open(self.auth_cache_file, 'r') as f:
+                entry = json.load(f).get(self._auth_cache_key())
+        except (OSError, ValueError):
+            return None
+        
+        remaining = entry.get("expires_at", 0) - time.time() if entry else 0
+        if remaining <= 0:
+            return None
+        
+        self._auth_expires_at = time.monotonic() + remaining
+        return entry.get("token")
+    
+    def _save_cached_auth(self, token):
+        """Persist a session token (never the password) until its TTL runs out."""
+        self._update_auth_cache({"token": token, "expires_at": time.time() + self.auth_ttl})
+    
+    def _update_auth_cache(self, entry: Optional[Dict[str, Any]]):
+        """Set or remove (entry=None) this account's auth cache entry."""
+        key = self._auth_cache_key()
+        
+        with _auth_cache_lock:
+            try:
+                with open(self.auth_cache_file, 'r') as f:
+                    entries = json.load(f)
+            except (OSError, ValueError):
+                entries = {}
+            
+            if entry is None and key not in entries:
+                return
+            if entry is None:
+                del entries[key]
+            else:
+                entries[key] = entry
+            
+            try:
+                cache_dir = os.path.dirname(self.auth_cache_file) or "."
+                os.makedirs(cache_dir, exist_ok=True)
+                # mkstemp creates the file readable by the owner only
+                fd, tmp_path = tempfile.mkstemp(dir=cache_dir, suffix=".tmp")
+                with os.fdopen(fd, 'w') as f:
+                    json.dump(entries, f)
+                os.replace(tmp_path, self.auth_cache_file)
+            except OSError as e:
+                logger.warning(f"Could not update auth cache: {e}")
+    
+    async def post_async(self, title: str, content: str, question: str = "", image_path: str = "",
+                         url: str = "", session=None) -> Dict[str, Any]:
+        """
+        Post content without blocking the event loop.
+        
+        The default runs the synchronous post() on the loop's thread pool;
+        posters with native async I/O override this.
+        
+        Args:
+            title: Title of the post
+            content: Main content of the post
+            question: Optional engagement question
+            image_path: Optional path to an image to include
+            url: Optional URL to include
+            session: Optional shared aiohttp.ClientSession
+            
+        Returns:
+            Dictionary with post status and details
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, self.post, title, content, question, image_path, url)
+    
+    def post_many(self, items: List[Tuple[str, str, str, str, str]]) -> List[Dict[str, Any]]:
+        """
+        Post several items to the platform.
+        
+        The default posts them one at a time; posters whose API accepts
+        several items per request override this to batch them.
+        
+        Args:
+            items: List of (title, content, question, image_path, url) tuples
+            
+        Returns:
+            List of post status dictionaries, one per item
+        """
+        return [self.post(*item) for item in items]
+    
     def format_content(self, title: str, content: str, question: str = "", url: str = "") -> str:
         """
         Format content for the platform.
@@ -85,6 +660,11 @@ class SocialMediaPoster(ABC):
             formatted += f"\n\n{url}"
             
         return formatted
+    
+    @staticmethod
+    def _with_question(content: str, question: str) -> str:
+        """Append the engagement question to a body whose title and URL are sent separately."""
+        return f"{content}\n\n{question}" if question else content
 
 
 class TwitterPoster(SocialMediaPoster):
@@ -121,6 +701,7 @@ class TwitterPoster(SocialMediaPoster):
             
             # Verify credentials
             self.api.verify_credentials()
+            self._mark_authenticated()
             logger.info("Twitter authentication successful")
             return True
             
@@ -128,41 +709,37 @@ class TwitterPoster(SocialMediaPoster):
             logger.error(f"Twitter authentication failed: {e}")
             return False
     
+    def release_clients(self):
+        """Drop the tweepy client; the next post re-authenticates."""
+        self.api = None
+    
     def format_content(self, title: str, content: str, question: str = "", url: str = "") -> str:
         """Format content for Twitter."""
-        # Calculate available space
-        url_length = len(url) + 1 if url else 0
-        question_length = len(question) + 2 if question else 0
-        available_length = self.max_length - url_length - question_length
+        question_part = f"\n\n{question}" if question else ""
+        url_part = f"\n{url}" if url else ""
         
-        # Combine title and content
+        # Truncate "title: content" to the space the question and URL leave
+        available_length = self.max_length - len(question_part) - len(url_part)
         combined = f"{title}: {content}"
-        
-        # Truncate if needed
         if len(combined) > available_length:
-            combined = combined[:available_length-3] + "..."
+            combined = combined[:available_length - 3] + "..."
         
-        # Add question and URL
-        if question:
-            combined += f"\n\n{question}"
-            
-        if url:
-            combined += f"\n{url}"
-            
-        return combined
+        return f"{combined}{question_part}{url_part}"
     
-    def post(self, title: str, content: str, image_path: str = "", url: str = "") -> Dict[str, Any]:
+    @retry_with_backoff()
+    def post(self, title: str, content: str, question: str = "", image_path: str = "",
+             url: str = "") -> Dict[str, Any]:
         """Post to X (Twitter)."""
-        if not self.api:
+        if not self.api or not self._auth_valid():
             if not self.authenticate():
                 return {"success": False, "message": "Authentication failed"}
         
         try:
             # Format the content
-            formatted_content = self.format_content(title, content, "", url)
+            formatted_content = self.format_content(title, content, question, url)
             
             # Post with or without media
-            if image_path and os.path.exists(image_path):
+            if image_path and _image_exists(image_path):
                 # Upload media
                 media = self.api.media_upload(image_path)
                 media_id = media.media_id_string
@@ -190,7 +767,13 @@ class TwitterPoster(SocialMediaPoster):
                     "url": f"https://twitter.com/user/status/{status.id}"
                 }
                 
+        except tweepy.errors.Unauthorized as e:
+            self._invalidate_auth()
+            logger.error(f"Twitter rejected the credentials: {e}")
+            return {"success": False, "message": str(e)}
         except Exception as e:
+            if _is_transient(e):
+                raise
             logger.error(f"Error posting to Twitter: {e}")
             return {"success": False, "message": str(e)}
 
@@ -232,6 +815,7 @@ class RedditPoster(SocialMediaPoster):
             
             # Verify authentication
             username = self.reddit.user.me().name
+            self._mark_authenticated()
             logger.info(f"Reddit authentication successful as {username}")
             return True
             
@@ -239,54 +823,44 @@ class RedditPoster(SocialMediaPoster):
             logger.error(f"Reddit authentication failed: {e}")
             return False
     
-    def post(self, title: str, content: str, image_path: str = "", url: str = "") -> Dict[str, Any]:
+    def release_clients(self):
+        """Drop the praw client; the next post re-authenticates."""
+        self.reddit = None
+    
+    @retry_with_backoff()
+    def post(self, title: str, content: str, question: str = "", image_path: str = "",
+             url: str = "") -> Dict[str, Any]:
         """Post to Reddit."""
-        if not self.reddit:
+        if not self.reddit or not self._auth_valid():
             if not self.authenticate():
                 return {"success": False, "message": "Authentication failed"}
         
         if not self.subreddit:
             return {"success": False, "message": "No subreddit specified"}
         
+        submission = None
         try:
             subreddit = self.reddit.subreddit(self.subreddit)
             
+            # The title and link are submission fields; the comment carries the rest
+            content = self._with_question(content, question)
+            
             # Determine post type
             if url:
-                # Link post
+                # Link post, with a comment carrying the content
                 submission = subreddit.submit(
                     title=title,
                     url=url
                 )
+                return self._submitted(submission, "link", content)
                 
-                # Add a comment with the content
-                if content:
-                    submission.reply(content)
-                
-                logger.info(f"Posted link to Reddit: {submission.id}")
-                return {
-                    "success": True,
-                    "post_id": submission.id,
-                    "url": f"https://www.reddit.com{submission.permalink}"
-                }
-                
-            elif image_path and os.path.exists(image_path):
-                # Image post
+            elif image_path and _image_exists(image_path):
+                # Image post, with a comment carrying the content
                 submission = subreddit.submit_image(
                     title=title,
                     image_path=image_path
                 )
-                
-                # Add a comment with the content
-                if content:
-                    submission.reply(content)
-                
-                logger.info(f"Posted image to Reddit: {submission.id}")
-                return {
-                    "success": True,
-                    "post_id": submission.id,
-                    "url": f"https://www.reddit.com{submission.permalink}"
-                }
+                return self._submitted(submission, "image", content)
                 
             else:
                 # Text post
@@ -294,17 +868,46 @@ class RedditPoster(SocialMediaPoster):
                     title=title,
                     selftext=content
                 )
+                return self._submitted(submission, "text")
                 
-                logger.info(f"Posted text to Reddit: {submission.id}")
-                return {
-                    "success": True,
-                    "post_id": submission.id,
-                    "url": f"https://www.reddit.com{submission.permalink}"
-                }
-                
+        except (prawcore.exceptions.InvalidToken, prawcore.exceptions.OAuthException) as e:
+            self._invalidate_auth()
+            logger.error(f"Reddit rejected the session: {e}")
+            return {"success": False, "message": str(e)}
         except Exception as e:
+            # Once the submission exists, retrying post() would submit it again
+            if _is_transient(e) and submission is None:
+                raise
             logger.error(f"Error posting to Reddit: {e}")
             return {"success": False, "message": str(e)}
+    
+    def _submitted(self, submission, kind: str, comment: str = "") -> Dict[str, Any]:
+        """Build the result for a created submission, first adding the comment if there is one."""
+        logger.info(f"Posted {kind} to Reddit: {submission.id}")
+        result = {
+            "success": True,
+            "post_id": submission.id,
+            "url": f"https://www.reddit.com{submission.permalink}"
+        }
+        
+        if comment:
+            reply = self._reply(submission, comment)
+            if not reply["success"]:
+                # The submission is already live, so the post still counts as made
+                result["message"] = f"Posted without comment: {reply['message']}"
+        return result
+    
+    @retry_with_backoff()
+    def _reply(self, submission, comment: str) -> Dict[str, Any]:
+        """Comment on a submission; retried on its own so a throttled reply never resubmits."""
+        try:
+            submission.reply(comment)
+        except Exception as e:
+            if _is_transient(e):
+                raise
+            logger.error(f"Error commenting on Reddit submission {submission.id}: {e}")
+            return {"success": False, "message": str(e)}
+        return {"success": True}
 
 
 class SelfHostedForumPoster(SocialMediaPoster):
@@ -324,6 +927,9 @@ class SelfHostedForumPoster(SocialMediaPoster):
         
         # Authentication token
         self.auth_token = None
+        
+        # Auth, upload and post requests share one keep-alive connection
+        self.session = _create_session()
     
     def authenticate(self) -> bool:
         """Authenticate with the forum."""
@@ -334,6 +940,8 @@ class SelfHostedForumPoster(SocialMediaPoster):
         # If API key is provided, use it directly
         if self.api_key:
             self.auth_token = self.api_key
+            self._apply_auth()
+            self._mark_authenticated()
             logger.info("Using provided API key for forum authentication")
             return True
         
@@ -342,6 +950,14 @@ class SelfHostedForumPoster(SocialMediaPoster):
             logger.error("Missing forum credentials")
             return False
         
+        # Reuse a session saved by an earlier run if it is still fresh
+        cached_token = self._load_cached_auth()
+        if cached_token:
+            self.auth_token = cached_token
+            self._apply_auth()
+            logger.info("Reusing cached forum session")
+            return True
+        
         try:
             # Authentication endpoint depends on forum type
             if self.forum_type == "discourse":
@@ -358,7 +974,7 @@ class SelfHostedForumPoster(SocialMediaPoster):
                     "password": self.password
                 }
             
-            response = requests.post(auth_url, json=payload)
+            response = self.session.post(auth_url, json=payload, timeout=_REQUEST_TIMEOUT)
             
             if response.status_code == 200:
                 data = response.json()
@@ -370,6 +986,9 @@ class SelfHostedForumPoster(SocialMediaPoster):
                     self.auth_token = data.get("token")
                 
                 if self.auth_token:
+                    self._apply_auth()
+                    self._mark_authenticated()
+                    self._save_cached_auth(self.auth_token)
                     logger.info("Forum authentication successful")
                     return True
                 else:
@@ -383,41 +1002,47 @@ class SelfHostedForumPoster(SocialMediaPoster):
             logger.error(f"Error authenticating with forum: {e}")
             return False
     
-    def post(self, title: str, content: str, image_path: str = "", url: str = "") -> Dict[str, Any]:
+    def _auth_cache_key(self) -> str:
+        """Key the auth cache by forum as well, since usernames repeat across forums."""
+        identity = f"{self.username}@{self.forum_url}"
+        return f"{type(self).__name__}:{hashlib.sha256(identity.encode()).hexdigest()}"
+    
+    def release_clients(self):
+        """Close pooled connections; the session reconnects on the next request."""
+        self.session.close()
+    
+    def _apply_auth(self):
+        """Attach the auth token to every request made through the session."""
+        if self.forum_type == "discourse":
+            self.session.headers["X-CSRF-Token"] = self.auth_token
+            self.session.cookies.set("_t", self.auth_token)
+        else:
+            self.session.headers["Authorization"] = f"Bearer {self.auth_token}"
+    
+    @retry_with_backoff()
+    def post(self, title: str, content: str, question: str = "", image_path: str = "",
+             url: str = "") -> Dict[str, Any]:
         """Post to the forum."""
-        if not self.auth_token and not self.authenticate():
+        if not (self.auth_token and self._auth_valid()) and not self.authenticate():
             return {"success": False, "message": "Authentication failed"}
         
         try:
-            # Prepare headers
-            headers = {
-                "Content-Type": "application/json"
-            }
-            
-            # Add authentication
-            if self.forum_type == "discourse":
-                headers["X-CSRF-Token"] = self.auth_token
-                cookies = {"_t": self.auth_token}
-            else:
-                headers["Authorization"] = f"Bearer {self.auth_token}"
-                cookies = {}
-            
             # Prepare content
-            formatted_content = content
+            formatted_content = self._with_question(content, question)
             
             # Add image if available
-            if image_path and os.path.exists(image_path):
+            if image_path and _image_exists(image_path):
                 # For Discourse
                 if self.forum_type == "discourse":
                     # First upload the image
-                    with open(image_path, "rb") as img_file:
-                        files = {"file": img_file}
-                        upload_response = requests.post(
+                    with _MultipartBody(files=[("file", image_path)]) as body:
+                        upload_response = self.session.post(
                             f"{self.forum_url}/uploads.json",
-                            headers={"X-CSRF-Token": self.auth_token},
-                            cookies=cookies,
-                            files=files
+                            data=body,
+                            headers={"Content-Type": body.content_type},
+                            timeout=_REQUEST_TIMEOUT
                         )
+                        _raise_for_throttle(upload_response.status_code, upload_response.headers)
                         
                         if upload_response.status_code == 200:
                             upload_data = upload_response.json()
@@ -450,13 +1075,17 @@ class SelfHostedForumPoster(SocialMediaPoster):
                     "category_id": self.config.get("category_id", 1)
                 }
             
-            # Make the request
-            response = requests.post(
+            # Make the request (json= sets the Content-Type header)
+            response = self.session.post(
                 post_url,
-                headers=headers,
-                cookies=cookies,
-                json=payload
+                json=payload,
+                timeout=_REQUEST_TIMEOUT
             )
+            _raise_for_throttle(response.status_code, response.headers)
+            
+            if response.status_code in [401, 403]:
+                # Token expired or was revoked; the next post logs in again
+                self._invalidate_auth()
             
             if response.status_code in [200, 201]:
                 data = response.json()
@@ -473,6 +1102,8 @@ class SelfHostedForumPoster(SocialMediaPoster):
                 return {"success": False, "message": f"HTTP {response.status_code}: {response.text}"}
                 
         except Exception as e:
+            if _is_transient(e):
+                raise
             logger.error(f"Error posting to forum: {e}")
             return {"success": False, "message": str(e)}
 
@@ -496,13 +1127,19 @@ class InstagramPoster(SocialMediaPoster):
             return False
         
         try:
-            # Initialize the client
+            # Initialize the client, resuming a saved session if it is still fresh
             self.client = InstagrapiClient()
+            cached_settings = self._load_cached_auth()
+            if cached_settings:
+                self.client.set_settings(cached_settings)
             
             # Login
             login_result = self.client.login(self.username, self.password)
             
             if login_result:
+                if not cached_settings:
+                    self._mark_authenticated()
+                    self._save_cached_auth(self.client.get_settings())
                 logger.info("Instagram authentication successful")
                 return True
             else:
@@ -513,6 +1150,14 @@ class InstagramPoster(SocialMediaPoster):
             logger.error(f"Instagram authentication error: {e}")
             return False
     
+    def release_clients(self):
+        """Close the instagrapi client's connections and drop it; the next post logs in again."""
+        if self.client is not None:
+            for http_session in (getattr(self.client, "private", None), getattr(self.client, "public", None)):
+                if http_session is not None:
+                    http_session.close()
+            self.client = None
+    
     def format_content(self, title: str, content: str, question: str = "", url: str = "") -> str:
         """Format content for Instagram."""
         # Instagram captions
@@ -530,35 +1175,27 @@ class InstagramPoster(SocialMediaPoster):
     
     def _generate_hashtags(self, title: str, content: str) -> str:
         """Generate relevant hashtags from title and content."""
-        # Extract potential hashtag words
-        words = set()
-        for text in [title, content]:
-            # Split by spaces and remove punctuation
-            for word in text.split():
-                word = ''.join(c for c in word if c.isalnum())
-                if len(word) > 3:  # Only use words longer than 3 characters
-                    words.add(word.lower())
-        
-        # Select up to 10 words for hashtags
-        hashtag_words = list(words)[:10]
+        # Extract and filter potential hashtag words in one pass over the text
+        text = _HASHTAG_URL_RE.sub(" ", f"{title} {content}".lower())
+        counts = Counter(word for word in _HASHTAG_RE.findall(text) if word not in _HASHTAG_STOPWORDS)
         
-        # Format as hashtags
-        hashtags = ' '.join([f"#{word}" for word in hashtag_words])
-        
-        return hashtags
+        # Use the 10 most frequent words as hashtags (ties keep title-first order)
+        return ' '.join(f"#{word}" for word, _ in counts.most_common(10))
     
-    def post(self, title: str, content: str, image_path: str = "", url: str = "") -> Dict[str, Any]:
+    @retry_with_backoff()
+    def post(self, title: str, content: str, question: str = "", image_path: str = "",
+             url: str = "") -> Dict[str, Any]:
         """Post to Instagram."""
-        if not self.client:
+        if not self.client or not self._auth_valid():
             if not self.authenticate():
                 return {"success": False, "message": "Authentication failed"}
         
-        if not image_path or not os.path.exists(image_path):
+        if not image_path or not _image_exists(image_path):
             return {"success": False, "message": "Image is required for Instagram posts"}
         
         try:
             # Format the caption
-            caption = self.format_content(title, content)
+            caption = self.format_content(title, content, question)
             
             # Upload the photo
             media = self.client.photo_upload(
@@ -573,7 +1210,13 @@ class InstagramPoster(SocialMediaPoster):
                 "url": f"https://www.instagram.com/p/{media.code}/"
             }
                 
+        except LoginRequired as e:
+            self._invalidate_auth()
+            logger.error(f"Instagram session expired: {e}")
+            return {"success": False, "message": str(e)}
         except Exception as e:
+            if _is_transient(e):
+                raise
             logger.error(f"Error posting to Instagram: {e}")
             return {"success": False, "message": str(e)}
 
@@ -581,42 +1224,108 @@ class InstagramPoster(SocialMediaPoster):
 class DiscordPoster(SocialMediaPoster):
     def __init__(self, config):
         super().__init__(config)
+        self.platform_name = "Discord"
         self.url = config.get("webhook_url", "")
+        self.session = _create_session()
     def authenticate(self): return bool(self.url)
-    def post(self, title, content, image_path="", url=""):
-        data = {"embeds": [{"title": title, "description": content, "url": url}]}
-        if image_path: data["embeds"][0]["image"] = {"url": f"attachment://{os.path.basename(image_path)}"}
-        files = {"file": open(image_path, "rb")} if image_path else None
-        r = requests.post(self.url, data={"payload_json": json.dumps(data)}, files=files)
+    def release_clients(self): self.session.close()
+    def _embed(self, title, content, question, image_path, url):
+        embed = {"title": title, "description": self._with_question(content, question), "url": url}
+        if image_path: embed["image"] = {"url": f"attachment://{os.path.basename(image_path)}"}
+        return embed
+    def _payload(self, title, content, question, image_path, url):
+        return _json_dumps({"embeds": [self._embed(title, content, question, image_path, url)]}).decode()
+    @retry_with_backoff()
+    def post(self, title, content, question="", image_path="", url=""):
+        data = {"payload_json": self._payload(title, content, question, image_path, url)}
+        if image_path:
+            # Stream the image; the file is only open while it is being uploaded
+            with _MultipartBody(data, [("file", image_path)]) as body:
+                r = self.session.post(self.url, data=body, headers={"Content-Type": body.content_type},
+                                      timeout=_REQUEST_TIMEOUT)
+        else:
+            r = self.session.post(self.url, data=data, timeout=_REQUEST_TIMEOUT)
+        _raise_for_throttle(r.status_code, r.headers)
+        return {"success": r.status_code < 300, "message": r.text}
+    async def post_async(self, title, content, question="", image_path="", url="", session=None):
+        if session is None:
+            return await super().post_async(title, content, question, image_path, url)
+        return await self._post_aiohttp(session, title, content, question, image_path, url)
+    @retry_with_backoff()
+    async def _post_aiohttp(self, session, title, content, question, image_path, url):
+        form = aiohttp.FormData()
+        form.add_field("payload_json", self._payload(title, content, question, image_path, url))
+        fh = open(image_path, "rb") if image_path else None
+        try:
+            if fh: form.add_field("file", fh, filename=os.path.basename(image_path))
+            async with session.post(self.url, data=form) as r:
+                _raise_for_throttle(r.status, r.headers)
+                return {"success": r.status < 300, "message": await r.text()}
+        finally:
+            if fh: fh.close()
+    def post_many(self, items):
+        # A webhook message carries up to 10 embeds, so send items 10 at a time
+        results = []
+        for start in range(0, len(items), 10):
+            batch = items[start:start + 10]
+            result = self._post_batch(batch)
+            results.extend(dict(result) for _ in batch)
+        return results
+    @retry_with_backoff()
+    def _post_batch(self, batch):
+        payload = _json_dumps({"embeds": [self._embed(*item) for item in batch]}).decode()
+        files = [(f"files[{i}]", image_path) for i, (_, _, _, image_path, _) in enumerate(batch) if image_path]
+        with _MultipartBody({"payload_json": payload}, files) as body:
+            r = self.session.post(self.url, data=body, headers={"Content-Type": body.content_type},
+                                  timeout=_REQUEST_TIMEOUT)
+        _raise_for_throttle(r.status_code, r.headers)
         return {"success": r.status_code < 300, "message": r.text}
 
 class SocialMediaPosterFactory:
     """Factory for creating social media posters."""
     
-    @staticmethod
-    def create_poster(platform: str, config: Dict[str, Any]) -> SocialMediaPoster:
+    # Platform name -> poster class; extend with register()
+    _REGISTRY: Dict[str, Type[SocialMediaPoster]] = {
+        "twitter": TwitterPoster,
+        "reddit": RedditPoster,
+        "forum": SelfHostedForumPoster,
+        "instagram": InstagramPoster,
+        "discord": DiscordPoster,
+    }
+    
+    @classmethod
+    def register(cls, platform: str, poster_class: Type[SocialMediaPoster]):
+        """
+        Register a poster class for a platform name.
+        
+        Args:
+            platform: Platform name used in configuration
+            poster_class: SocialMediaPoster subclass to instantiate for it
+        """
+        cls._REGISTRY[platform] = poster_class
+    
+    @classmethod
+    def is_supported(cls, platform: str) -> bool:
+        """Return True if a poster is registered for the platform."""
+        return platform in cls._REGISTRY
+    
+    @classmethod
+    def create_poster(cls, platform: str, config: Dict[str, Any]) -> SocialMediaPoster:
         """
         Create a social media poster based on the platform.
         
         Args:
-            platform: Platform to create poster for (twitter, reddit, forum, instagram)
+            platform: Platform to create poster for (twitter, reddit, forum, instagram, discord)
             config: Configuration for the poster
             
         Returns:
             SocialMediaPoster instance
         """
-        if platform == "twitter":
-            return TwitterPoster(config)
-        elif platform == "reddit":
-            return RedditPoster(config)
-        elif platform == "forum":
-            return SelfHostedForumPoster(config)
-        elif platform == "instagram":
-            return InstagramPoster(config)
-        elif platform == "discord":
-            return DiscordPoster(config)
-        else:
-            raise ValueError(f"Unknown platform: {platform}")
+        try:
+            poster_class = cls._REGISTRY[platform]
+        except KeyError:
+            raise ValueError(f"Unknown platform: {platform}") from None
+        return poster_class(config)
 
 
 class SocialMediaManager:
@@ -626,23 +1335,99 @@ class SocialMediaManager:
         self.posters = {}
         self.config = {}
         
+        self._idle_timer = None
+        self._released = {}
+        self.max_idle_seconds = 900
+        
         if config_path and os.path.exists(config_path):
-            with open(config_path, 'r') as f:
-                self.config = json.load(f)
+            with open(config_path, 'rb') as f:
+                self.config = _json_loads(f.read())
+            
+            # Release clients of posters that haven't posted for this long
+            self.max_idle_seconds = self.config.get("max_idle_seconds", 900)
                 
             # Initialize posters from config
             self._init_posters_from_config()
     
+    def _evict_idle(self, max_idle: float = 900):
+        """
+        Release the clients of posters idle for longer than max_idle seconds.
+        
+        Args:
+            max_idle: Idle time in seconds after which clients are released
+        """
+        for platform, poster in list(self.posters.items()):
+            # Only release once per idle period
+            if poster.idle_seconds() > max_idle and self._released.get(platform) != poster._last_used:
+                self._released[platform] = poster._last_used
+                try:
+                    poster.release_clients()
+                    logger.info(f"Released idle clients for {platform}")
+                except Exception as e:
+                    logger.error(f"Error releasing clients for {platform}: {e}")
+    
+    def _schedule_idle_eviction(self):
+        """Check for idle posters periodically on a daemon timer thread."""
+        if self._idle_timer is not None or not self.max_idle_seconds:
+            return
+        
+        def run():
+            self._evict_idle(self.max_idle_seconds)
+            self._idle_timer = None
+            self._schedule_idle_eviction()
+        
+        self._idle_timer = threading.Timer(max(1.0, self.max_idle_seconds / 3), run)
+        self._idle_timer.daemon = True
+        self._idle_timer.start()
+    
     def _init_posters_from_config(self):
         """Initialize posters from configuration file."""
-        for platform, platform_config in self.config.get("platforms", {}).items():
-            if platform_config.get("enabled", False):
+        self.add_posters({
+            platform: platform_config
+            for platform, platform_config in self.config.get("platforms", {}).items()
+            if platform_config.get("enabled", False)
+        })
+    
+    def add_posters(self, platform_configs: Dict[str, Dict[str, Any]]):
+        """
+        Add posters for several platforms, constructing them concurrently.
+        
+        Client setup can involve DNS lookups and settings file I/O, so the
+        posters are built in a thread pool and then registered in the given order.
+        
+        Args:
+            platform_configs: Mapping of platform name to its configuration
+        """
+        # Reject unknown platforms before starting any construction
+        for platform in [p for p in platform_configs if not SocialMediaPosterFactory.is_supported(p)]:
+            logger.error(f"Error creating poster for {platform}: Unknown platform: {platform}")
+        platform_configs = {p: c for p, c in platform_configs.items() if SocialMediaPosterFactory.is_supported(p)}
+        
+        if not platform_configs:
+            return
+        
+        created = {}
+        with ThreadPoolExecutor(max_workers=min(8, len(platform_configs))) as executor:
+            futures = {
+                executor.submit(SocialMediaPosterFactory.create_poster, platform, config): platform
+                for platform, config in platform_configs.items()
+            }
+            
+            for future in as_completed(futures):
+                platform = futures[future]
                 try:
-                    poster = SocialMediaPosterFactory.create_poster(platform, platform_config)
-                    self.posters[platform] = poster
+                    created[platform] = future.result()
                     logger.info(f"Initialized poster for {platform}")
                 except Exception as e:
                     logger.error(f"Error creating poster for {platform}: {e}")
+        
+        # Register from this thread so self.posters keeps the config order
+        for platform in platform_configs:
+            if platform in created:
+                self.posters[platform] = created[platform]
+        
+        if created:
+            self._schedule_idle_eviction()
     
     def add_poster(self, platform: str, config: Dict[str, Any]):
         """
@@ -656,6 +1441,7 @@ class SocialMediaManager:
             poster = SocialMediaPosterFactory.create_poster(platform, config)
             self.posters[platform] = poster
             logger.info(f"Added poster for {platform}")
+            self._schedule_idle_eviction()
         except Exception as e:
             logger.error(f"Error adding poster for {platform}: {e}")
     
@@ -676,18 +1462,8 @@ class SocialMediaManager:
         poster = self.posters[platform]
         
         try:
-            # Extract required fields from news item
-            title = news_item.title if hasattr(news_item, 'title') else ""
-            content = news_item.summary if hasattr(news_item, 'summary') else ""
-            question = news_item.question if hasattr(news_item, 'question') else ""
-            url = news_item.url if hasattr(news_item, 'url') else ""
-            image_path = news_item.generated_image_path if hasattr(news_item, 'generated_image_path') else ""
-            
-            # Format content with question
-            formatted_content = poster.format_content(title, content, question, url)
-            
             # Post to the platform
-            result = poster.post(title, formatted_content, image_path, url)
+            result = poster.post(*self._post_args(poster, news_item))
             
             # Add platform info to result
             result["platform"] = platform
@@ -698,6 +1474,49 @@ class SocialMediaManager:
             logger.error(f"Error posting to {platform}: {e}")
             return {"success": False, "platform": platform, "message": str(e)}
     
+    async def post_to_platform_async(self, platform: str, news_item, session=None) -> Dict[str, Any]:
+        """
+        Post a news item to a specific platform without blocking the event loop.
+        
+        Args:
+            platform: Platform to post to
+            news_item: NewsItem object
+            session: Optional shared aiohttp.ClientSession
+            
+        Returns:
+            Dictionary with post status and details
+        """
+        if platform not in self.posters:
+            return {"success": False, "message": f"No poster configured for {platform}"}
+        
+        poster = self.posters[platform]
+        
+        try:
+            result = await poster.post_async(*self._post_args(poster, news_item), session=session)
+            result["platform"] = platform
+            return result
+            
+        except Exception as e:
+            logger.error(f"Error posting to {platform}: {e}")
+            return {"success": False, "platform": platform, "message": str(e)}
+    
+    @staticmethod
+    def _post_args(poster: SocialMediaPoster, news_item):
+        """Extract (title, content, question, image_path, url) for poster.post from a news item."""
+        # Extract required fields from news item
+        title = getattr(news_item, 'title', "") or ""
+        content = getattr(news_item, 'summary', "") or ""
+        question = getattr(news_item, 'question', "") or ""
+        url = getattr(news_item, 'url', "") or ""
+        image_path = getattr(news_item, 'generated_image_path', "") or ""
+        
+        # Check the image once here so posters can skip missing files
+        if image_path and not _image_exists(image_path):
+            image_path = ""
+        
+        # Raw fields; each poster formats them once in post()
+        return title, content, question, image_path, url
+    
     def post_to_all_platforms(self, news_item) -> List[Dict[str, Any]]:
         """
         Post a news item to all configured platforms.
@@ -708,68 +1527,162 @@ class SocialMediaManager:
         Returns:
             List of dictionaries with post status and details for each platform
         """
-        results = []
+        return run_sync(self.post_to_all_platforms_async(news_item))
+    
+    async def post_to_all_platforms_async(self, news_item) -> List[Dict[str, Any]]:
+        """
+        Post a news item to all configured platforms concurrently.
         
-        for platform in self.posters:
-            try:
-                result = self.post_to_platform(platform, news_item)
-                results.append(result)
-                
-                # Add a small delay between posts to avoid rate limiting
-                time.sleep(2)
-                
-            except Exception as e:
-                logger.error(f"Error in post_to_all_platforms for {platform}: {e}")
-                results.append({
+        Total latency is that of the slowest platform rather than the sum.
+        
+        Args:
+            news_item: NewsItem object
+            
+        Returns:
+            List of dictionaries with post status and details for each platform
+        """
+        platforms = list(self.posters)
+        session = None
+        if aiohttp is not None:
+            timeout = aiohttp.ClientTimeout(sock_connect=_REQUEST_TIMEOUT[0], sock_read=_REQUEST_TIMEOUT[1])
+            session = aiohttp.ClientSession(timeout=timeout)
+        
+        try:
+            outcomes = await asyncio.gather(
+                *[self.post_to_platform_async(platform, news_item, session) for platform in platforms],
+                return_exceptions=True
+            )
+        finally:
+            if session is not None:
+                await session.close()
+        
+        results = []
+        for platform, outcome in zip(platforms, outcomes):
+            if isinstance(outcome, Exception):
+                logger.error(f"Error in post_to_all_platforms for {platform}: {outcome}")
+                outcome = {
                     "success": False,
                     "platform": platform,
-                    "message": str(e)
-                })
+                    "message": str(outcome)
+                }
+            results.append(outcome)
+        
+        return results
+    
+    def post_many_to_platform(self, platform: str, news_items) -> List[Dict[str, Any]]:
+        """
+        Post several news items to a specific platform, batched where supported.
+        
+        Args:
+            platform: Platform to post to
+            news_items: List of NewsItem objects
+            
+        Returns:
+            List of post status dictionaries, one per news item
+        """
+        if platform not in self.posters:
+            return [{"success": False, "platform": platform, "message": f"No poster configured for {platform}"}
+                    for _ in news_items]
+        
+        poster = self.posters[platform]
+        
+        try:
+            results = poster.post_many([self._post_args(poster, item) for item in news_items])
+        except Exception as e:
+            logger.error(f"Error posting batch to {platform}: {e}")
+            results = [{"success": False, "message": str(e)} for _ in news_items]
+        
+        return [dict(result, platform=platform) for result in results]
+    
+    def post_many_to_all_platforms(self, news_items) -> List[List[Dict[str, Any]]]:
+        """
+        Post several news items to all configured platforms.
+        
+        Platforms run concurrently, and each one receives the whole batch so
+        it can coalesce items into fewer requests.
+        
+        Args:
+            news_items: List of NewsItem objects
+            
+        Returns:
+            For each news item, the list of post results for each platform
+            (the same shape as calling post_to_all_platforms per item)
+        """
+        news_items = list(news_items)
+        results = [[] for _ in news_items]
+        if not news_items or not self.posters:
+            return results
+        
+        with ThreadPoolExecutor(max_workers=len(self.posters)) as executor:
+            futures = [executor.submit(self.post_many_to_platform, platform, news_items)
+                       for platform in self.posters]
+        
+        for future in futures:
+            for item_results, result in zip(results, future.result()):
+                item_results.append(result)
         
         return results
     
     def save_posting_results(self, news_item, results: List[Dict[str, Any]], output_file: str):
         """
-        Save posting results to a JSON file.
+        Append posting results to a JSON Lines file.
         
         Args:
             news_item: NewsItem object
             results: List of posting results
             output_file: Path to output file
         """
-        # Create a record with news item details and posting results
-        record = {
+        self.save_all_posting_results([(news_item, results)], output_file)
+    
+    def save_all_posting_results(self, items_and_results, output_file: str):
+        """
+        Append posting results for many news items to a JSON Lines file.
+        
+        Each record is one line, so appending never re-reads the history.
+        
+        Args:
+            items_and_results: List of (news_item, results) pairs
+            output_file: Path to output file
+        """
+        posting_time = datetime.now().isoformat()
+        lines = [_json_dumps(self._posting_record(news_item, results, posting_time))
+                 for news_item, results in items_and_results]
+        
+        with open(output_file, 'ab') as f:
+            f.write(b"".join(line + b"\n" for line in lines))
+        
+        logger.info(f"Saved posting results to {output_file}")
+    
+    @staticmethod
+    def _posting_record(news_item, results: List[Dict[str, Any]], posting_time: str) -> Dict[str, Any]:
+        """Build the saved record for one news item and its posting results."""
+        return {
             "news_item": {
-                "title": news_item.title if hasattr(news_item, 'title') else "",
-                "url": news_item.url if hasattr(news_item, 'url') else "",
-                "summary": news_item.summary if hasattr(news_item, 'summary') else "",
-                "question": news_item.question if hasattr(news_item, 'question') else "",
-                "image_path": news_item.generated_image_path if hasattr(news_item, 'generated_image_path') else ""
+                "title": getattr(news_item, 'title', "") or "",
+                "url": getattr(news_item, 'url', "") or "",
+                "summary": getattr(news_item, 'summary', "") or "",
+                "question": getattr(news_item, 'question', "") or "",
+                "image_path": getattr(news_item, 'generated_image_path', "") or ""
             },
-            "posting_time": datetime.now().isoformat(),
+            "posting_time": posting_time,
             "results": results
         }
+
+
+def load_posting_results(path: str):
+    """
+    Iterate over the records in a posting results JSON Lines file.
+    
+    Args:
+        path: Path to the results file
         
-        # Append to existing file or create new one
-        if os.path.exists(output_file):
-            try:
-                with open(output_file, 'r') as f:
-                    data = json.load(f)
-                    
-                data.append(record)
-                
-                with open(output_file, 'w') as f:
-                    json.dump(data, f, indent=2)
-            except Exception as e:
-                logger.error(f"Error appending to existing file: {e}")
-                # Create new file as fallback
-                with open(output_file, 'w') as f:
-                    json.dump([record], f, indent=2)
-        else:
-            with open(output_file, 'w') as f:
-                json.dump([record], f, indent=2)
-        
-        logger.info(f"Saved posting results to {output_file}")
+    Yields:
+        One record dictionary per saved news item
+    """
+    with open(path, 'rb') as f:
+        for line in f:
+            if line.strip():
+                yield _json_loads(line)
 
 
 # Example usage
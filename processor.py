@@ -9,27 +9,32 @@ Each processor is implemented as a separate class with a common interface.
 """
 
 import re
+import json
 import logging
 import random
+import threading
+import functools
+import heapq
+from collections import Counter
 from typing import List, Dict, Any, Optional
 from abc import ABC, abstractmethod
 
-import nltk
-from nltk.tokenize import sent_tokenize, word_tokenize
-from nltk.corpus import stopwords
-from nltk.probability import FreqDist
-import spacy
+import numpy as np
 
-# Download required NLTK resources
-try:
-    nltk.data.find('tokenizers/punkt')
-except LookupError:
-    nltk.download('punkt')
+# NLTK and spaCy take seconds to import, so they are loaded on first use
+# by _ensure_nltk() and _ensure_spacy()
+nltk = None
+sent_tokenize = None
+word_tokenize = None
+stopwords = None
+spacy = None
 
-try:
-    nltk.data.find('corpora/stopwords')
-except LookupError:
-    nltk.download('stopwords')
+_import_lock = threading.Lock()
+
+# Components not needed by question generation or abstractive summarization.
+# They read entities, noun chunks and POS tags, so the parser, tagger,
+# attribute ruler (which sets token.pos_) and NER all stay enabled
+_ENTITY_PIPELINE_DISABLE = ("lemmatizer",)
 
 # Configure logging
 logging.basicConfig(
@@ -38,6 +43,78 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+
+def _ensure_nltk():
+    """Import NLTK and download its tokenizer and stopword data, once."""
+    global nltk, sent_tokenize, word_tokenize, stopwords
+    if nltk is not None:
+        return
+    
+    with _import_lock:
+        if nltk is not None:
+            return
+        
+        import nltk as nltk_module
+        from nltk.tokenize import sent_tokenize as nltk_sent_tokenize, word_tokenize as nltk_word_tokenize
+        from nltk.corpus import stopwords as nltk_stopwords
+        
+        # Download required NLTK resources
+        for resource, package in (('tokenizers/punkt', 'punkt'), ('corpora/stopwords', 'stopwords')):
+            try:
+                nltk_module.data.find(resource)
+            except LookupError:
+                nltk_module.download(package)
+        
+        sent_tokenize = nltk_sent_tokenize
+        word_tokenize = nltk_word_tokenize
+        stopwords = nltk_stopwords
+        nltk = nltk_module
+
+
+def _ensure_spacy():
+    """Import spaCy, once."""
+    global spacy
+    if spacy is None:
+        with _import_lock:
+            if spacy is None:
+                import spacy as spacy_module
+                spacy = spacy_module
+
+
+@functools.lru_cache(maxsize=8)
+def _stopwords(language: str) -> frozenset:
+    """Read NLTK's stopword list for a language once."""
+    _ensure_nltk()
+    return frozenset(stopwords.words(language))
+
+
+@functools.lru_cache(maxsize=4)
+def _get_nlp(disable: tuple = ()):
+    """
+    Load en_core_web_sm once per set of disabled components.
+    
+    Pipelines are shared by every processor that asks for the same
+    components. If the parser is disabled a sentencizer is added so
+    doc.sents still works.
+    
+    Args:
+        disable: Names of pipeline components to disable
+        
+    Returns:
+        spaCy Language pipeline
+    """
+    _ensure_spacy()
+    try:
+        nlp = spacy.load("en_core_web_sm", disable=list(disable))
+    except OSError:
+        logger.warning("SpaCy model not found. Downloading en_core_web_sm...")
+        spacy.cli.download("en_core_web_sm")
+        nlp = spacy.load("en_core_web_sm", disable=list(disable))
+    
+    if "parser" in disable:
+        nlp.add_pipe("sentencizer")
+    return nlp
+
 class ContentProcessor(ABC):
     """Abstract base class for content processors."""
     
@@ -68,22 +145,34 @@ class TextSummarizer(ContentProcessor):
         self.method = config.get("method", "extractive")
         self.language = config.get("language", "english")
         
-        # Load spaCy model for abstractive summarization if needed
+        # Worker processes for batched parsing; -1 uses every CPU. Off by
+        # default because spaCy's multiprocessing is not safe everywhere
+        self.n_process = config.get("n_process", 1)
+        self.batch_size = config.get("batch_size", 32)
+        
+        # Load spaCy model; extractive summarization only needs the tokenizer
+        # and a rule-based sentencizer, so the trained components are disabled
         self.nlp = None
         if self.method == "abstractive":
+            self.nlp = _get_nlp(_ENTITY_PIPELINE_DISABLE)
+        else:
             try:
-                self.nlp = spacy.load("en_core_web_sm")
-            except OSError:
-                logger.warning("SpaCy model not found. Downloading en_core_web_sm...")
-                spacy.cli.download("en_core_web_sm")
-                self.nlp = spacy.load("en_core_web_sm")
+                self.nlp = _get_nlp(("tok2vec", "tagger", "parser", "attribute_ruler", "lemmatizer", "ner"))
+            except Exception as e:
+                logger.warning(f"SpaCy unavailable ({e}). Using NLTK for extractive summarization.")
+                self.nlp = None
+        
+        # Parses text into a Doc; may be replaced by a cache shared with
+        # another processor using the same pipeline
+        self._parse = self.nlp
     
-    def process(self, text: str) -> str:
+    def process(self, text: str, doc=None) -> str:
         """
         Summarize the input text.
         
         Args:
             text: Input text to summarize
+            doc: Optional spaCy Doc already parsed from text
             
         Returns:
             Summarized text
@@ -91,24 +180,109 @@ class TextSummarizer(ContentProcessor):
         if not text:
             return ""
         
+        return self._summarize(text, doc)
+    
+    def process_texts_batch(self, texts: List[str]) -> List[str]:
+        """
+        Summarize several texts, parsing them together with nlp.pipe.
+        
+        Args:
+            texts: Input texts to summarize
+            
+        Returns:
+            Summarized texts, in input order
+        """
+        if self.nlp is None:
+            return [self.process(text) for text in texts]
+        
+        texts = [text or "" for text in texts]
+        docs = self.nlp.pipe(texts, batch_size=self.batch_size, n_process=self.n_process)
+        return [self._summarize(text, doc) if text else "" for text, doc in zip(texts, docs)]
+    
+    def _summarize(self, text: str, doc=None) -> str:
+        """Summarize text with the configured method, reusing doc if it was already parsed."""
         if self.method == "extractive":
-            return self._extractive_summarize(text)
+            return self._extractive_summarize(text, doc)
         elif self.method == "abstractive":
-            return self._abstractive_summarize(text)
+            return self._abstractive_summarize(text, doc)
         else:
             logger.warning(f"Unknown summarization method: {self.method}. Using extractive.")
-            return self._extractive_summarize(text)
+            return self._extractive_summarize(text, doc)
     
-    def _extractive_summarize(self, text: str) -> str:
+    def _extractive_summarize(self, text: str, doc=None) -> str:
         """
         Perform extractive summarization using frequency-based approach.
         
         Args:
             text: Input text to summarize
+            doc: Optional spaCy Doc already parsed from text
             
         Returns:
             Summarized text
         """
+        if self.nlp is None:
+            return self._extractive_summarize_nltk(text)
+        
+        # Split sentences and tokenize in a single spaCy pass
+        if doc is None:
+            doc = self._parse(text)
+        sentences = list(doc.sents)
+        
+        # If text is already short, return it as is
+        if len(sentences) <= self.min_sentences:
+            return text
+        
+        # Collect each sentence's words and the frequencies of non-stopwords
+        # in one pass over the tokens
+        freq_dist = Counter()
+        sentence_words = []
+        for sentence in sentences:
+            words = []
+            for token in sentence:
+                # is_alpha/is_stop are flags precomputed on the lexeme
+                if token.is_alpha:
+                    word = token.lower_
+                    words.append(word)
+                    if not token.is_stop:
+                        freq_dist[word] += 1
+            sentence_words.append(words)
+        
+        # Score sentences based on word frequencies
+        sentence_scores = {}
+        for i, words in enumerate(sentence_words):
+            # Skip very short sentences
+            if len(words) < 3:
+                continue
+            
+            # Counter returns 0 for missing words, so no membership test is needed
+            score = sum(map(freq_dist.__getitem__, words))
+            # Normalize by sentence length to avoid bias towards longer sentences
+            sentence_scores[i] = score / len(words)
+        
+        # Select top sentences
+        num_sentences = min(self.max_sentences, max(self.min_sentences, len(sentences) // 4))
+        top_indices = heapq.nlargest(num_sentences, sentence_scores, key=sentence_scores.get)
+        
+        # Arrange sentences in original order
+        top_indices.sort()
+        
+        # Construct summary
+        summary = " ".join(sentences[i].text for i in top_indices)
+        
+        return summary
+    
+    def _extractive_summarize_nltk(self, text: str) -> str:
+        """
+        Perform extractive summarization with NLTK when spaCy is unavailable.
+        
+        Args:
+            text: Input text to summarize
+            
+        Returns:
+            Summarized text
+        """
+        _ensure_nltk()
+        
         # Tokenize sentences
         sentences = sent_tokenize(text)
         
@@ -116,41 +290,42 @@ class TextSummarizer(ContentProcessor):
         if len(sentences) <= self.min_sentences:
             return text
         
-        # Tokenize words and remove stopwords
-        stop_words = set(stopwords.words(self.language))
-        words = word_tokenize(text.lower())
-        words = [word for word in words if word.isalnum() and word not in stop_words]
+        # Tokenize each sentence once; the word lists serve both the
+        # frequency counts and the sentence scores. The sentences are
+        # already split, so word_tokenize needn't split them again
+        sentence_word_lists = [
+            [word for word in word_tokenize(sentence.lower(), preserve_line=True) if word.isalnum()]
+            for sentence in sentences
+        ]
         
-        # Calculate word frequencies
-        freq_dist = FreqDist(words)
+        # Calculate frequencies of words that aren't stopwords
+        stop_words = _stopwords(self.language)
+        freq_dist = Counter(word for words in sentence_word_lists for word in words if word not in stop_words)
         
         # Score sentences based on word frequencies
         sentence_scores = {}
-        for i, sentence in enumerate(sentences):
-            sentence_words = word_tokenize(sentence.lower())
-            sentence_words = [word for word in sentence_words if word.isalnum()]
-            
+        for i, sentence_words in enumerate(sentence_word_lists):
             # Skip very short sentences
             if len(sentence_words) < 3:
                 continue
             
-            score = sum(freq_dist[word] for word in sentence_words if word in freq_dist)
+            score = sum(map(freq_dist.__getitem__, sentence_words))
             # Normalize by sentence length to avoid bias towards longer sentences
             sentence_scores[i] = score / len(sentence_words)
         
         # Select top sentences
         num_sentences = min(self.max_sentences, max(self.min_sentences, len(sentences) // 4))
-        top_indices = sorted(sentence_scores, key=sentence_scores.get, reverse=True)[:num_sentences]
+        top_indices = heapq.nlargest(num_sentences, sentence_scores, key=sentence_scores.get)
         
         # Arrange sentences in original order
-        top_indices = sorted(top_indices)
+        top_indices.sort()
         
         # Construct summary
         summary = " ".join(sentences[i] for i in top_indices)
         
         return summary
     
-    def _abstractive_summarize(self, text: str) -> str:
+    def _abstractive_summarize(self, text: str, doc=None) -> str:
         """
         Perform abstractive summarization using spaCy.
         
@@ -159,16 +334,18 @@ class TextSummarizer(ContentProcessor):
         
         Args:
             text: Input text to summarize
+            doc: Optional spaCy Doc already parsed from text
             
         Returns:
             Summarized text
         """
         if not self.nlp:
             logger.warning("SpaCy model not loaded. Falling back to extractive summarization.")
-            return self._extractive_summarize(text)
+            return self._extractive_summarize_nltk(text)
         
         # Process the text with spaCy
-        doc = self.nlp(text)
+        if doc is None:
+            doc = self._parse(text)
         
         # Extract key sentences based on entity recognition
         sentences = list(doc.sents)
@@ -176,30 +353,116 @@ class TextSummarizer(ContentProcessor):
         if len(sentences) <= self.min_sentences:
             return text
         
-        # Score sentences based on named entities and noun chunks
-        sentence_scores = {}
-        for i, sentence in enumerate(sentences):
-            # Count entities in the sentence
-            entity_count = len([ent for ent in doc.ents if ent.start >= sentence.start and ent.end <= sentence.end])
-            
-            # Count noun chunks in the sentence
-            chunk_count = len([chunk for chunk in doc.noun_chunks if chunk.start >= sentence.start and chunk.end <= sentence.end])
-            
-            # Score based on entities and chunks, normalized by sentence length
-            score = (entity_count + chunk_count) / len(sentence)
-            sentence_scores[i] = score
+        # Count entities and noun chunks per sentence by bucketing their start
+        # tokens against the sentence starts
+        sent_starts = np.fromiter((sentence.start for sentence in sentences), dtype=np.int32, count=len(sentences))
+        sent_lengths = np.fromiter((len(sentence) for sentence in sentences), dtype=np.int32, count=len(sentences))
+        entity_counts = self._count_per_sentence(sent_starts, doc.ents)
+        chunk_counts = self._count_per_sentence(sent_starts, doc.noun_chunks)
         
-        # Select top sentences
+        # Score sentences based on entities and chunks, normalized by sentence
+        # length; 16 fractional bits of fixed point keep scores integer
+        scores = ((entity_counts + chunk_counts) << 16) // sent_lengths
+        
+        # Select top sentences; argpartition finds them without sorting all scores
         num_sentences = min(self.max_sentences, max(self.min_sentences, len(sentences) // 4))
-        top_indices = sorted(sentence_scores, key=sentence_scores.get, reverse=True)[:num_sentences]
+        top_indices = np.argpartition(-scores, num_sentences - 1)[:num_sentences]
         
         # Arrange sentences in original order
-        top_indices = sorted(top_indices)
+        top_indices.sort()
         
         # Construct summary
         summary = " ".join(str(sentences[i]) for i in top_indices)
         
         return summary
+    
+    @staticmethod
+    def _count_per_sentence(sent_starts: np.ndarray, spans) -> np.ndarray:
+        """
+        Count the spans that start in each sentence.
+        
+        Args:
+            sent_starts: Start token index of each sentence, ascending
+            spans: Spans such as doc.ents or doc.noun_chunks
+            
+        Returns:
+            Array with the number of spans in each sentence
+        """
+        span_starts = np.fromiter((span.start for span in spans), dtype=np.int32)
+        buckets = np.searchsorted(sent_starts, span_starts, side="right") - 1
+        return np.bincount(buckets, minlength=len(sent_starts))
+
+
+# Entity labels preferred when picking what a question is about
+_INTERESTING_LABELS = frozenset({"PERSON", "ORG", "GPE", "EVENT", "PRODUCT", "WORK_OF_ART"})
+
+# Question templates by entity label; only the chosen one is formatted
+_ENTITY_TEMPLATES = {
+    "PERSON": (
+        "What role did {entity} play in this situation?",
+        "Why is {entity} significant in this context?",
+        "How might {entity}'s actions impact future developments?",
+    ),
+    "ORG": (
+        "What are the implications of {entity}'s involvement?",
+        "How might {entity}'s position evolve in the future?",
+        "Why is {entity}'s role important in this context?",
+    ),
+    "GPE": (  # Geopolitical entity (countries, cities)
+        "How might these developments affect {entity}?",
+        "What are the broader implications for {entity}?",
+        "Why is {entity} significant in this situation?",
+    ),
+    "EVENT": (
+        "What might be the long-term consequences of {entity}?",
+        "How could {entity} shape future developments?",
+        "Why is {entity} considered significant?",
+    ),
+}
+
+_DEFAULT_ENTITY_TEMPLATES = (
+    "What makes {entity} significant in this context?",
+    "How might {entity} influence future developments?",
+    "Why is {entity} important to consider?",
+)
+
+# Question templates by question type, filled with a noun from the text
+_QUESTION_TYPE_TEMPLATES = {
+    "what": (
+        "What are the broader implications of this {noun}?",
+        "What might be the next developments in this {noun}?",
+        "What do you think about this {noun}?",
+    ),
+    "why": (
+        "Why is this {noun} significant?",
+        "Why might this {noun} matter in the long run?",
+        "Why should we pay attention to this {noun}?",
+    ),
+    "how": (
+        "How might this {noun} affect future developments?",
+        "How could this {noun} change our understanding?",
+        "How do you see this {noun} evolving?",
+    ),
+}
+
+_DEFAULT_QUESTION_TYPE_TEMPLATES = (
+    "Do you think this {noun} will have lasting impact?",
+    "Is this {noun} as important as it seems?",
+    "Could this {noun} lead to significant changes?",
+)
+
+_GENERIC_QUESTIONS = (
+    "What do you think about this development?",
+    "How might this news impact the broader context?",
+    "Why is this news significant?",
+    "What could be the long-term implications?",
+    "How might this situation evolve in the future?",
+    "Do you see this as a positive or negative development?",
+    "What other factors might be influencing this situation?",
+    "How does this compare to similar situations in the past?",
+    "What questions does this raise for you?",
+    "What might be missing from this story?",
+)
 
 
 class QuestionGenerator(ContentProcessor):
@@ -210,20 +473,28 @@ class QuestionGenerator(ContentProcessor):
         self.question_types = config.get("question_types", ["what", "why", "how"])
         self.language = config.get("language", "english")
         
-        # Load spaCy model
-        try:
-            self.nlp = spacy.load("en_core_web_sm")
-        except OSError:
-            logger.warning("SpaCy model not found. Downloading en_core_web_sm...")
-            spacy.cli.download("en_core_web_sm")
-            self.nlp = spacy.load("en_core_web_sm")
+        # Worker processes for batched parsing; -1 uses every CPU. Off by
+        # default because spaCy's multiprocessing is not safe everywhere
+        self.n_process = config.get("n_process", 1)
+        self.batch_size = config.get("batch_size", 32)
+        
+        # Load spaCy model (shared with other processors)
+        self.nlp = _get_nlp(_ENTITY_PIPELINE_DISABLE)
+        
+        # Recently parsed texts, so a text seen again is not parsed again
+        self._parse = functools.lru_cache(maxsize=256)(self.nlp)
+        
+        # Own RNG so generators don't contend on the global one; "seed"
+        # makes the questions reproducible
+        self._rng = random.Random(config.get("seed"))
     
-    def process(self, text: str) -> str:
+    def process(self, text: str, doc=None) -> str:
         """
         Generate a question based on the input text.
         
         Args:
             text: Input text to generate question from
+            doc: Optional spaCy Doc already parsed from text
             
         Returns:
             Generated question
@@ -231,125 +502,84 @@ class QuestionGenerator(ContentProcessor):
         if not text:
             return ""
         
+        if doc is None:
+            doc = self._parse(text)
+        return self._question_from_doc(doc)
+    
+    def process_texts_batch(self, texts: List[str]) -> List[str]:
+        """
+        Generate a question for each of several texts, parsing them together with nlp.pipe.
+        
+        Args:
+            texts: Input texts to generate questions from
+            
+        Returns:
+            Generated questions, in input order
+        """
+        texts = [text or "" for text in texts]
+        docs = self.nlp.pipe(texts, batch_size=self.batch_size, n_process=self.n_process)
+        return [self._question_from_doc(doc) if text else "" for text, doc in zip(texts, docs)]
+    
+    def _question_from_doc(self, doc) -> str:
+        """Generate a question from a parsed Doc, trying entities before templates."""
         # Try different methods to generate a question
-        question = self._generate_entity_question(text)
+        question = self._generate_entity_question(doc)
         
         if not question:
-            question = self._generate_template_question(text)
+            question = self._generate_template_question(doc)
         
         return question
     
-    def _generate_entity_question(self, text: str) -> str:
+    def _generate_entity_question(self, doc) -> str:
         """
         Generate a question based on entities in the text.
         
         Args:
-            text: Input text
+            doc: spaCy Doc of the input text
             
         Returns:
             Generated question or empty string if no suitable entities found
         """
-        doc = self.nlp(text)
-        
         # Extract entities
         entities = list(doc.ents)
         if not entities:
             return ""
         
         # Filter for interesting entity types
-        interesting_types = ["PERSON", "ORG", "GPE", "EVENT", "PRODUCT", "WORK_OF_ART"]
-        interesting_entities = [ent for ent in entities if ent.label_ in interesting_types]
+        interesting_entities = [ent for ent in entities if ent.label_ in _INTERESTING_LABELS]
         
         if not interesting_entities:
             interesting_entities = entities  # Fallback to all entities
         
         # Select a random entity
-        entity = random.choice(interesting_entities)
+        entity = self._rng.choice(interesting_entities)
         
         # Generate question based on entity type
-        if entity.label_ == "PERSON":
-            templates = [
-                f"What role did {entity.text} play in this situation?",
-                f"Why is {entity.text} significant in this context?",
-                f"How might {entity.text}'s actions impact future developments?"
-            ]
-        elif entity.label_ == "ORG":
-            templates = [
-                f"What are the implications of {entity.text}'s involvement?",
-                f"How might {entity.text}'s position evolve in the future?",
-                f"Why is {entity.text}'s role important in this context?"
-            ]
-        elif entity.label_ == "GPE":  # Geopolitical entity (countries, cities)
-            templates = [
-                f"How might these developments affect {entity.text}?",
-                f"What are the broader implications for {entity.text}?",
-                f"Why is {entity.text} significant in this situation?"
-            ]
-        elif entity.label_ == "EVENT":
-            templates = [
-                f"What might be the long-term consequences of {entity.text}?",
-                f"How could {entity.text} shape future developments?",
-                f"Why is {entity.text} considered significant?"
-            ]
-        else:
-            templates = [
-                f"What makes {entity.text} significant in this context?",
-                f"How might {entity.text} influence future developments?",
-                f"Why is {entity.text} important to consider?"
-            ]
-        
-        return random.choice(templates)
+        template = self._rng.choice(_ENTITY_TEMPLATES.get(entity.label_, _DEFAULT_ENTITY_TEMPLATES))
+        return template.format(entity=entity.text)
     
-    def _generate_template_question(self, text: str) -> str:
+    def _generate_template_question(self, doc) -> str:
         """
         Generate a question using templates when entity-based generation fails.
         
         Args:
-            text: Input text
+            doc: spaCy Doc of the input text
             
         Returns:
             Generated question
         """
-        # Extract key nouns and verbs for context
-        doc = self.nlp(text)
-        
         # Get main nouns
         nouns = [token.text for token in doc if token.pos_ == "NOUN"]
         if not nouns:
             # Fallback to generic questions
             return self._generate_generic_question()
         
-        main_noun = random.choice(nouns)
+        main_noun = self._rng.choice(nouns)
         
         # Template questions based on question type
-        question_type = random.choice(self.question_types)
-        
-        if question_type == "what":
-            templates = [
-                f"What are the broader implications of this {main_noun}?",
-                f"What might be the next developments in this {main_noun}?",
-                f"What do you think about this {main_noun}?"
-            ]
-        elif question_type == "why":
-            templates = [
-                f"Why is this {main_noun} significant?",
-                f"Why might this {main_noun} matter in the long run?",
-                f"Why should we pay attention to this {main_noun}?"
-            ]
-        elif question_type == "how":
-            templates = [
-                f"How might this {main_noun} affect future developments?",
-                f"How could this {main_noun} change our understanding?",
-                f"How do you see this {main_noun} evolving?"
-            ]
-        else:
-            templates = [
-                f"Do you think this {main_noun} will have lasting impact?",
-                f"Is this {main_noun} as important as it seems?",
-                f"Could this {main_noun} lead to significant changes?"
-            ]
-        
-        return random.choice(templates)
+        question_type = self._rng.choice(self.question_types)
+        template = self._rng.choice(_QUESTION_TYPE_TEMPLATES.get(question_type, _DEFAULT_QUESTION_TYPE_TEMPLATES))
+        return template.format(noun=main_noun)
     
     def _generate_generic_question(self) -> str:
         """
@@ -358,20 +588,7 @@ class QuestionGenerator(ContentProcessor):
         Returns:
             Generic question
         """
-        generic_questions = [
-            "What do you think about this development?",
-            "How might this news impact the broader context?",
-            "Why is this news significant?",
-            "What could be the long-term implications?",
-            "How might this situation evolve in the future?",
-            "Do you see this as a positive or negative development?",
-            "What other factors might be influencing this situation?",
-            "How does this compare to similar situations in the past?",
-            "What questions does this raise for you?",
-            "What might be missing from this story?"
-        ]
-        
-        return random.choice(generic_questions)
+        return self._rng.choice(_GENERIC_QUESTIONS)
 
 
 class ContentProcessorFactory:
@@ -419,6 +636,12 @@ class ContentProcessorManager:
             "language": "english"
         })
         self.question_generator = QuestionGenerator(question_generator_config)
+        
+        # The abstractive summarizer uses the question generator's pipeline, so
+        # share its Doc cache: short content that is kept as its own summary is
+        # then parsed only once for both
+        if self.summarizer.nlp is self.question_generator.nlp:
+            self.summarizer._parse = self.question_generator._parse
     
     def process_news_item(self, news_item):
         """
@@ -458,6 +681,13 @@ class ContentProcessorManager:
         Returns:
             List of processed NewsItem objects
         """
+        news_items = list(news_items)
+        
+        try:
+            return self._process_batch(news_items)
+        except Exception as e:
+            logger.error(f"Error processing news items as a batch, processing one at a time: {e}")
+        
         processed_items = []
         
         for item in news_items:
@@ -469,6 +699,59 @@ class ContentProcessorManager:
                 processed_items.append(item)  # Keep the original item
         
         return processed_items
+    
+    def _process_batch(self, news_items):
+        """
+        Process news items like process_news_item, streaming each stage's texts through nlp.pipe.
+        
+        Args:
+            news_items: List of NewsItem objects
+            
+        Returns:
+            List of processed NewsItem objects
+        """
+        # Summarize items that have content but no summary
+        to_summarize = [item for item in news_items if not item.summary and item.content]
+        summaries = self.summarizer.process_texts_batch([item.content for item in to_summarize])
+        for item, summary in zip(to_summarize, summaries):
+            item.summary = summary
+        
+        for item in news_items:
+            if not item.summary:
+                item.summary = item.title
+        
+        # Generate questions based on the summary, content or title
+        texts_for_questions = [item.summary or item.content or item.title for item in news_items]
+        questions = self.question_generator.process_texts_batch(texts_for_questions)
+        for item, question in zip(news_items, questions):
+            item.question = question
+            item.processed = True
+        
+        return news_items
+
+
+@functools.lru_cache(maxsize=4)
+def _cached_manager(config_json: str) -> ContentProcessorManager:
+    """Build a manager for a canonical JSON config; cached by the JSON string."""
+    return ContentProcessorManager(json.loads(config_json))
+
+
+def get_default_manager(config: Dict[str, Any] = None) -> ContentProcessorManager:
+    """
+    Get a process-wide ContentProcessorManager for a configuration.
+    
+    Managers are built once per distinct config (compared by value), so
+    repeated callers share the spaCy/NLTK resources. The returned manager
+    is shared: callers that need to change it should construct their own
+    ContentProcessorManager instead.
+    
+    Args:
+        config: Processor configuration (JSON-serializable)
+        
+    Returns:
+        Shared ContentProcessorManager instance
+    """
+    return _cached_manager(json.dumps(config or {}, sort_keys=True))
 
 
 # Example usage
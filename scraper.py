@@ -12,16 +12,55 @@ Each scraper is implemented as a separate class with a common interface.
 import os
 import re
 import json
+import asyncio
+import codecs
 import logging
+import hashlib
+import functools
+import operator
+import threading
 from abc import ABC, abstractmethod
-from typing import List, Dict, Any, Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Dict, Any, Optional, Callable, Tuple
 from datetime import datetime, timedelta, timezone
 
-import requests
-from bs4 import BeautifulSoup
-import feedparser
+import lxml.html
+from lxml import etree
+from lxml.cssselect import CSSSelector
+from cssselect import HTMLTranslator
 from urllib.parse import urlparse, urljoin
 
+from async_utils import run_sync
+
+try:
+    from selectolax.lexbor import LexborHTMLParser
+except ImportError:
+    LexborHTMLParser = None
+
+try:
+    import xxhash
+except ImportError:
+    xxhash = None
+
+try:
+    from dateutil import parser as dateutil_parser
+except ImportError:
+    dateutil_parser = None
+
+# orjson is optional; it speeds up saving and loading news items
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# requests, feedparser and aiohttp are imported when the first scraper that
+# needs them is created, so importing NewsItem alone stays cheap
+requests = None
+HTTPAdapter = None
+feedparser = None
+aiohttp = None
+_import_lock = threading.Lock()
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -29,9 +68,193 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Patterns used on every result, article and feed entry
+_WS_RE = re.compile(r'\s+')
+_SENT_RE = re.compile(r'(?<=[.!?])\s+')
+# Non-article links (login, about pages, ...) skipped when scanning a site
+_SKIP_LINK_RE = re.compile(r'login|signin|register|about|contact|terms|privacy|advertise', re.I)
+
+# Relative dates in Google results ("5 minutes ago", "2 hours ago", "1 day ago")
+_REL_DATE_RE = re.compile(r'(\d+)\s*(minute|hour|day|week)s?\b', re.I)
+_REL_DATE_UNITS = {"minute": "minutes", "hour": "hours", "day": "days", "week": "weeks"}
+_HEADER_CHARSET_RE = re.compile(r'charset=["\']?([\w.:-]+)', re.I)
+_META_CHARSET_RE = re.compile(rb'<meta[^>]+charset=["\']?([\w.:-]+)', re.I)
+
+# Read article bodies in chunks this size, so parsing can stop early
+_ARTICLE_CHUNK_SIZE = 16384
+
+
+@functools.lru_cache(maxsize=32)
+def _topic_matcher(topic: str) -> Callable[[str], bool]:
+    """Return a predicate telling whether lowercased text contains any word of the topic.
+    
+    All keywords go into one compiled alternation, so each text is scanned
+    once instead of once per keyword.
+    """
+    keywords = sorted(set(topic.lower().split()), key=len, reverse=True)
+    if not keywords:
+        return lambda text: False
+    
+    search = re.compile("|".join(map(re.escape, keywords))).search
+    return lambda text: search(text) is not None
+
+
+@functools.lru_cache(maxsize=256)
+def _css(selector: str) -> CSSSelector:
+    """Compile a CSS selector for lxml once; site configs reuse the same few."""
+    return CSSSelector(selector, translator="html")
+
+
+# CSS-selector helpers for the listing pages. They use selectolax's Lexbor
+# parser when it is installed, and otherwise lxml with the compiled, cached
+# selectors from _css().
+
+def _parse_html(html: str):
+    """Parse an HTML page for use with _select/_select_first."""
+    if LexborHTMLParser is not None:
+        return LexborHTMLParser(html)
+    if not html.strip():
+        return lxml.html.fromstring("<html></html>")
+    try:
+        return lxml.html.fromstring(html)
+    except ValueError:
+        # lxml refuses str input that carries an XML encoding declaration
+        return lxml.html.fromstring(html.encode("utf-8"))
+
+
+def _select(node, selector: str) -> list:
+    """All descendants of node matching a CSS selector."""
+    if LexborHTMLParser is not None:
+        return node.css(selector)
+    return _css(selector)(node)
+
+
+def _select_first(node, selector: str):
+    """The first descendant of node matching a CSS selector, or None."""
+    if LexborHTMLParser is not None:
+        return node.css_first(selector)
+    matches = _css(selector)(node)
+    return matches[0] if matches else None
+
+
+def _text(node) -> str:
+    """Text content of a node."""
+    if LexborHTMLParser is not None:
+        return node.text()
+    return node.text_content()
+
+
+def _attr(node, name: str) -> str:
+    """Value of a node's attribute, or "" if it is missing."""
+    if LexborHTMLParser is not None:
+        return node.attributes.get(name) or ""
+    return node.get(name) or ""
+
+
+# Non-ISO article date formats, tried in order when python-dateutil is not installed
+_ARTICLE_DATE_FORMATS = (
+    "%Y-%m-%dT%H:%M:%S%z",  # ISO with a +HHMM offset (fromisoformat needs 3.11 for it)
+    "%Y-%m-%d %H:%M:%S",    # Common format
+    "%B %d, %Y",            # Month name, day, year
+    "%d %B %Y",             # Day, month name, year
+    "%m/%d/%Y",             # US format
+    "%d/%m/%Y",             # European format
+)
+
+
+def _parse_article_date(date_str: str) -> Optional[datetime]:
+    """Parse an article's date string, or return None if no known format matches."""
+    # Fast path: <time datetime="..."> values are almost always ISO 8601
+    iso_str = date_str[:-1] + "+00:00" if date_str.endswith("Z") else date_str
+    try:
+        return datetime.fromisoformat(iso_str)
+    except ValueError:
+        pass
+    
+    if dateutil_parser is not None:
+        try:
+            return dateutil_parser.parse(date_str, fuzzy=False)
+        except (ValueError, OverflowError):
+            return None
+    
+    for date_format in _ARTICLE_DATE_FORMATS:
+        try:
+            return datetime.strptime(date_str, date_format)
+        except ValueError:
+            continue
+    return None
+
+
+def _canonical_url(url: str) -> str:
+    """Reduce a URL to host, path and non-tracking query so trivial variants compare equal."""
+    parsed = urlparse(url)
+    query = "&".join(kv for kv in parsed.query.split("&") if kv and not kv.startswith("utm_"))
+    return f"{parsed.netloc.lower()}{parsed.path.rstrip('/')}?{query}"
+
+
+def _url_fingerprint(url: str) -> int:
+    """64-bit fingerprint of the canonical URL, used to deduplicate articles."""
+    key = _canonical_url(url).encode("utf-8")
+    if xxhash is not None:
+        return xxhash.xxh64(key).intdigest()
+    return int.from_bytes(hashlib.blake2b(key, digest_size=8).digest(), "little")
+
+
+@functools.lru_cache(maxsize=256)
+def _css_self(selector: str) -> etree.XPath:
+    """Compile a CSS selector into an XPath testing whether one element matches it."""
+    return etree.XPath(HTMLTranslator().css_to_xpath(selector, prefix="self::"))
+
+
+def _detect_encoding(content_type: str, head: bytes) -> str:
+    """Pick a page's encoding from its Content-Type header or a <meta charset> in its first bytes."""
+    match = _HEADER_CHARSET_RE.search(content_type) or _META_CHARSET_RE.search(head)
+    if match:
+        encoding = match.group(1)
+        encoding = encoding.decode("ascii") if isinstance(encoding, bytes) else encoding
+        try:
+            return codecs.lookup(encoding).name
+        except LookupError:
+            pass
+    return "utf-8"
+
+
+def _ensure_requests():
+    """Import requests, once."""
+    global requests, HTTPAdapter
+    if requests is None:
+        with _import_lock:
+            if requests is None:
+                import requests as requests_module
+                from requests.adapters import HTTPAdapter as adapter_class
+                HTTPAdapter = adapter_class
+                requests = requests_module
+
+
+def _ensure_feedparser():
+    """Import feedparser, and aiohttp if it is installed, once."""
+    global feedparser, aiohttp
+    if feedparser is None:
+        with _import_lock:
+            if feedparser is None:
+                try:
+                    import aiohttp as aiohttp_module
+                except ImportError:
+                    aiohttp_module = None
+                import feedparser as feedparser_module
+                aiohttp = aiohttp_module
+                feedparser = feedparser_module
+
+
 class NewsItem:
     """Class representing a news item with standardized fields."""
     
+    # Fixed attribute set: no per-instance __dict__, since scrapes create many items
+    __slots__ = (
+        "title", "url", "source", "published_date", "content", "summary",
+        "image_url", "processed", "question", "generated_image_path"
+    )
+    
     def __init__(
         self,
         title: str,
@@ -102,8 +325,14 @@ class NewsScraper(ABC):
         self.headers = {
             "User-Agent": self.user_agent
         }
+        
+        # One pooled session per scraper so repeat hosts reuse their connections
+        _ensure_requests()
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=16, pool_maxsize=32)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
     
-    @abstractmethod
     def scrape(self, topic: str, max_results: int = 10) -> List[NewsItem]:
         """
         Scrape news for a given topic.
@@ -115,38 +344,58 @@ class NewsScraper(ABC):
         Returns:
             List of NewsItem objects
         """
+        return [NewsItem(**fields) for fields in self._scrape_as_dicts(topic, max_results)]
+    
+    @abstractmethod
+    def _scrape_as_dicts(self, topic: str, max_results: int = 10) -> List[Dict[str, Any]]:
+        """
+        Scrape news for a given topic without building NewsItem objects.
+        
+        Args:
+            topic: The topic to search for
+            max_results: Maximum number of results to return
+            
+        Returns:
+            List of NewsItem constructor arguments as dicts (published_date is a datetime)
+        """
         pass
     
     def _clean_html(self, html_content: str) -> str:
         """Clean HTML content by removing tags and extra whitespace."""
-        soup = BeautifulSoup(html_content, "html.parser")
-        text = soup.get_text(separator=" ")
+        # Plain text (no tags, no entities) needs no parser at all
+        if "<" not in html_content and "&" not in html_content:
+            return _WS_RE.sub(' ', html_content).strip()
+        
+        fragment = lxml.html.fragment_fromstring(html_content, create_parent="div")
+        for unwanted in _css("script, style")(fragment):
+            unwanted.drop_tree()
+        text = " ".join(fragment.itertext())
         # Remove extra whitespace
-        text = re.sub(r'\s+', ' ', text).strip()
+        text = _WS_RE.sub(' ', text).strip()
         return text
     
-    def _extract_main_image(self, soup: BeautifulSoup, base_url: str) -> str:
-        """Extract the main image URL from a BeautifulSoup object."""
+    def _extract_main_image(self, tree: lxml.html.HtmlElement, base_url: str) -> str:
+        """Extract the main image URL from a parsed lxml document."""
         # Try to find meta og:image
-        og_image = soup.find("meta", property="og:image")
-        if og_image and og_image.get("content"):
-            return urljoin(base_url, og_image["content"])
+        og_image = tree.find('.//meta[@property="og:image"]')
+        if og_image is not None and og_image.get("content"):
+            return urljoin(base_url, og_image.get("content"))
         
         # Try to find the first large image
-        for img in soup.find_all("img", src=True):
-            if img.get("width") and int(img["width"]) > 300:
-                return urljoin(base_url, img["src"])
-            if img.get("height") and int(img["height"]) > 200:
-                return urljoin(base_url, img["src"])
+        images = tree.xpath("//img[@src]")
+        for img in images:
+            if img.get("width") and int(img.get("width")) > 300:
+                return urljoin(base_url, img.get("src"))
+            if img.get("height") and int(img.get("height")) > 200:
+                return urljoin(base_url, img.get("src"))
             # Check if image has class containing "featured" or "main"
-            img_class = img.get("class", [])
+            img_class = img.get("class", "").split()
             if any(c for c in img_class if "featured" in c.lower() or "main" in c.lower()):
-                return urljoin(base_url, img["src"])
+                return urljoin(base_url, img.get("src"))
         
         # Fallback to first image
-        first_img = soup.find("img", src=True)
-        if first_img:
-            return urljoin(base_url, first_img["src"])
+        if images:
+            return urljoin(base_url, images[0].get("src"))
         
         return ""
 
@@ -159,7 +408,7 @@ class GoogleNewsScraper(NewsScraper):
         self.search_url = "https://www.google.com/search"
         self.time_period = config.get("time_period", "1d")  # Default to 1 day
     
-    def scrape(self, topic: str, max_results: int = 10) -> List[NewsItem]:
+    def _scrape_as_dicts(self, topic: str, max_results: int = 10) -> List[Dict[str, Any]]:
         """Scrape news from Google for a given topic."""
         logger.info(f"Scraping Google News for topic: {topic}")
         
@@ -171,55 +420,49 @@ class GoogleNewsScraper(NewsScraper):
         }
         
         try:
-            response = requests.get(self.search_url, params=params, headers=self.headers)
+            response = self.session.get(self.search_url, params=params, headers=self.headers)
             response.raise_for_status()
             
-            soup = BeautifulSoup(response.text, "html.parser")
+            tree = _parse_html(response.text)
             news_items = []
             
             # Extract news items from Google search results
-            for result in soup.select("div.SoaBEf")[:max_results]:
+            for result in _select(tree, "div.SoaBEf")[:max_results]:
                 try:
                     # Extract title and URL
-                    title_elem = result.select_one("div.mCBkyc")
-                    link_elem = result.select_one("a")
+                    title_elem = _select_first(result, "div.mCBkyc")
+                    link_elem = _select_first(result, "a")
                     
-                    if not title_elem or not link_elem:
+                    if title_elem is None or link_elem is None:
                         continue
                     
-                    title = title_elem.text.strip()
-                    url = link_elem.get("href", "")
+                    title = _text(title_elem).strip()
+                    url = _attr(link_elem, "href")
                     
                     # Clean URL (Google prepends with /url?q=)
                     if url.startswith("/url?q="):
                         url = url.split("/url?q=")[1].split("&")[0]
                     
                     # Extract source
-                    source_elem = result.select_one("div.CEMjEf")
-                    source = source_elem.text.strip() if source_elem else "Unknown"
+                    source_elem = _select_first(result, "div.CEMjEf")
+                    source = _text(source_elem).strip() if source_elem is not None else "Unknown"
                     
                     # Extract date if available
-                    date_elem = result.select_one("div.OSrXXb span")
+                    date_elem = _select_first(result, "div.OSrXXb span")
                     published_date = datetime.now()
-                    if date_elem:
-                        date_text = date_elem.text.strip()
+                    if date_elem is not None:
                         # Parse relative dates like "2 hours ago", "1 day ago"
-                        if "hour" in date_text:
-                            hours = int(re.search(r'(\d+)', date_text).group(1))
-                            published_date = datetime.now() - timedelta(hours=hours)
-                        elif "day" in date_text:
-                            days = int(re.search(r'(\d+)', date_text).group(1))
-                            published_date = datetime.now() - timedelta(days=days)
-                        elif "minute" in date_text:
-                            minutes = int(re.search(r'(\d+)', date_text).group(1))
-                            published_date = datetime.now() - timedelta(minutes=minutes)
+                        match = _REL_DATE_RE.search(_text(date_elem))
+                        if match:
+                            unit = _REL_DATE_UNITS[match.group(2).lower()]
+                            published_date -= timedelta(**{unit: int(match.group(1))})
                     
                     # Extract snippet/summary
-                    snippet_elem = result.select_one("div.GI74Re")
-                    summary = snippet_elem.text.strip() if snippet_elem else ""
+                    snippet_elem = _select_first(result, "div.GI74Re")
+                    summary = _text(snippet_elem).strip() if snippet_elem is not None else ""
                     
-                    # Create NewsItem
-                    news_item = NewsItem(
+                    # Collect the NewsItem fields
+                    news_item = dict(
                         title=title,
                         url=url,
                         source=source,
@@ -249,156 +492,179 @@ class WebsiteScraper(NewsScraper):
         self.sites = config.get("sites", [])
         self.max_depth = config.get("max_depth", 1)
         self.timeout = config.get("timeout", 10)
+        self.max_workers = config.get("max_workers", 8)
     
-    def scrape(self, topic: str, max_results: int = 10) -> List[NewsItem]:
+    def _scrape_as_dicts(self, topic: str, max_results: int = 10) -> List[Dict[str, Any]]:
         """Scrape news from configured websites for a given topic."""
         logger.info(f"Scraping websites for topic: {topic}")
         
+        matches_topic = _topic_matcher(topic)
+        sites = [site for site in self.sites if site.get("url")]
         news_items = []
         
-        for site in self.sites:
-            try:
-                site_url = site.get("url")
-                if not site_url:
-                    continue
-                
-                logger.info(f"Scraping website: {site_url}")
-                
-                # Get the main page
-                response = requests.get(
-                    site_url, 
-                    headers=self.headers,
-                    timeout=self.timeout
-                )
-                response.raise_for_status()
-                
-                soup = BeautifulSoup(response.text, "html.parser")
-                
-                # Extract links based on site-specific selectors or default approach
-                article_selector = site.get("article_selector", "a")
-                links = soup.select(article_selector)
-                
-                # Filter links that might be related to the topic
-                topic_keywords = topic.lower().split()
-                relevant_links = []
-                
-                for link in links:
-                    href = link.get("href")
-                    if not href:
-                        continue
-                    
-                    # Make URL absolute
-                    if not href.startswith(("http://", "https://")):
-                        href = urljoin(site_url, href)
-                    
-                    # Skip non-article URLs (e.g., login, about pages)
-                    if any(skip in href.lower() for skip in [
-                        "login", "signin", "register", "about", "contact", 
-                        "terms", "privacy", "advertise"
-                    ]):
-                        continue
-                    
-                    # Check if link text or URL contains topic keywords
-                    link_text = link.text.lower()
-                    if any(keyword in link_text or keyword in href.lower() for keyword in topic_keywords):
-                        relevant_links.append(href)
-                
-                # Limit the number of links to process
-                relevant_links = relevant_links[:max_results]
-                
-                # Process each relevant link
-                for url in relevant_links:
-                    try:
-                        article = self._scrape_article(url, site)
-                        if article:
-                            news_items.append(article)
-                            
-                            # Break if we've reached max_results
-                            if len(news_items) >= max_results:
-                                break
-                    except Exception as e:
-                        logger.error(f"Error scraping article {url}: {e}")
-                        continue
-                
-                # Break if we've reached max_results
-                if len(news_items) >= max_results:
-                    break
-                    
-            except Exception as e:
-                logger.error(f"Error scraping website {site.get('url')}: {e}")
-                continue
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            # Fetch every site's front page at once
+            link_lists = executor.map(lambda site: self._find_relevant_links(site, matches_topic, max_results), sites)
+            candidates = [(url, site) for site, links in zip(sites, link_lists) for url in links]
+            
+            # Scrape articles in site order, in parallel batches of only as
+            # many as are still needed to reach max_results
+            while candidates and len(news_items) < max_results:
+                needed = max_results - len(news_items)
+                batch, candidates = candidates[:needed], candidates[needed:]
+                for article in executor.map(lambda candidate: self._scrape_article(*candidate), batch):
+                    if article:
+                        news_items.append(article)
         
         logger.info(f"Found {len(news_items)} news items from websites")
         return news_items
     
-    def _scrape_article(self, url: str, site_config: Dict[str, Any]) -> Optional[NewsItem]:
-        """Scrape a single article from a URL."""
+    def _find_relevant_links(self, site: Dict[str, Any], matches_topic: Callable[[str], bool], max_results: int) -> List[str]:
+        """Fetch a site's front page and return up to max_results article links matching the topic."""
+        site_url = site.get("url")
+        
         try:
-            response = requests.get(
-                url, 
+            logger.info(f"Scraping website: {site_url}")
+            
+            # Get the main page
+            response = self.session.get(
+                site_url, 
                 headers=self.headers,
                 timeout=self.timeout
             )
             response.raise_for_status()
             
-            soup = BeautifulSoup(response.text, "html.parser")
+            tree = _parse_html(response.text)
+            
+            # Extract links based on site-specific selectors or default approach
+            article_selector = site.get("article_selector", "a")
+            links = _select(tree, article_selector)
+            
+            # Filter links that might be related to the topic
+            relevant_links = []
+            
+            for link in links:
+                href = _attr(link, "href")
+                if not href:
+                    continue
+                
+                # Make URL absolute
+                if not href.startswith(("http://", "https://")):
+                    href = urljoin(site_url, href)
+                
+                # Skip non-article URLs (e.g., login, about pages)
+                if _SKIP_LINK_RE.search(href):
+                    continue
+                
+                # Check if link text or URL contains topic keywords
+                if matches_topic(_text(link).lower()) or matches_topic(href.lower()):
+                    relevant_links.append(href)
+            
+            # Limit the number of links to process
+            return relevant_links[:max_results]
+            
+        except Exception as e:
+            logger.error(f"Error scraping website {site_url}: {e}")
+            return []
+    
+    def _parse_article(self, url: str, site_config: Dict[str, Any]) -> lxml.html.HtmlElement:
+        """
+        Download and parse an article page, stopping as soon as the parts we need have been seen.
+        
+        The body is streamed into an incremental parser. Once the title, content and
+        date selectors have each matched a complete element, the rest of the page is
+        neither downloaded nor parsed; if any of them never matches, the whole page is.
+        
+        Args:
+            url: Article URL
+            site_config: Site configuration with the title/content/date selectors
+            
+        Returns:
+            Root element of the (possibly partial) document
+        """
+        pending = [
+            _css_self(site_config.get("title_selector", "h1")),
+            _css_self(site_config.get("content_selector", "article")),
+            _css_self(site_config.get("date_selector", "time")),
+        ]
+        
+        with self.session.get(url, headers=self.headers, timeout=self.timeout, stream=True) as response:
+            response.raise_for_status()
+            
+            parser = None
+            for chunk in response.iter_content(chunk_size=_ARTICLE_CHUNK_SIZE):
+                if parser is None:
+                    encoding = _detect_encoding(response.headers.get("Content-Type", ""), chunk)
+                    parser = etree.HTMLPullParser(events=("end",), encoding=encoding)
+                    parser.set_element_class_lookup(lxml.html.HtmlElementClassLookup())
+                
+                parser.feed(chunk)
+                for _, elem in parser.read_events():
+                    # An element is the first match in document order once it is
+                    # complete and no ancestor matches the same selector
+                    pending = [
+                        matches for matches in pending
+                        if not matches(elem) or any(matches(ancestor) for ancestor in elem.iterancestors())
+                    ]
+                if not pending:
+                    break
+        
+        if parser is None:
+            raise ValueError("Empty response body")
+        return parser.close()
+    
+    def _scrape_article(self, url: str, site_config: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Scrape a single article from a URL into NewsItem fields."""
+        try:
+            # Parse once, and only as far into the page as needed
+            tree = self._parse_article(url, site_config)
             
             # Extract title
             title_selector = site_config.get("title_selector", "h1")
-            title_elem = soup.select_one(title_selector)
-            title = title_elem.text.strip() if title_elem else ""
+            title_elems = _css(title_selector)(tree)
+            title = title_elems[0].text_content().strip() if title_elems else ""
             
             if not title:
-                # Try common title elements
-                for selector in ["h1", "h1.title", "h1.article-title", "title"]:
-                    title_elem = soup.select_one(selector)
-                    if title_elem:
-                        title = title_elem.text.strip()
-                        break
+                # Try common title elements (any h1 first, then <title>) in one pass
+                candidates = tree.xpath("//h1 | //title")
+                title_elem = next((elem for elem in candidates if elem.tag == "h1"), None)
+                if title_elem is None and candidates:
+                    title_elem = candidates[0]
+                if title_elem is not None:
+                    title = title_elem.text_content().strip()
             
             # Extract content
             content_selector = site_config.get("content_selector", "article")
-            content_elem = soup.select_one(content_selector)
+            content_elems = _css(content_selector)(tree)
             
-            if not content_elem:
+            if not content_elems:
                 # Try common content elements
                 for selector in ["article", "div.article", "div.content", "div.article-content"]:
-                    content_elem = soup.select_one(selector)
-                    if content_elem:
+                    content_elems = _css(selector)(tree)
+                    if content_elems:
                         break
             
             content = ""
-            if content_elem:
-                # Remove unwanted elements
-                for unwanted in content_elem.select("script, style, nav, footer, .comments, .related"):
-                    unwanted.decompose()
+            if content_elems:
+                content_elem = content_elems[0]
                 
-                content = content_elem.get_text(separator=" ").strip()
-                content = re.sub(r'\s+', ' ', content)
+                # Remove unwanted elements (their tail text belongs to the parent and is kept)
+                for unwanted in _css("script, style, nav, footer, .comments, .related")(content_elem):
+                    unwanted.drop_tree()
+                
+                content = " ".join(content_elem.itertext()).strip()
+                content = _WS_RE.sub(' ', content)
             
             # Extract published date
             date_selector = site_config.get("date_selector", "time")
-            date_elem = soup.select_one(date_selector)
+            date_elems = _css(date_selector)(tree)
             
             published_date = datetime.now()
-            if date_elem:
-                date_str = date_elem.get("datetime") or date_elem.text.strip()
+            if date_elems:
+                date_elem = date_elems[0]
+                date_str = date_elem.get("datetime") or date_elem.text_content().strip()
                 try:
-                    # Try various date formats
-                    for date_format in [
-                        "%Y-%m-%dT%H:%M:%S%z",  # ISO format with timezone
-                        "%Y-%m-%dT%H:%M:%S",    # ISO format without timezone
-                        "%Y-%m-%d %H:%M:%S",    # Common format
-                        "%B %d, %Y",            # Month name, day, year
-                        "%d %B %Y",             # Day, month name, year
-                        "%m/%d/%Y",             # US format
-                        "%d/%m/%Y",             # European format
-                    ]:
-                        try:
-                            published_date = datetime.strptime(date_str, date_format)
-                            break
-                        except ValueError:
-                            continue
+                    published_date = _parse_article_date(date_str) or published_date
                     # Ensure timezone consistency (convert to naive UTC)
                     if published_date.tzinfo is not None:
                         published_date = published_date.astimezone(timezone.utc).replace(tzinfo=None)
@@ -408,18 +674,18 @@ class WebsiteScraper(NewsScraper):
                     pass
             
             # Extract image
-            image_url = self._extract_main_image(soup, url)
+            image_url = self._extract_main_image(tree, url)
             
             # Create a summary (first few sentences)
             summary = ""
             if content:
-                sentences = re.split(r'(?<=[.!?])\s+', content)
+                sentences = _SENT_RE.split(content)
                 summary = " ".join(sentences[:3])
             
-            # Create NewsItem
+            # Collect the NewsItem fields
             source = urlparse(url).netloc
             
-            return NewsItem(
+            return dict(
                 title=title,
                 url=url,
                 source=source,
@@ -440,20 +706,99 @@ class RSSFeedScraper(NewsScraper):
     def __init__(self, config: Dict[str, Any]):
         super().__init__(config)
         self.feeds = config.get("feeds", [])
+        _ensure_feedparser()
         self.max_age_days = config.get("max_age_days", 1)
+        self.timeout = config.get("timeout", 30)
+        
+        # feed URL -> (ETag, Last-Modified, parsed feed) from the last full download
+        self._feed_cache: Dict[str, Tuple[str, str, Any]] = {}
     
-    def scrape(self, topic: str, max_results: int = 10) -> List[NewsItem]:
+    def _fetch_feeds(self) -> list:
+        """
+        Download and parse all feeds concurrently.
+        
+        Returns:
+            Parsed feed (or the exception raised for it) for each configured feed, in order
+        """
+        if not self.feeds:
+            return []
+        
+        if aiohttp is not None:
+            return run_sync(self._fetch_feeds_async())
+        
+        # Without aiohttp, let feedparser download the feeds from a thread pool
+        def parse(feed_url):
+            try:
+                etag, modified, cached = self._feed_cache.get(feed_url, (None, None, None))
+                feed = feedparser.parse(feed_url, agent=self.user_agent, etag=etag, modified=modified)
+                if feed.get("status") == 304 and cached is not None:
+                    return cached
+                
+                self._remember_feed(feed_url, feed.get("etag"), feed.get("modified"), feed)
+                return feed
+            except Exception as e:
+                return e
+        
+        with ThreadPoolExecutor(max_workers=min(16, len(self.feeds))) as executor:
+            return list(executor.map(parse, self.feeds))
+    
+    async def _fetch_feeds_async(self) -> list:
+        """Download all feeds on one event loop and parse the bodies."""
+        timeout = aiohttp.ClientTimeout(total=self.timeout)
+        async with aiohttp.ClientSession(headers=self.headers, timeout=timeout) as session:
+            return await asyncio.gather(
+                *(self._fetch_feed(session, feed_url) for feed_url in self.feeds),
+                return_exceptions=True
+            )
+    
+    async def _fetch_feed(self, session, feed_url: str):
+        """Download one feed and parse it from the raw bytes, unless it is unchanged."""
+        etag, modified, cached = self._feed_cache.get(feed_url, (None, None, None))
+        
+        conditional_headers = {}
+        if cached is not None:
+            if etag:
+                conditional_headers["If-None-Match"] = etag
+            if modified:
+                conditional_headers["If-Modified-Since"] = modified
+        
+        async with session.get(feed_url, headers=conditional_headers) as response:
+            if response.status == 304 and cached is not None:
+                return cached
+            
+            response.raise_for_status()
+            body = await response.read()
+            headers = {
+                "content-type": response.headers.get("Content-Type", ""),
+                "content-location": str(response.url),
+            }
+            etag = response.headers.get("ETag")
+            modified = response.headers.get("Last-Modified")
+        
+        feed = feedparser.parse(body, response_headers=headers)
+        self._remember_feed(feed_url, etag, modified, feed)
+        return feed
+    
+    def _remember_feed(self, feed_url: str, etag: Optional[str], modified: Optional[str], feed: Any) -> None:
+        """Keep a parsed feed for conditional requests if the server gave a validator."""
+        if etag or modified:
+            self._feed_cache[feed_url] = (etag, modified, feed)
+        else:
+            self._feed_cache.pop(feed_url, None)
+    
+    def _scrape_as_dicts(self, topic: str, max_results: int = 10) -> List[Dict[str, Any]]:
         """Scrape news from RSS feeds for a given topic."""
         logger.info(f"Scraping RSS feeds for topic: {topic}")
         
         news_items = []
-        topic_keywords = topic.lower().split()
+        matches_topic = _topic_matcher(topic)
         
-        for feed_url in self.feeds:
+        for feed_url, feed in zip(self.feeds, self._fetch_feeds()):
             try:
                 logger.info(f"Parsing RSS feed: {feed_url}")
                 
-                feed = feedparser.parse(feed_url)
+                if isinstance(feed, Exception):
+                    raise feed
                 
                 for entry in feed.entries:
                     try:
@@ -461,7 +806,7 @@ class RSSFeedScraper(NewsScraper):
                         title = entry.get("title", "").lower()
                         description = entry.get("description", "").lower()
                         
-                        if not any(keyword in title or keyword in description for keyword in topic_keywords):
+                        if not (matches_topic(title) or matches_topic(description)):
                             continue
                         
                         # Extract URL
@@ -503,7 +848,7 @@ class RSSFeedScraper(NewsScraper):
                         # Create summary
                         summary = description if "description" in entry else ""
                         if not summary and content:
-                            sentences = re.split(r'(?<=[.!?])\s+', content)
+                            sentences = _SENT_RE.split(content)
                             summary = " ".join(sentences[:3])
                         
                         # Extract image URL
@@ -520,8 +865,8 @@ class RSSFeedScraper(NewsScraper):
                                     image_url = link.get("href", "")
                                     break
                         
-                        # Create NewsItem
-                        news_item = NewsItem(
+                        # Collect the NewsItem fields
+                        news_item = dict(
                             title=entry.get("title", ""),
                             url=url,
                             source=source,
@@ -791,26 +1136,59 @@ class NewsScraperManager:
         Returns:
             List of NewsItem objects
         """
+        return [NewsItem(**fields) for fields in self._scrape_unique(topic, max_results_per_scraper)]
+    
+    def scrape_news_dicts(self, topic: str, max_results_per_scraper: int = 5) -> List[Dict[str, Any]]:
+        """
+        Scrape news from all configured scrapers as dicts, without building NewsItem objects.
+        
+        Args:
+            topic: Topic to search for
+            max_results_per_scraper: Maximum results to get from each scraper
+            
+        Returns:
+            List of dicts in the NewsItem.to_dict() format
+        """
+        return [
+            {
+                "title": fields["title"],
+                "url": fields["url"],
+                "source": fields["source"],
+                "published_date": fields["published_date"].isoformat(),
+                "content": fields.get("content", ""),
+                "summary": fields.get("summary", ""),
+                "image_url": fields.get("image_url", ""),
+                "processed": False,
+                "question": "",
+                "generated_image_path": ""
+            }
+            for fields in self._scrape_unique(topic, max_results_per_scraper)
+        ]
+    
+    def _scrape_unique(self, topic: str, max_results_per_scraper: int) -> List[Dict[str, Any]]:
+        """Run every scraper, then deduplicate and sort the NewsItem fields they return."""
         all_news_items = []
         
         for scraper in self.scrapers:
             try:
-                news_items = scraper.scrape(topic, max_results_per_scraper)
+                news_items = scraper._scrape_as_dicts(topic, max_results_per_scraper)
                 all_news_items.extend(news_items)
             except Exception as e:
                 logger.error(f"Error with scraper {type(scraper).__name__}: {e}")
         
-        # Remove duplicates based on URL
-        unique_urls = set()
+        # Remove duplicates based on the canonical URL (ignoring scheme,
+        # trailing slashes and utm_* parameters), tracked as 64-bit fingerprints
+        seen_urls = set()
         unique_news_items = []
         
         for item in all_news_items:
-            if item.url not in unique_urls:
-                unique_urls.add(item.url)
+            fingerprint = _url_fingerprint(item["url"])
+            if fingerprint not in seen_urls:
+                seen_urls.add(fingerprint)
                 unique_news_items.append(item)
         
         # Sort by published date (newest first)
-        unique_news_items.sort(key=lambda x: x.published_date, reverse=True)
+        unique_news_items.sort(key=operator.itemgetter("published_date"), reverse=True)
         
         return unique_news_items
     
@@ -824,8 +1202,12 @@ class NewsScraperManager:
         """
         data = [item.to_dict() for item in news_items]
         
-        with open(output_file, 'w') as f:
-            json.dump(data, f, indent=2)
+        if orjson is not None:
+            with open(output_file, 'wb') as f:
+                f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+        else:
+            with open(output_file, 'w') as f:
+                json.dump(data, f, indent=2)
         
         logger.info(f"Saved {len(news_items)} news items to {output_file}")
     
@@ -843,8 +1225,9 @@ class NewsScraperManager:
             logger.warning(f"Input file {input_file} does not exist")
             return []
         
-        with open(input_file, 'r') as f:
-            data = json.load(f)
+        with open(input_file, 'rb') as f:
+            raw = f.read()
+        data = orjson.loads(raw) if orjson is not None else json.loads(raw)
         
         news_items = [NewsItem.from_dict(item) for item in data]
         logger.info(f"Loaded {len(news_items)} news items from {input_file}")
@@ -0,0 +1,2 @@
+def pytest_configure(config):
+    config.addinivalue_line("markers", "nlp: tests that run the spaCy/NLTK processors")
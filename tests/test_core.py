@@ -1,29 +1,258 @@
-import unittest
+import pytest
 from scraper import NewsItem, GoogleNewsScraper
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
+import os
+import re
 import sys
-# Mock spacy before importing processor
-mock_spacy = MagicMock()
-sys.modules["spacy"] = mock_spacy
+import types
+
+import requests
+import urllib3
+
+processor = pytest.importorskip("processor")
+import poster
+import scraper
 from processor import TextSummarizer, QuestionGenerator
+from poster import SocialMediaManager, TwitterPoster, RedditPoster
+from image_generator import SimpleImageGenerator
+
+# Set NEWSBOT_REAL_SPACY=1 to run the NLP tests against the installed spaCy
+USE_REAL_SPACY = bool(os.environ.get("NEWSBOT_REAL_SPACY"))
+
+# Otherwise processor gets a stub; it imports spacy on first use, so the stub
+# only has to be in place while the NLP tests run. It splits sentences at end
+# punctuation, tags a word list as stopwords and recognizes the entities in
+# _STUB_ENTITIES, which is enough for the processors' real code paths
+_STUB_STOPWORDS = frozenset({"a", "an", "another", "is", "one", "the", "third", "this"})
+_STUB_ENTITIES = {"Apple Inc.": "ORG"}
+
+class _StubToken:
+    def __init__(self, text):
+        self.text = text
+        self.lower_ = text.lower()
+        self.is_alpha = text.isalpha()
+        self.is_stop = self.lower_ in _STUB_STOPWORDS
+        self.pos_ = "NOUN" if self.is_alpha and not self.is_stop else ""
+
+class _StubSpan:
+    def __init__(self, text, label=""):
+        self.text = text
+        self.label_ = label
+        self._tokens = [_StubToken(token) for token in re.findall(r"\w+|[^\w\s]", text)]
+
+    def __iter__(self):
+        return iter(self._tokens)
+
+class _StubDoc:
+    noun_chunks = ()
+
+    def __init__(self, text):
+        self.text = text
+        self.sents = [_StubSpan(sentence) for sentence in re.split(r"(?<=[.!?])\s+", text.strip())]
+        self.ents = [_StubSpan(name, label) for name, label in _STUB_ENTITIES.items() if name in text]
+
+    def __iter__(self):
+        return (token for sentence in self.sents for token in sentence)
+
+class _StubLanguage:
+    def __call__(self, text):
+        return _StubDoc(text)
+
+    def pipe(self, texts, **kwargs):
+        return (self(text) for text in texts)
+
+    def add_pipe(self, name, **kwargs):
+        pass
+
+spacy_stub = types.ModuleType("spacy")
+spacy_stub.load = lambda *args, **kwargs: _StubLanguage()
+spacy_stub.blank = spacy_stub.load
+
+@pytest.fixture(scope="module")
+def stub_spacy():
+    if USE_REAL_SPACY:
+        yield pytest.importorskip("spacy", reason="NLP backend required")
+        return
+    with patch.dict(sys.modules, {"spacy": spacy_stub}), patch.object(processor, "spacy", None):
+        processor._get_nlp.cache_clear()
+        yield spacy_stub
+    processor._get_nlp.cache_clear()
+
+# Module scope rather than session scope: the processors are built on the
+# spaCy stub, which only lives as long as this module's tests
+@pytest.fixture(scope="module")
+def summarizer(stub_spacy):
+    return TextSummarizer({"max_sentences": 1})
+
+@pytest.fixture(scope="module")
+def qgen(stub_spacy):
+    return QuestionGenerator({})
+
+SUMMARY_TEXT = "This is a sentence. This is another sentence. This is a third one."
+SUMMARY_SENTENCES = ("This is a sentence.", "This is another sentence.", "This is a third one.")
+
+# Parsed once per module; summarizer tests pass the Doc to process() so the
+# corpus is not re-tokenized by every test
+@pytest.fixture(scope="module")
+def parsed_corpus(summarizer):
+    return summarizer.nlp(SUMMARY_TEXT) if summarizer.nlp is not None else None
+
+@pytest.fixture(autouse=True)
+def clear_module_caches():
+    yield
+    # Clear module-level lru_caches so no test sees values cached by another
+    for module in (processor, poster, scraper):
+        for obj in vars(module).values():
+            if hasattr(obj, "cache_clear"):
+                obj.cache_clear()
+
+@pytest.mark.nlp
+class TestNLP:
+    def test_summarizer(self, summarizer, parsed_corpus):
+        summary = summarizer.process(SUMMARY_TEXT, doc=parsed_corpus)
+        # max_sentences=1: exactly one sentence, taken from the input
+        assert summary in SUMMARY_SENTENCES
+
+    def test_question_generator(self, qgen):
+        # Apple is the only entity, so the question must be about it
+        text = "Apple Inc. is a technology company."
+        question = qgen.process(text)
+        assert "Apple" in question
+        assert question.endswith("?")
+
+def test_post_formats_url_once():
+    manager = SocialMediaManager()
+    poster = TwitterPoster({})
+    poster.api = MagicMock()
+    poster._mark_authenticated()
+    manager.posters["twitter"] = poster
+    item = NewsItem("Title", "http://example.com/story", "Source")
+    item.summary = "Summary"
+    item.question = "What do you think?"
+    result = manager.post_to_platform("twitter", item)
+    assert result["success"]
+    body = poster.api.update_status.call_args[0][0]
+    assert body.count("http://example.com/story") == 1
+    assert "What do you think?" in body
+
+class _FlakyPoster:
+    """Poster whose post() raises the given errors, in order, before succeeding."""
+    platform_name = "Test"
+    rate_limiter = None
+
+    def __init__(self, *errors):
+        self.errors = list(errors)
+        self.calls = 0
+
+    @poster.retry_with_backoff(max_attempts=3)
+    def post(self):
+        self.calls += 1
+        if self.errors:
+            raise self.errors.pop(0)
+        return {"success": True}
+
+@pytest.fixture
+def sleeps(monkeypatch):
+    delays = []
+    monkeypatch.setattr(poster.time, "sleep", delays.append)
+    return delays
+
+def test_retry_waits_for_retry_after(sleeps):
+    flaky = _FlakyPoster(poster.RateLimited("HTTP 429", retry_after=7))
+    assert flaky.post()["success"]
+    assert flaky.calls == 2
+    assert sleeps == [7]
+
+def test_retry_gives_up_after_max_attempts(sleeps):
+    flaky = _FlakyPoster(*(poster.RateLimited("HTTP 503", retry_after=1, status_code=503) for _ in range(5)))
+    result = flaky.post()
+    assert not result["success"]
+    assert flaky.calls == 3
+    assert len(sleeps) == 2
+
+@pytest.mark.parametrize("error", [
+    requests.ConnectTimeout("connect timed out"),
+    requests.ConnectionError(urllib3.exceptions.MaxRetryError(
+        None, "/", reason=urllib3.exceptions.NewConnectionError(None, "connection refused"))),
+])
+def test_retry_on_errors_before_sending(sleeps, error):
+    flaky = _FlakyPoster(error)
+    assert flaky.post()["success"]
+    assert flaky.calls == 2
+
+@pytest.mark.parametrize("error", [
+    requests.ReadTimeout("read timed out"),
+    requests.ConnectionError("Connection aborted."),
+])
+def test_no_retry_once_request_may_have_been_sent(sleeps, error):
+    # The server may already have made the post; retrying could duplicate it
+    flaky = _FlakyPoster(error)
+    with pytest.raises(type(error)):
+        flaky.post()
+    assert flaky.calls == 1
+    assert sleeps == []
+
+@pytest.mark.parametrize("status_code, headers, retried", [
+    (429, {}, True),
+    (503, {"Retry-After": "5"}, True),
+    (503, {}, False),
+    (500, {"Retry-After": "5"}, False),
+    (502, {}, False),
+    (504, {}, False),
+])
+def test_only_rejected_creates_are_retried(status_code, headers, retried):
+    # A gateway 5xx can arrive after the post was made, so only a 429 or a
+    # 503 that says when to come back means the server refused the request
+    if retried:
+        with pytest.raises(poster.RateLimited):
+            poster._raise_for_throttle(status_code, headers)
+    else:
+        poster._raise_for_throttle(status_code, headers)
+    response = MagicMock(status_code=status_code, headers=headers, reason="Error")
+    response.json.return_value = {}
+    error_type = poster.tweepy.errors.TwitterServerError if status_code >= 500 else poster.tweepy.errors.TooManyRequests
+    assert poster._is_transient(error_type(response)) == retried
+
+@pytest.mark.parametrize("replies_throttled, commented", [(1, True), (6, False)])
+def test_throttled_reddit_reply_never_resubmits(sleeps, replies_throttled, commented):
+    reddit = RedditPoster({"subreddit": "news"})
+    reddit.reddit = MagicMock()
+    reddit._mark_authenticated()
+    reddit.rate_limiter = None
+    submission = reddit.reddit.subreddit.return_value.submit.return_value
+    throttled = MagicMock(status_code=429, headers={"retry-after": "2"}, text="")
+    submission.reply.side_effect = [poster.prawcore.exceptions.TooManyRequests(throttled)] * replies_throttled + [None]
+    result = reddit.post("Title", "Summary", url="http://example.com/story")
+    # The link was submitted once and only the comment was retried
+    assert result["success"]
+    assert reddit.reddit.subreddit.return_value.submit.call_count == 1
+    assert submission.reply.call_count == (2 if commented else 6)
+    assert ("message" not in result) == commented
+
+def test_token_bucket_paces_and_backs_off():
+    bucket = poster.TokenBucket(capacity=2, refill_per_sec=1)
+    assert bucket.try_acquire() == 0
+    assert bucket.try_acquire() == 0
+    assert bucket.try_acquire() > 0
+    bucket.record_throttle()
+    assert bucket.rate == 0.5
+    bucket.record_success()
+    assert bucket.rate == pytest.approx(0.6)
+
+def test_scraped_image_urls_cannot_read_other_local_files(tmp_path):
+    generator = SimpleImageGenerator({"output_dir": str(tmp_path / "images")})
+    own_image = tmp_path / "images" / "own.png"
+    own_image.write_bytes(b"own")
+    secret = tmp_path / "secret.png"
+    secret.write_bytes(b"secret")
+    assert generator._fetch_cached(own_image.as_uri()) == b"own"
+    assert generator._fetch_cached(str(own_image)) == b"own"
+    # Outside the bot's directories (including via ".."), local reads are refused
+    for url in (secret.as_uri(), str(secret), str(tmp_path / "images" / ".." / "secret.png")):
+        with pytest.raises(ValueError):
+            generator._fetch_cached(url)
 
-class TestNewsBotCore(unittest.TestCase):
-    def test_news_item_creation(self):
-        item = NewsItem("Title", "http://example.com", "Source")
-        self.assertEqual(item.title, "Title")
-        self.assertEqual(item.url, "http://example.com")
-
-    def test_summarizer(self):
-        summarizer = TextSummarizer({"max_sentences": 1})
-        text = "This is a sentence. This is another sentence. This is a third one."
-        summary = summarizer.process(text)
-        self.assertTrue(len(summary) > 0)
-
-    def test_question_generator(self):
-        gen = QuestionGenerator({})
-        text = "Apple Inc. is a technology company based in Cupertino."
-        question = gen.process(text)
-        self.assertTrue("Apple" in question or "?" in question)
-
-if __name__ == "__main__":
-    unittest.main()
+def test_hashtags_keep_non_ascii_words_and_skip_links():
+    instagram = poster.InstagramPoster({})
+    hashtags = instagram._generate_hashtags("Zürich müller señorita", "More at https://example.com/story")
+    assert hashtags == "#zürich #müller #señorita"
@@ -0,0 +1,6 @@
+from scraper import NewsItem
+
+def test_news_item_creation():
+    item = NewsItem("Title", "http://example.com", "Source")
+    assert item.title == "Title"
+    assert item.url == "http://example.com"
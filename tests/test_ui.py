@@ -0,0 +1,95 @@
+import asyncio
+import os
+from unittest.mock import MagicMock
+
+import pytest
+
+httpx = pytest.importorskip("httpx")
+
+FORUM_CONFIG = {
+    "enabled": False,
+    "forum_url": "http://forum.example.com",
+    "forum_type": "discourse",
+    "username": "bot",
+    "password": "secret",
+    "api_key": "key",
+    "category_id": 7,
+    "api_endpoint": "/custom/posts",
+    "rate_limit": {"rate": 1, "capacity": 2},
+    "auth_ttl_seconds": 60
+}
+
+# ui creates its static and cache directories (and main its log file) in the
+# working directory on import, so import it from a scratch directory
+@pytest.fixture(scope="module")
+def ui(tmp_path_factory):
+    cwd = os.getcwd()
+    os.chdir(tmp_path_factory.mktemp("ui"))
+    try:
+        yield pytest.importorskip("ui")
+    finally:
+        os.chdir(cwd)
+
+@pytest.fixture
+def bot(ui, monkeypatch):
+    # Stand in for init_bot(): a bot whose config holds a configured forum
+    news_bot = MagicMock()
+    news_bot.config = {"poster": {"platforms": {"forum": dict(FORUM_CONFIG)}}}
+    news_bot.poster_manager.posters = {}
+    monkeypatch.setattr(ui, "news_bot", news_bot)
+    monkeypatch.setattr(ui, "platform_configs", news_bot.config["poster"]["platforms"])
+    ui.update_enabled_platforms()
+    return news_bot
+
+def request(ui, method, path, **kwargs):
+    async def send():
+        transport = httpx.ASGITransport(app=ui.app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            return await client.request(method, path, headers={"accept": "application/json"}, **kwargs)
+    return asyncio.run(send())
+
+def post_platforms(ui, body):
+    return request(ui, "POST", "/platforms", json=body)
+
+def post_platform_form(ui, platform, form):
+    return request(ui, "POST", f"/platform/{platform}", data=form)
+
+def test_enable_toggle_keeps_stored_platform_settings(ui, bot):
+    response = post_platforms(ui, {platform: {"enabled": platform == "forum"} for platform in ui.PLATFORMS})
+    assert response.status_code == 200
+    assert response.json()["enabled_platforms"] == ["forum"]
+    # Only the submitted flag changed; undeclared keys and their types survive
+    assert ui.platform_configs["forum"] == {**FORUM_CONFIG, "enabled": True}
+    # Platforms that were never configured and stay disabled are not created
+    assert set(ui.platform_configs) == {"forum"}
+    bot.add_platform.assert_called_once_with("forum", ui.platform_configs["forum"])
+
+@pytest.mark.parametrize("checked", [True, False])
+def test_platform_form_keeps_stored_platform_settings(ui, bot, checked):
+    form = {"platform": "forum", "forum_url": "http://new.example.com", "forum_type": "discourse",
+            "username": "bot", "password": "secret", "api_key": "key", "category_id": "7"}
+    if checked:
+        form["enabled"] = "on"
+    response = post_platform_form(ui, "forum", form)
+    assert response.status_code == 200
+    # The submitted fields changed; keys the form does not show survive
+    assert ui.platform_configs["forum"] == {
+        **FORUM_CONFIG, "forum_url": "http://new.example.com", "category_id": "7", "enabled": checked
+    }
+    assert response.json()["enabled_platforms"] == (["forum"] if checked else [])
+
+def test_streamed_run_starts_only_from_a_post(ui, bot):
+    bot.run_iter.return_value = iter([])
+    # A plain GET (an <img> tag, a prefetcher) cannot start a run
+    assert request(ui, "GET", "/run/stream?topic=news").status_code in (404, 405)
+    assert request(ui, "GET", "/run/stream/unknown").status_code == 404
+    bot.run_iter.assert_not_called()
+    
+    started = request(ui, "POST", "/run/stream", data={"topic": "news", "selected_platforms": ["forum"]})
+    assert started.status_code == 200
+    stream = request(ui, "GET", started.json()["stream_url"])
+    assert stream.status_code == 200
+    assert stream.text.endswith("event: done\ndata: {}\n\n")
+    bot.run_iter.assert_called_once_with("news")
+    # Each run id attaches once
+    assert request(ui, "GET", started.json()["stream_url"]).status_code == 404
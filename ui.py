@@ -8,19 +8,34 @@ This module provides a simple web interface for the News Bot:
 """
 
 import os
+import asyncio
+import re
 import json
 import logging
-from typing import Dict, Any, List
+import secrets
+from contextlib import asynccontextmanager
+from functools import lru_cache
+from typing import Dict, Any, List, Iterator, Optional, Tuple
 from datetime import datetime
 
-from fastapi import FastAPI, Request, Form, HTTPException
-from fastapi.responses import HTMLResponse, RedirectResponse
+from fastapi import FastAPI, Request, Form, HTTPException, Query
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import HTMLResponse, JSONResponse, ORJSONResponse, RedirectResponse, Response, StreamingResponse
 from fastapi.staticfiles import StaticFiles
 from fastapi.templating import Jinja2Templates
+from fastapi.concurrency import run_in_threadpool
+from jinja2 import DictLoader, FileSystemBytecodeCache
+from pydantic import BaseModel, ValidationError
 import uvicorn
 
 from main import NewsBot
 
+# orjson is optional; it speeds up writing the default configuration
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -29,22 +44,86 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 # Initialize FastAPI app
-app = FastAPI(title="News Bot UI")
+# JSON responses are encoded with orjson when it is installed
+DefaultJSONResponse = ORJSONResponse if orjson is not None else JSONResponse
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """
+    Initialize the bot in each server process before any request is handled,
+    and write out any config change still waiting for its delayed save on shutdown.
+    """
+    init_bot()
+    yield
+    if _save_task is not None:
+        await _save_task
 
-# Create templates directory
-os.makedirs("templates", exist_ok=True)
+app = FastAPI(title="News Bot UI", default_response_class=DefaultJSONResponse, lifespan=lifespan)
+
+# Path prefixes of routes that stream server-sent events
+EVENT_STREAM_PREFIXES = ("/run/stream/",)
+
+class StreamingAwareGZipMiddleware(GZipMiddleware):
+    """GZip middleware that leaves event streams alone.
+    
+    GZipMiddleware buffers a streamed body inside the compressor, which
+    would hold server-sent events back instead of delivering them as sent.
+    """
+    
+    async def __call__(self, scope, receive, send):
+        if scope["type"] == "http" and scope["path"].startswith(EVENT_STREAM_PREFIXES):
+            await self.app(scope, receive, send)
+            return
+        await super().__call__(scope, receive, send)
+
+# Compress responses for clients that accept gzip
+app.add_middleware(StreamingAwareGZipMiddleware, minimum_size=1000)
+
+# Create static files and template cache directories
 os.makedirs("static", exist_ok=True)
+os.makedirs(".jinja_cache", exist_ok=True)
 
-# Set up templates
-templates = Jinja2Templates(directory="templates")
+class CachedStaticFiles(StaticFiles):
+    """
+    Static files that browsers may cache for a year without revalidating.
+    
+    Files under static/ are treated as immutable: give a changed asset a
+    new name (e.g. a version or content hash) rather than editing it in place.
+    """
+    
+    def file_response(self, *args, **kwargs):
+        response = super().file_response(*args, **kwargs)
+        response.headers["Cache-Control"] = "public, max-age=31536000, immutable"
+        return response
 
 # Mount static files
-app.mount("/static", StaticFiles(directory="static"), name="static")
+app.mount("/static", CachedStaticFiles(directory="static"), name="static")
 
 # Global bot instance
 news_bot = None
+
+# news_bot.config["poster"]["platforms"], created by init_bot() if missing
+platform_configs: Dict[str, Dict[str, Any]] = {}
+
+# Platforms enabled in news_bot's config, and the status shown for each
+# platform; both kept up to date by update_enabled_platforms()
+enabled_platforms = frozenset()
+platform_status: Dict[str, str] = {}
 config_path = "config.json"
 
+# Config changes are written to disk by a single delayed task; see schedule_save()
+SAVE_DELAY = 0.1
+_config_dirty = False
+_save_task = None
+
+# Topics of streamed runs started by POST /run/stream, by run id, until
+# their event stream attaches
+MAX_PENDING_RUNS = 16
+pending_runs: Dict[str, str] = {}
+
+# Platforms the UI can configure, in display order
+PLATFORMS: Tuple[str, ...] = ("twitter", "reddit", "forum", "instagram")
+
 # Default configuration
 default_config = {
     "output_dir": "output",
@@ -73,11 +152,46 @@ default_config = {
     }
 }
 
-# Create HTML templates
-def create_templates():
-    """Create HTML templates for the UI."""
-    # Index page
-    index_html = """
+# Settings accepted for each platform, with the values used when one is not given
+class PlatformConfig(BaseModel):
+    """Settings shared by every platform."""
+    enabled: bool = False
+
+class TwitterConfig(PlatformConfig):
+    consumer_key: str = ""
+    consumer_secret: str = ""
+    access_token: str = ""
+    access_token_secret: str = ""
+
+class RedditConfig(PlatformConfig):
+    client_id: str = ""
+    client_secret: str = ""
+    username: str = ""
+    password: str = ""
+    subreddit: str = ""
+    user_agent: str = "NewsBot/1.0"
+
+class ForumConfig(PlatformConfig):
+    forum_url: str = ""
+    forum_type: str = "generic"
+    username: str = ""
+    password: str = ""
+    api_key: str = ""
+    category_id: str = "1"
+
+class InstagramConfig(PlatformConfig):
+    username: str = ""
+    password: str = ""
+
+PLATFORM_MODELS = {
+    "twitter": TwitterConfig,
+    "reddit": RedditConfig,
+    "forum": ForumConfig,
+    "instagram": InstagramConfig
+}
+
+# HTML templates for the UI
+INDEX_HTML_SRC = """
     <!DOCTYPE html>
     <html>
     <head>
@@ -163,7 +277,7 @@ def create_templates():
             <div class="tab-content" id="myTabContent">
                 <!-- Run Bot Tab -->
                 <div class="tab-pane fade show active" id="run" role="tabpanel" aria-labelledby="run-tab">
-                    <form action="/run" method="post">
+                    <form action="/run" method="post" id="run-form">
                         <div class="form-group">
                             <label for="topic" class="form-label">Topic:</label>
                             <input type="text" class="form-control" id="topic" name="topic" required placeholder="Enter news topic (e.g., climate change, technology, sports)">
@@ -184,51 +298,29 @@ def create_templates():
                         <button type="submit" class="btn btn-primary">Run News Bot</button>
                     </form>
                     
-                    {% if results %}
-                    <div class="results-container">
+                    <div class="results-container" id="results" {% if not results %}hidden{% endif %}>
                         <h3>Results</h3>
                         {% for result in results %}
-                        <div class="result-item">
-                            <h4>{{ result.news_item.title }}</h4>
-                            <p><strong>Summary:</strong> {{ result.news_item.summary }}</p>
-                            <p><strong>Question:</strong> {{ result.news_item.question }}</p>
-                            {% if result.news_item.generated_image_path %}
-                            <p><strong>Image:</strong> {{ result.news_item.generated_image_path }}</p>
-                            {% endif %}
-                            
-                            <h5>Posting Results:</h5>
-                            {% for posting in result.posting_results %}
-                            <div class="platform-result">
-                                <p>
-                                    <strong>{{ posting.platform|capitalize }}:</strong>
-                                    <span class="{% if posting.success %}success{% else %}error{% endif %}">
-                                        {% if posting.success %}Success{% else %}Failed{% endif %}
-                                    </span>
-                                </p>
-                                {% if posting.url %}
-                                <p><strong>URL:</strong> <a href="{{ posting.url }}" target="_blank">{{ posting.url }}</a></p>
-                                {% endif %}
-                                {% if posting.message and not posting.success %}
-                                <p><strong>Error:</strong> {{ posting.message }}</p>
-                                {% endif %}
-                            </div>
-                            {% endfor %}
-                        </div>
+                        {% include "result.html" %}
                         {% endfor %}
                     </div>
-                    {% endif %}
                 </div>
                 
                 <!-- Configure Platforms Tab -->
                 <div class="tab-pane fade" id="platforms" role="tabpanel" aria-labelledby="platforms-tab">
                     <h3>Social Media Platforms</h3>
                     
+                    <form id="platforms-form">
                     <div class="platform-card">
                         <div class="platform-header">
                             <h4>X (Twitter)</h4>
                             <a href="/platform/twitter" class="btn btn-sm btn-primary">Configure</a>
                         </div>
-                        <p>Status: {% if "twitter" in enabled_platforms %}Configured{% else %}Not Configured{% endif %}</p>
+                        <p>Status: {{ platform_status.twitter }}</p>
+                        <div class="form-check">
+                            <input class="form-check-input" type="checkbox" name="twitter" id="enable-twitter" {% if "twitter" in enabled_platforms %}checked{% endif %}>
+                            <label class="form-check-label" for="enable-twitter">Enabled</label>
+                        </div>
                     </div>
                     
                     <div class="platform-card">
@@ -236,7 +328,11 @@ def create_templates():
                             <h4>Reddit</h4>
                             <a href="/platform/reddit" class="btn btn-sm btn-primary">Configure</a>
                         </div>
-                        <p>Status: {% if "reddit" in enabled_platforms %}Configured{% else %}Not Configured{% endif %}</p>
+                        <p>Status: {{ platform_status.reddit }}</p>
+                        <div class="form-check">
+                            <input class="form-check-input" type="checkbox" name="reddit" id="enable-reddit" {% if "reddit" in enabled_platforms %}checked{% endif %}>
+                            <label class="form-check-label" for="enable-reddit">Enabled</label>
+                        </div>
                     </div>
                     
                     <div class="platform-card">
@@ -244,7 +340,11 @@ def create_templates():
                             <h4>Self-hosted Forum</h4>
                             <a href="/platform/forum" class="btn btn-sm btn-primary">Configure</a>
                         </div>
-                        <p>Status: {% if "forum" in enabled_platforms %}Configured{% else %}Not Configured{% endif %}</p>
+                        <p>Status: {{ platform_status.forum }}</p>
+                        <div class="form-check">
+                            <input class="form-check-input" type="checkbox" name="forum" id="enable-forum" {% if "forum" in enabled_platforms %}checked{% endif %}>
+                            <label class="form-check-label" for="enable-forum">Enabled</label>
+                        </div>
                     </div>
                     
                     <div class="platform-card">
@@ -252,14 +352,21 @@ def create_templates():
                             <h4>Instagram</h4>
                             <a href="/platform/instagram" class="btn btn-sm btn-primary">Configure</a>
                         </div>
-                        <p>Status: {% if "instagram" in enabled_platforms %}Configured{% else %}Not Configured{% endif %}</p>
+                        <p>Status: {{ platform_status.instagram }}</p>
+                        <div class="form-check">
+                            <input class="form-check-input" type="checkbox" name="instagram" id="enable-instagram" {% if "instagram" in enabled_platforms %}checked{% endif %}>
+                            <label class="form-check-label" for="enable-instagram">Enabled</label>
+                        </div>
                     </div>
+                    
+                    <button type="submit" class="btn btn-primary">Save Platforms</button>
+                    </form>
                 </div>
                 
                 <!-- Scheduling Tab -->
                 <div class="tab-pane fade" id="scheduling" role="tabpanel" aria-labelledby="scheduling-tab">
                     <h3>Automated Scheduling</h3>
-                    <form action="/schedule" method="post">
+                    <form action="/schedule" method="post" data-json>
                         <div class="form-group">
                             <label for="schedule_topic" class="form-label">Topic for Scheduled Runs:</label>
                             <input type="text" class="form-control" id="schedule_topic" name="schedule_topic" value="{{ config.get('scheduling', {}).get('topic', '') }}" placeholder="e.g. Artificial Intelligence">
@@ -281,7 +388,7 @@ def create_templates():
                 <div class="tab-pane fade" id="settings" role="tabpanel" aria-labelledby="settings-tab">
                     <h3>Bot Settings</h3>
                     
-                    <form action="/settings" method="post">
+                    <form action="/settings" method="post" data-json>
                         <div class="form-group">
                             <label for="max_results" class="form-label">Max Results Per Source:</label>
                             <input type="number" class="form-control" id="max_results" name="max_results" value="{{ config.scraper.max_results_per_source }}" min="1" max="10">
@@ -315,12 +422,114 @@ def create_templates():
         </div>
         
         <script src="https://cdn.jsdelivr.net/npm/bootstrap@5.2.3/dist/js/bootstrap.bundle.min.js"></script>
+        <script>
+            // Save forms in the background instead of reloading the page
+            document.querySelectorAll("form[data-json]").forEach(function (form) {
+                form.addEventListener("submit", function (event) {
+                    event.preventDefault();
+                    var button = form.querySelector("button[type=submit]");
+                    fetch(form.action, {
+                        method: "POST",
+                        headers: {"Accept": "application/json"},
+                        body: new FormData(form)
+                    }).then(function (response) {
+                        button.textContent = response.ok ? "Saved" : "Save failed";
+                    });
+                });
+            });
+            
+            // Stream run results into the page as each news item is posted
+            document.getElementById("run-form").addEventListener("submit", function (event) {
+                if (!window.EventSource) {
+                    return;
+                }
+                event.preventDefault();
+                var form = this;
+                var button = form.querySelector("button[type=submit]");
+                var results = document.getElementById("results");
+                results.querySelectorAll(".result-item").forEach(function (item) {
+                    item.remove();
+                });
+                results.hidden = false;
+                button.disabled = true;
+                // Start the run with a POST, then attach to its event stream
+                fetch("/run/stream", {
+                    method: "POST",
+                    headers: {"Accept": "application/json"},
+                    body: new FormData(form)
+                }).then(function (response) {
+                    if (!response.ok) {
+                        throw new Error("HTTP " + response.status);
+                    }
+                    return response.json();
+                }).then(function (run) {
+                    var source = new EventSource(run.stream_url);
+                    source.onmessage = function (message) {
+                        results.insertAdjacentHTML("beforeend", JSON.parse(message.data).html);
+                    };
+                    source.addEventListener("done", function () {
+                        source.close();
+                        button.disabled = false;
+                    });
+                    source.onerror = function () {
+                        source.close();
+                        button.disabled = false;
+                    };
+                }).catch(function () {
+                    button.disabled = false;
+                });
+            });
+            
+            // Save every platform's enabled flag in a single request
+            document.getElementById("platforms-form").addEventListener("submit", function (event) {
+                event.preventDefault();
+                var payload = {};
+                this.querySelectorAll("input[type=checkbox]").forEach(function (input) {
+                    payload[input.name] = {enabled: input.checked};
+                });
+                fetch("/platforms", {
+                    method: "POST",
+                    headers: {"Content-Type": "application/json"},
+                    body: JSON.stringify(payload)
+                }).then(function () {
+                    window.location.reload();
+                });
+            });
+        </script>
     </body>
     </html>
     """
-    
-    # Platform configuration page
-    platform_html = """
+
+RESULT_HTML_SRC = """
+    <div class="result-item">
+        <h4>{{ result.news_item.title }}</h4>
+        <p><strong>Summary:</strong> {{ result.news_item.summary }}</p>
+        <p><strong>Question:</strong> {{ result.news_item.question }}</p>
+        {% if result.news_item.generated_image_path %}
+        <p><strong>Image:</strong> {{ result.news_item.generated_image_path }}</p>
+        {% endif %}
+        
+        <h5>Posting Results:</h5>
+        {% for posting in result.posting_results %}
+        <div class="platform-result">
+            <p>
+                <strong>{{ posting.platform|capitalize }}:</strong>
+                <span class="{% if posting.success %}success{% else %}error{% endif %}">
+                    {% if posting.success %}Success{% else %}Failed{% endif %}
+                </span>
+            </p>
+            {% if posting.url %}
+            <p><strong>URL:</strong> <a href="{{ posting.url }}" target="_blank">{{ posting.url }}</a></p>
+            {% endif %}
+            {% if posting.message and not posting.success %}
+            <p><strong>Error:</strong> {{ posting.message }}</p>
+            {% endif %}
+        </div>
+        {% endfor %}
+    </div>
+    """
+
+PLATFORM_HTML_SRC = """
     <!DOCTYPE html>
     <html>
     <head>
@@ -352,7 +561,7 @@ def create_templates():
         <div class="container">
             <h1>Configure {{ platform|capitalize }}</h1>
             
-            <form action="/platform/{{ platform }}" method="post">
+            <form action="/platform/{{ platform }}" method="post" data-json>
                 <input type="hidden" name="platform" value="{{ platform }}">
                 
                 <div class="form-check mb-4">
@@ -446,201 +655,346 @@ def create_templates():
                 </div>
             </form>
         </div>
+        
+        <script>
+            // Save forms in the background instead of reloading the page
+            document.querySelectorAll("form[data-json]").forEach(function (form) {
+                form.addEventListener("submit", function (event) {
+                    event.preventDefault();
+                    var button = form.querySelector("button[type=submit]");
+                    fetch(form.action, {
+                        method: "POST",
+                        headers: {"Accept": "application/json"},
+                        body: new FormData(form)
+                    }).then(function (response) {
+                        button.textContent = response.ok ? "Saved" : "Save failed";
+                    });
+                });
+            });
+        </script>
     </body>
     </html>
     """
-    
-    # Write templates to files
-    with open("templates/index.html", "w") as f:
-        f.write(index_html)
-    
-    with open("templates/platform.html", "w") as f:
-        f.write(platform_html)
-    
-    logger.info("Created HTML templates")
+
+_INDENT_RE = re.compile(r"\n\s+")
+
+def minify_html(source: str) -> str:
+    """Drop the indentation and blank lines the template sources are written with."""
+    return _INDENT_RE.sub("\n", source.strip())
+
+# Set up templates from the sources above: no template files, and each is
+# minified and compiled once by init_bot() and never reloaded
+templates = Jinja2Templates(
+    directory="templates",
+    loader=DictLoader({
+        "index.html": minify_html(INDEX_HTML_SRC),
+        "result.html": minify_html(RESULT_HTML_SRC),
+        "platform.html": minify_html(PLATFORM_HTML_SRC)
+    }),
+    auto_reload=False,
+    cache_size=-1,
+    # Keep compiled template bytecode on disk so restarts skip parsing
+    bytecode_cache=FileSystemBytecodeCache(directory=".jinja_cache")
+)
+
+# Compiled templates by name, filled in by init_bot()
+compiled_templates: Dict[str, Any] = {}
 
 # Initialize the bot
 def init_bot():
     """Initialize the News Bot."""
-    global news_bot
+    global news_bot, platform_configs
     
-    # Create templates if they don't exist
-    if not os.path.exists("templates/index.html"):
-        create_templates()
+    # Compile the templates once; handlers render them directly
+    for name in ("index.html", "result.html", "platform.html"):
+        compiled_templates[name] = templates.env.get_template(name)
     
     # Create default config if it doesn't exist
     if not os.path.exists(config_path):
-        with open(config_path, "w") as f:
-            json.dump(default_config, f, indent=2)
+        if orjson is not None:
+            with open(config_path, "wb") as f:
+                f.write(orjson.dumps(default_config, option=orjson.OPT_INDENT_2))
+        else:
+            with open(config_path, "w") as f:
+                json.dump(default_config, f, indent=2)
     
     # Initialize the bot
     news_bot = NewsBot(config_path)
+    platform_configs = news_bot.config.setdefault("poster", {}).setdefault("platforms", {})
+    update_enabled_platforms()
+    render_index_page.cache_clear()
     
     logger.info("Initialized News Bot")
 
+def update_enabled_platforms():
+    """Recompute the set of enabled platforms after the bot's config changes."""
+    global enabled_platforms, platform_status
+    enabled_platforms = frozenset(
+        platform
+        for platform, config in platform_configs.items()
+        if config.get("enabled", False)
+    )
+    platform_status = {
+        platform: "Configured" if platform in enabled_platforms else "Not Configured"
+        for platform in PLATFORMS
+    }
+
+def select_platforms(selected_platforms: List[str]):
+    """Enable the configured platforms in selected_platforms and disable the rest."""
+    for platform in PLATFORMS:
+        if platform in platform_configs:
+            platform_configs[platform]["enabled"] = platform in selected_platforms
+    update_enabled_platforms()
+
+def parse_platform_config(platform: str, values: Dict[str, Any]) -> Dict[str, Any]:
+    """Build a platform's config from submitted values, filling in defaults."""
+    try:
+        return PLATFORM_MODELS[platform](**values).dict()
+    except ValidationError as e:
+        raise HTTPException(status_code=422, detail=f"Invalid {platform} settings: {e}")
+
+def merge_platform_settings(platform: str, settings: Dict[str, Any],
+                            create: bool = False) -> Optional[Dict[str, Any]]:
+    """
+    Apply submitted settings on top of a platform's stored config.
+    
+    Only the submitted keys change; everything else in the stored config,
+    including keys the platform model does not declare, is kept as it is.
+    Returns None for a platform that has no config and is not being enabled,
+    unless create is set.
+    """
+    try:
+        submitted = PLATFORM_MODELS[platform](**settings).dict(exclude_unset=True)
+    except ValidationError as e:
+        raise HTTPException(status_code=422, detail=f"Invalid {platform} settings: {e}")
+    
+    current = platform_configs.get(platform)
+    if current is None:
+        if not (create or submitted.get("enabled", False)):
+            return None
+        current = parse_platform_config(platform, {})
+    return {**current, **submitted}
+
+def poster_settings(config: Dict[str, Any]) -> Dict[str, Any]:
+    """Return the part of a platform config its poster is built from."""
+    return {key: value for key, value in config.items() if key != "enabled"}
+
+def store_platform_config(platform: str, config: Dict[str, Any]):
+    """Store a platform's configuration and register it with the bot if enabled."""
+    previous = platform_configs.get(platform, {})
+    platform_configs[platform] = config
+    
+    # Add platform to bot, unless its poster is already built from the same
+    # settings (building one can mean a new API session and login)
+    if config["enabled"] and not (
+        platform in news_bot.poster_manager.posters and poster_settings(previous) == poster_settings(config)
+    ):
+        news_bot.add_platform(platform, config)
+
+def schedule_save():
+    """Mark the config as changed and write it out after SAVE_DELAY seconds.
+    
+    Changes made while a write is pending are picked up by that write, so a
+    burst of form posts costs a single save.
+    """
+    global _config_dirty, _save_task
+    _config_dirty = True
+    # The cached index page shows the config, so drop it on every change
+    render_index_page.cache_clear()
+    if _save_task is None or _save_task.done():
+        _save_task = asyncio.ensure_future(_save_config_later())
+
+async def _save_config_later():
+    global _config_dirty
+    await asyncio.sleep(SAVE_DELAY)
+    while _config_dirty:
+        _config_dirty = False
+        await run_in_threadpool(news_bot.save_config, config_path)
+
+def current_settings() -> Dict[str, Any]:
+    """Return the values shown in the settings form."""
+    config = news_bot.config
+    return {
+        "max_results": config.get("scraper", {}).get("max_results_per_source", 3),
+        "max_sentences": config.get("processor", {}).get("summarizer", {}).get("max_sentences", 3),
+        "summarization_method": config.get("processor", {}).get("summarizer", {}).get("method", "extractive"),
+        "image_generator_type": config.get("image_generator", {}).get("generator_type", "simple")
+    }
+
+def saved_response(request: Request, **data) -> Response:
+    """
+    Answer a form post that changed the config.
+    
+    Scripts that ask for JSON get {"ok": true, ...data}; plain form posts
+    are redirected to the index page as before.
+    """
+    if "application/json" in request.headers.get("accept", ""):
+        return DefaultJSONResponse({"ok": True, **data})
+    return RedirectResponse(url="/", status_code=303)
+
+def render_template(name: str, context: Dict[str, Any]) -> HTMLResponse:
+    """Render a precompiled template into an HTML response."""
+    return HTMLResponse(compiled_templates[name].render(context))
+
+@lru_cache(maxsize=16)
+def render_index_page(enabled: frozenset) -> str:
+    """Render the index page without run results.
+    
+    Besides the enabled platforms, the page depends on the current config;
+    schedule_save() clears the cache whenever that changes.
+    """
+    return compiled_templates["index.html"].render({
+        "platforms": PLATFORMS,
+        "enabled_platforms": enabled,
+        "platform_status": platform_status,
+        "config": news_bot.config,
+        "results": []
+    })
+
 # Routes
 @app.get("/", response_class=HTMLResponse)
 async def index(request: Request):
     """Render the index page."""
-    if news_bot is None:
-        init_bot()
-    
-    # Get enabled platforms
-    enabled_platforms = []
-    for platform, config in news_bot.config.get("poster", {}).get("platforms", {}).items():
-        if config.get("enabled", False):
-            enabled_platforms.append(platform)
-    
-    return templates.TemplateResponse(
-        "index.html", 
-        {
-            "request": request, 
-            "platforms": ["twitter", "reddit", "forum", "instagram"],
-            "enabled_platforms": enabled_platforms,
-            "config": news_bot.config,
-            "results": []
-        }
-    )
+    return HTMLResponse(render_index_page(enabled_platforms))
 
 @app.post("/run", response_class=HTMLResponse)
 async def run_bot(request: Request, topic: str = Form(...), selected_platforms: List[str] = Form([])):
     """Run the News Bot."""
-    if news_bot is None:
-        init_bot()
-    
     # Update enabled platforms
-    for platform in ["twitter", "reddit", "forum", "instagram"]:
-        if platform in news_bot.config.get("poster", {}).get("platforms", {}):
-            news_bot.config["poster"]["platforms"][platform]["enabled"] = platform in selected_platforms
+    select_platforms(selected_platforms)
     
     # Save config
-    news_bot.save_config(config_path)
+    schedule_save()
     
-    # Run the bot
-    results = news_bot.run(topic)
+    # Run the bot; the pipeline blocks, so run it in the threadpool to keep
+    # serving other requests meanwhile
+    results = await run_in_threadpool(news_bot.run, topic)
     
-    # Get enabled platforms
-    enabled_platforms = []
-    for platform, config in news_bot.config.get("poster", {}).get("platforms", {}).items():
-        if config.get("enabled", False):
-            enabled_platforms.append(platform)
-    
-    return templates.TemplateResponse(
+    return render_template(
         "index.html", 
         {
-            "request": request, 
-            "platforms": ["twitter", "reddit", "forum", "instagram"],
+            "platforms": PLATFORMS,
             "enabled_platforms": enabled_platforms,
+            "platform_status": platform_status,
             "config": news_bot.config,
             "results": results
         }
     )
 
+@app.post("/run/stream")
+async def start_run_stream(topic: str = Form(...), selected_platforms: List[str] = Form([])):
+    """Start a streamed run and return the id its event stream attaches to.
+    
+    Starting a run publishes posts, so it takes a POST; the EventSource GET
+    only attaches to a run started this way.
+    """
+    # Update enabled platforms, as /run does
+    select_platforms(selected_platforms)
+    schedule_save()
+    
+    run_id = secrets.token_urlsafe(16)
+    pending_runs[run_id] = topic
+    # Forget the oldest runs nobody attached to
+    while len(pending_runs) > MAX_PENDING_RUNS:
+        pending_runs.pop(next(iter(pending_runs)))
+    return {"run_id": run_id, "stream_url": f"/run/stream/{run_id}"}
+
+@app.get("/run/stream/{run_id}")
+async def run_bot_stream(run_id: str):
+    """Run a started run and stream each news item's result as a server-sent event."""
+    # Each run id starts a single run
+    topic = pending_runs.pop(run_id, None)
+    if topic is None:
+        raise HTTPException(status_code=404, detail="Run not found")
+    
+    # The generator blocks on the pipeline; StreamingResponse iterates it in
+    # the threadpool
+    return StreamingResponse(
+        run_events(topic),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache"}
+    )
+
+def run_events(topic: str) -> Iterator[str]:
+    """Yield one server-sent event per posted news item, then a done event."""
+    for result in news_bot.run_iter(topic):
+        event = {"html": compiled_templates["result.html"].render(result=result), "result": result}
+        data = orjson.dumps(event).decode() if orjson is not None else json.dumps(event)
+        yield f"data: {data}\n\n"
+    yield "event: done\ndata: {}\n\n"
+
 @app.get("/platform/{platform}", response_class=HTMLResponse)
 async def get_platform(request: Request, platform: str):
     """Render the platform configuration page."""
-    if news_bot is None:
-        init_bot()
-    
-    if platform not in ["twitter", "reddit", "forum", "instagram"]:
+    if platform not in PLATFORMS:
         raise HTTPException(status_code=404, detail="Platform not found")
     
     # Get platform config
-    config = news_bot.config.get("poster", {}).get("platforms", {}).get(platform, {})
+    config = platform_configs.get(platform, {})
     
-    return templates.TemplateResponse(
+    return render_template(
         "platform.html", 
         {
-            "request": request, 
             "platform": platform,
             "config": config
         }
     )
 
-@app.post("/platform/{platform}", response_class=RedirectResponse)
-async def save_platform(
-    request: Request, 
-    platform: str,
-    enabled: bool = Form(False),
-    # Twitter
-    consumer_key: str = Form(""),
-    consumer_secret: str = Form(""),
-    access_token: str = Form(""),
-    access_token_secret: str = Form(""),
-    # Reddit
-    client_id: str = Form(""),
-    client_secret: str = Form(""),
-    username: str = Form(""),
-    password: str = Form(""),
-    subreddit: str = Form(""),
-    # Forum
-    forum_url: str = Form(""),
-    forum_type: str = Form("generic"),
-    api_key: str = Form(""),
-    category_id: str = Form("1"),
-    # Instagram - username and password already covered
-):
+@app.post("/platform/{platform}")
+async def save_platform(request: Request, platform: str):
     """Save platform configuration."""
-    if news_bot is None:
-        init_bot()
-    
-    if platform not in ["twitter", "reddit", "forum", "instagram"]:
+    if platform not in PLATFORMS:
         raise HTTPException(status_code=404, detail="Platform not found")
     
-    # Create platform config
-    if platform == "twitter":
-        config = {
-            "enabled": enabled,
-            "consumer_key": consumer_key,
-            "consumer_secret": consumer_secret,
-            "access_token": access_token,
-            "access_token_secret": access_token_secret
-        }
-    elif platform == "reddit":
-        config = {
-            "enabled": enabled,
-            "client_id": client_id,
-            "client_secret": client_secret,
-            "username": username,
-            "password": password,
-            "subreddit": subreddit,
-            "user_agent": "NewsBot/1.0"
-        }
-    elif platform == "forum":
-        config = {
-            "enabled": enabled,
-            "forum_url": forum_url,
-            "forum_type": forum_type,
-            "username": username,
-            "password": password,
-            "api_key": api_key,
-            "category_id": category_id
-        }
-    elif platform == "instagram":
-        config = {
-            "enabled": enabled,
-            "username": username,
-            "password": password
-        }
+    # Apply only the fields this platform takes; the rest of the form is
+    # ignored and stored keys the form does not show are kept. An unchecked
+    # checkbox is left out of the form, so "enabled" is always set
+    form = await request.form()
+    settings = {**form, "enabled": form.get("enabled", False)}
+    config = merge_platform_settings(platform, settings, create=True)
     
-    # Update bot config
-    if "poster" not in news_bot.config:
-        news_bot.config["poster"] = {"platforms": {}}
-    if "platforms" not in news_bot.config["poster"]:
-        news_bot.config["poster"]["platforms"] = {}
+    store_platform_config(platform, config)
+    update_enabled_platforms()
     
-    news_bot.config["poster"]["platforms"][platform] = config
+    # Save config
+    schedule_save()
     
-    # Add platform to bot
-    if enabled:
-        news_bot.add_platform(platform, config)
+    return saved_response(request, platform=platform, enabled_platforms=sorted(enabled_platforms))
+
+@app.post("/platforms")
+async def save_platforms(request: Request):
+    """Save the configuration of several platforms at once.
     
-    # Save config
-    news_bot.save_config(config_path)
+    The body is a JSON object mapping platform names to their settings;
+    settings left out keep their current values.
+    """
+    try:
+        body = await request.json()
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid JSON body")
+    if not isinstance(body, dict) or not all(isinstance(settings, dict) for settings in body.values()):
+        raise HTTPException(status_code=400, detail="Expected an object of platform settings")
     
-    return RedirectResponse(url="/", status_code=303)
+    unknown = [platform for platform in body if platform not in PLATFORMS]
+    if unknown:
+        raise HTTPException(status_code=404, detail=f"Platform not found: {', '.join(unknown)}")
+    
+    # Validate the whole batch before storing any of it
+    configs = {}
+    for platform, settings in body.items():
+        config = merge_platform_settings(platform, settings)
+        if config is not None:
+            configs[platform] = config
+    for platform, config in configs.items():
+        store_platform_config(platform, config)
+    update_enabled_platforms()
+    
+    # One save for the whole batch
+    schedule_save()
+    
+    return saved_response(request, enabled_platforms=sorted(enabled_platforms))
 
-@app.post("/settings", response_class=RedirectResponse)
+@app.post("/settings")
 async def save_settings(
     request: Request,
     max_results: int = Form(3),
@@ -649,9 +1003,6 @@ async def save_settings(
     image_generator_type: str = Form("simple")
 ):
     """Save bot settings."""
-    if news_bot is None:
-        init_bot()
-    
     # Update config
     news_bot.config["scraper"]["max_results_per_source"] = max_results
     news_bot.config["processor"]["summarizer"]["max_sentences"] = max_sentences
@@ -659,11 +1010,11 @@ async def save_settings(
     news_bot.config["image_generator"]["generator_type"] = image_generator_type
     
     # Save config
-    news_bot.save_config(config_path)
+    schedule_save()
     
-    return RedirectResponse(url="/", status_code=303)
+    return saved_response(request, settings=current_settings())
 
-@app.post("/schedule", response_class=RedirectResponse)
+@app.post("/schedule")
 async def save_schedule(
     request: Request,
     schedule_topic: str = Form(""),
@@ -671,25 +1022,69 @@ async def save_schedule(
     schedule_enabled: bool = Form(False)
 ):
     """Save scheduling configuration."""
-    if news_bot is None:
-        init_bot()
-    
     news_bot.config["scheduling"] = {
         "topic": schedule_topic,
         "cron": cron_schedule,
         "enabled": schedule_enabled
     }
     
-    news_bot.save_config(config_path)
-    return RedirectResponse(url="/", status_code=303)
+    schedule_save()
+    return saved_response(request, scheduling=news_bot.config["scheduling"])
 
-def start():
-    """Start the UI server."""
-    # Initialize the bot
-    init_bot()
+# JSON API
+@app.get("/api/state")
+async def api_state():
+    """Return the state shown on the index page as JSON."""
+    return {
+        "platforms": PLATFORMS,
+        "enabled_platforms": sorted(enabled_platforms),
+        "settings": current_settings(),
+        "scheduling": news_bot.config.get("scheduling", {})
+    }
+
+@app.post("/api/run")
+async def api_run(request: Request):
+    """Run the News Bot from a JSON request and return the posting results.
+    
+    The body is an object with the topic and, optionally, the list of
+    platforms to post to (the current selection is kept if it is left out).
+    """
+    try:
+        body = await request.json()
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid JSON body")
+    if not isinstance(body, dict) or not isinstance(body.get("topic"), str) or not body["topic"]:
+        raise HTTPException(status_code=400, detail="Expected an object with a topic")
+    if not isinstance(body.get("platforms", []), list):
+        raise HTTPException(status_code=400, detail="Expected a list of platforms")
     
-    # Start the server
-    uvicorn.run(app, host="0.0.0.0", port=8000)
+    if "platforms" in body:
+        select_platforms(body["platforms"])
+        schedule_save()
+    
+    results = await run_in_threadpool(news_bot.run, body["topic"])
+    
+    return {
+        "enabled_platforms": sorted(enabled_platforms),
+        "results": results
+    }
+
+def start(host: str = "0.0.0.0", port: int = 8000, workers: int = 1):
+    """
+    Start the UI server.
+    
+    uvicorn uses uvloop and httptools when they are installed. The bot and
+    its config live in each worker process, so changes made through one
+    worker are only seen by the others after a restart; keep workers at 1
+    unless the UI is used read-only.
+    
+    Args:
+        host: Address to listen on
+        port: Port to listen on
+        workers: Number of server processes
+    """
+    # Passed by import path so that each worker imports the app itself
+    uvicorn.run("ui:app", host=host, port=port, workers=workers, loop="auto", http="auto")
 
 if __name__ == "__main__":
     start()